@@ -0,0 +1,68 @@
+# benchmarks/bench_cassette_replay.py
+"""
+Replay benchmark: generation latency and throughput over recorded API traffic
+Usage: python benchmarks/bench_cassette_replay.py --cassette calls.jsonl.gz --history history.db
+       [--requests 200] [--concurrency 4] [--latency-scale 1.0] [--cache]
+Requests are the parameter combinations of the history database the cassette was recorded
+alongside (BUSINESS_IDEA_CASSETTE_MODE=record), generated with default options.
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from business_idea_creator.idea_generator import BusinessIdeaGenerator  # noqa: E402
+from business_idea_creator.prompt_engine import BusinessIdeaRequest  # noqa: E402
+from business_idea_creator.utils.cassette import REPLAY, Cassette  # noqa: E402
+from business_idea_creator.utils.history_store import HistoryStore  # noqa: E402
+from business_idea_creator.utils.request_cache import SimilarityRequestCache  # noqa: E402
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cassette", required=True)
+    parser.add_argument("--history", required=True)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency-scale", type=float, default=0.0,
+                        help="1.0 replays the recorded latencies, 0 replays as fast as possible")
+    parser.add_argument("--cache", action="store_true", help="serve similar requests from a SimilarityRequestCache")
+    args = parser.parse_args()
+
+    cassette = Cassette(args.cassette, mode=REPLAY, latency_scale=args.latency_scale)
+    combinations = HistoryStore(args.history).request_frequencies(limit=args.requests)
+    if not combinations:
+        sys.exit(f"No (non-mock) requests in {args.history}")
+    generator = BusinessIdeaGenerator(
+        cassette=cassette, response_cache=SimilarityRequestCache() if args.cache else None
+    )
+
+    def generate(combination):
+        started = time.perf_counter()
+        results = generator.generate_ideas(
+            BusinessIdeaRequest(**combination["input_parameters"]),
+            technique=combination["technique"], model=combination["model"], allow_cached=args.cache
+        )
+        return time.perf_counter() - started, bool(results.get("cache_hit"))
+
+    workload = list(itertools.islice(itertools.cycle(combinations), args.requests))
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        outcomes = list(executor.map(generate, workload))
+    elapsed = time.perf_counter() - started
+
+    latencies = np.array([latency for latency, _ in outcomes]) * 1000
+    print(f"{len(outcomes)} requests ({len(combinations)} distinct), concurrency {args.concurrency}")
+    print(f"  throughput: {len(outcomes) / elapsed:8.1f} requests/s")
+    print(f"  latency:    p50 {np.percentile(latencies, 50):8.1f} ms   p95 {np.percentile(latencies, 95):8.1f} ms")
+    print(f"  cassette:   {cassette.stats['hits']} hits, {cassette.stats['misses']} misses"
+          f"  cache hits: {sum(hit for _, hit in outcomes)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# benchmarks/bench_models_memory.py
+"""
+Memory benchmark: result dicts vs compact GenerationResult models
+Usage: python benchmarks/bench_models_memory.py [--results 100000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from business_idea_creator.models import GenerationResult  # noqa: E402
+
+INDUSTRIES = ["Technology", "Healthcare", "Finance", "Retail", "Education", "Food & Beverage"]
+TRENDS = ["AI Integration", "Sustainability", "Remote Work", "E-commerce", "Digital Health"]
+
+def make_result(i: int) -> dict:
+    """A result shaped like the generator's output; JSON round trip gives fresh strings, as the job queue does"""
+    ideas = [
+        {
+            "name": f"Idea {i}-{j} Platform",
+            "problem": f"Customers in segment {i % 97} waste hours on manual process {j} every single week.",
+            "solution": f"A subscription platform automating process {j} with AI assistants and integrations ({i}).",
+            "target_market": "Working Professionals",
+            "revenue_model": f"SaaS subscription at ${19 + j * 10}/month plus usage-based add-ons",
+            "competitive_edge": f"Proprietary workflow data from {i % 1000} pilot customers",
+            "implementation": "MVP in 3 months, pilot with 20 customers, then self-serve launch",
+            "success_metrics": "MRR growth, churn under 3%, NPS above 50"
+        }
+        for j in range(3)
+    ]
+    raw_response = "\n\n".join(
+        f"## Business Idea {idea['name']}\n" + "\n".join(f"**{key.title()}:** {value}" for key, value in idea.items())
+        for idea in ideas
+    )
+    result = {
+        "request_id": f"req_{1700000000 + i}_{i:08x}",
+        "timestamp": f"2024-01-01T12:{i % 60:02d}:00",
+        "input_parameters": {
+            "industry": INDUSTRIES[i % len(INDUSTRIES)],
+            "target_audience": "Working Professionals",
+            "market_trends": TRENDS[:1 + i % 3],
+            "budget_range": "$10K - $50K",
+            "geographical_focus": "North America",
+            "innovation_level": "disruptive",
+            "technique_used": "chain_of_thought"
+        },
+        "generated_ideas": ideas,
+        "raw_response": raw_response,
+        "model_used": "gpt-3.5-turbo",
+        "technique_used": "chain_of_thought"
+    }
+    return json.loads(json.dumps(result))
+
+def measure(build, count: int):
+    """Bytes retained by count built results, and the build time"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    retained = [build(make_result(i)) for i in range(count)]
+    elapsed = time.perf_counter() - started
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del retained
+    return size, elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--results", type=int, default=100_000)
+    args = parser.parse_args()
+
+    dict_bytes, dict_seconds = measure(lambda result: result, args.results)
+    model_bytes, model_seconds = measure(GenerationResult.from_dict, args.results)
+
+    print(f"{args.results} results")
+    print(f"  dicts:  {dict_bytes / 2**20:8.1f} MiB  {dict_bytes / args.results:8.0f} B/result  ({dict_seconds:.1f}s)")
+    print(f"  models: {model_bytes / 2**20:8.1f} MiB  {model_bytes / args.results:8.0f} B/result  ({model_seconds:.1f}s)")
+    print(f"  saving: {1 - model_bytes / dict_bytes:.0%} ({(dict_bytes - model_bytes) / args.results:.0f} B/result)")
+
+if __name__ == "__main__":
+    main()
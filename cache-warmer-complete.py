@@ -0,0 +1,146 @@
+# src/business_idea_creator/utils/cache_warmer.py
+"""
+Request cache pre-warming for Business Idea Creator
+Loads results for the most requested parameter combinations into the SimilarityRequestCache:
+from the history when a recent enough result exists, otherwise by generating them under a
+rate limit and a cost budget
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+try:
+    from .request_cache import SimilarityRequestCache
+except ImportError:
+    from request_cache import SimilarityRequestCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOP_N = 20
+DEFAULT_REQUESTS_PER_MINUTE = 6.0
+DEFAULT_BUDGET_USD = 0.5
+
+# Rough cost of one generation (about 1K prompt + 2K completion tokens) per model
+ESTIMATED_COST_USD = {
+    "gpt-3.5-turbo": 0.004,
+    "gpt-4": 0.15
+}
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """Allow rate tokens per second on average, with bursts of up to capacity"""
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take tokens if available right now"""
+        with self._lock:
+            self._refill()
+            if self._tokens < tokens:
+                return False
+            self._tokens -= tokens
+            return True
+
+    def acquire(self, tokens: float = 1.0, stop: Optional[threading.Event] = None) -> bool:
+        """Wait until tokens are available; returns False if stop is set first"""
+        while not self.try_acquire(tokens):
+            with self._lock:
+                wait = (tokens - self._tokens) / self.rate
+            if stop is not None and stop.wait(wait):
+                return False
+            if stop is None:
+                time.sleep(wait)
+        return True
+
+class CacheWarmer:
+    def __init__(self, history_store, cache: SimilarityRequestCache, top_n: int = DEFAULT_TOP_N,
+                 requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+                 budget_usd: float = DEFAULT_BUDGET_USD):
+        """Warm cache with the top_n combinations observed in history_store"""
+        self.history_store = history_store
+        self.cache = cache
+        self.top_n = top_n
+        self.budget_usd = budget_usd
+        self.limiter = TokenBucket(requests_per_minute / 60.0)
+        self.stop_event = threading.Event()
+        self.stats = {"loaded": 0, "generated": 0, "skipped": 0, "spent_usd": 0.0}
+
+    def popular_requests(self) -> List[Dict[str, Any]]:
+        """Top combinations from the history (see HistoryStore.request_frequencies)"""
+        return self.history_store.request_frequencies(limit=self.top_n)
+
+    def load_from_history(self, combinations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Cache the latest stored result of each combination; returns those still missing"""
+        missing = []
+        for combination in combinations:
+            params, technique, model = combination["input_parameters"], combination["technique"], combination["model"]
+            if self.cache.contains(params, technique, model):
+                continue
+            result = self.history_store.get_result(combination["latest_request_id"])
+            if result and result["generated_ideas"]:
+                self.cache.store(params, technique, model, result, stored_at=combination["latest_ts"])
+            # A result past the cache TTL does not count
+            if self.cache.contains(params, technique, model):
+                self.stats["loaded"] += 1
+            else:
+                missing.append(combination)
+        return missing
+
+    def generate_missing(self, generator, request_type, combinations: List[Dict[str, Any]]):
+        """Generate (rate limited, within budget) the combinations the cache cannot serve"""
+        for combination in combinations:
+            technique, model = combination["technique"], combination["model"]
+            cost = ESTIMATED_COST_USD.get(model, max(ESTIMATED_COST_USD.values()))
+            if self.stats["spent_usd"] + cost > self.budget_usd:
+                self.stats["skipped"] += 1
+                continue
+            if not self.limiter.acquire(stop=self.stop_event):
+                return
+            # Users may have requested it meanwhile
+            if self.cache.contains(combination["input_parameters"], technique, model):
+                continue
+            try:
+                request = request_type(**combination["input_parameters"])
+                generator.generate_ideas(request, technique=technique, model=model, allow_cached=False)
+            except Exception as e:
+                logger.warning(f"Cache warm-up generation failed: {e}")
+                continue
+            self.stats["spent_usd"] += cost
+            self.stats["generated"] += 1
+
+    def run(self, generator=None, request_type=None) -> Dict[str, Any]:
+        """Load popular results from history, then generate the rest with generator (if given)
+
+        generator should be a live (non-mock) BusinessIdeaGenerator writing to the same cache,
+        request_type the BusinessIdeaRequest class. Returns the warm-up stats.
+        """
+        try:
+            missing = self.load_from_history(self.popular_requests())
+            if generator is not None and not generator.mock_mode and missing:
+                self.generate_missing(generator, request_type, missing)
+            else:
+                self.stats["skipped"] += len(missing)
+        except Exception as e:
+            logger.error(f"Cache warm-up failed: {e}")
+        logger.info(f"Cache warm-up finished: {self.stats}")
+        return self.stats
+
+    def start(self, generator=None, request_type=None) -> threading.Thread:
+        """Run the warm-up on a daemon thread"""
+        thread = threading.Thread(target=self.run, args=(generator, request_type), daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        """Stop waiting for rate-limit tokens; generations in flight still finish"""
+        self.stop_event.set()
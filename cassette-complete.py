@@ -0,0 +1,181 @@
+# src/business_idea_creator/utils/cassette.py
+"""
+Record/replay cassettes for Business Idea Creator
+In record mode every completion call's response and latency are appended to a gzip JSONL
+file, keyed by a fingerprint of the request; in replay mode calls are served from that
+file without any network, optionally with the recorded latencies
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+RECORD = "record"
+REPLAY = "replay"
+
+# Request options that change how a response is delivered, not what it is
+_TRANSPORT_PARAMS = ("stream", "stream_options", "timeout")
+
+# Replayed streams are cut into chunks of about this many characters
+REPLAY_CHUNK_CHARS = 24
+
+class CassetteMissError(LookupError):
+    """Raised in replay mode for a request the cassette has no response for"""
+
+def fingerprint(request: Dict[str, Any]) -> str:
+    """Stable hash of a completion request (model, messages and sampling parameters)"""
+    canonical = {key: value for key, value in request.items() if key not in _TRANSPORT_PARAMS}
+    return hashlib.sha256(json.dumps(canonical, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:32]
+
+def _compact_response(choices: Dict[int, str], usage: Any) -> Dict[str, Any]:
+    """What a cassette keeps of a response: each choice's content and the token usage"""
+    return {
+        "choices": [{"index": index, "content": choices[index]} for index in sorted(choices)],
+        "usage": {
+            field: getattr(usage, field, None)
+            for field in ("prompt_tokens", "completion_tokens", "total_tokens")
+        } if usage is not None else None
+    }
+
+def _usage(recorded: Dict[str, Any]) -> Optional[SimpleNamespace]:
+    return SimpleNamespace(**recorded["usage"]) if recorded.get("usage") else None
+
+class Cassette:
+    def __init__(self, path: str, mode: str = REPLAY, latency_scale: float = 0.0):
+        """Cassette file at path; in replay mode each call sleeps latency_scale times its recorded latency"""
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self._lock = threading.Lock()
+        # fingerprint -> recorded calls; repeats of a request are served in turn
+        self._recordings: Dict[str, List[Dict[str, Any]]] = {}
+        self._next: Dict[str, int] = {}
+        self.stats = {"recorded": 0, "hits": 0, "misses": 0}
+        if mode == REPLAY:
+            self._load()
+        else:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == REPLAY
+
+    def __len__(self) -> int:
+        return sum(len(recordings) for recordings in self._recordings.values())
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            logger.warning(f"Cassette {self.path} does not exist; every call will miss")
+            return
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    self._recordings.setdefault(record["fingerprint"], []).append(record)
+        logger.info(f"Loaded {len(self)} recorded calls from {self.path}")
+
+    def call(self, request: Dict[str, Any], send: Callable[[], Any]) -> Any:
+        """Response to request: replayed from the cassette, or from send() and recorded"""
+        if self.replaying:
+            return self._replay(request)
+        started = time.monotonic()
+        response = send()
+        if request.get("stream"):
+            return self._record_stream(request, response, started)
+        choices = {getattr(choice, "index", index): choice.message.content
+                   for index, choice in enumerate(response.choices)}
+        self._write(request, _compact_response(choices, getattr(response, "usage", None)), time.monotonic() - started)
+        return response
+
+    def _record_stream(self, request: Dict[str, Any], stream, started: float) -> Iterator[Any]:
+        """Pass a stream through, recording it once it has been read to the end"""
+        choices: Dict[int, List[str]] = {}
+        usage = None
+        for chunk in stream:
+            usage = getattr(chunk, "usage", None) or usage
+            for choice in chunk.choices:
+                if choice.delta.content:
+                    choices.setdefault(choice.index, []).append(choice.delta.content)
+            yield chunk
+        contents = {index: "".join(parts) for index, parts in choices.items()}
+        self._write(request, _compact_response(contents, usage), time.monotonic() - started)
+
+    def _write(self, request: Dict[str, Any], response: Dict[str, Any], latency: float):
+        record = {
+            "fingerprint": fingerprint(request),
+            "model": request.get("model"),
+            "latency": round(latency, 4),
+            "recorded_at": time.time(),
+            "response": response
+        }
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            # One gzip member per call: a crash loses at most the call being written
+            with gzip.open(self.path, "at", encoding="utf-8") as f:
+                f.write(line)
+            self.stats["recorded"] += 1
+
+    def _replay(self, request: Dict[str, Any]) -> Any:
+        key = fingerprint(request)
+        with self._lock:
+            recordings = self._recordings.get(key)
+            if not recordings:
+                self.stats["misses"] += 1
+                raise CassetteMissError(f"No recorded response for request {key} ({request.get('model')})")
+            position = self._next.get(key, 0)
+            self._next[key] = position + 1
+            self.stats["hits"] += 1
+        record = recordings[position % len(recordings)]
+        if self.latency_scale > 0:
+            time.sleep(record["latency"] * self.latency_scale)
+
+        recorded = record["response"]
+        if request.get("stream"):
+            return self._replay_stream(recorded)
+        return SimpleNamespace(
+            choices=[
+                SimpleNamespace(index=choice["index"], message=SimpleNamespace(content=choice["content"]))
+                for choice in recorded["choices"]
+            ],
+            usage=_usage(recorded)
+        )
+
+    def _replay_stream(self, recorded: Dict[str, Any]) -> Iterator[Any]:
+        """Recorded choices as stream chunks (usage in a final chunk, as with include_usage)"""
+        for choice in recorded["choices"]:
+            content = choice["content"]
+            for start in range(0, len(content), REPLAY_CHUNK_CHARS):
+                delta = SimpleNamespace(content=content[start:start + REPLAY_CHUNK_CHARS])
+                yield SimpleNamespace(choices=[SimpleNamespace(index=choice["index"], delta=delta)], usage=None)
+        yield SimpleNamespace(choices=[], usage=_usage(recorded))
+
+_CASSETTE: Optional[Cassette] = None
+_CASSETTE_LOADED = False
+_CASSETTE_LOCK = threading.Lock()
+
+def get_cassette() -> Optional[Cassette]:
+    """Process-wide cassette from BUSINESS_IDEA_CASSETTE (path), BUSINESS_IDEA_CASSETTE_MODE
+    (record or replay, default replay) and BUSINESS_IDEA_CASSETTE_LATENCY (replay latency scale);
+    None when no path is set"""
+    global _CASSETTE, _CASSETTE_LOADED
+    with _CASSETTE_LOCK:
+        if not _CASSETTE_LOADED:
+            path = os.getenv("BUSINESS_IDEA_CASSETTE")
+            if path:
+                _CASSETTE = Cassette(
+                    path,
+                    mode=os.getenv("BUSINESS_IDEA_CASSETTE_MODE", REPLAY).lower(),
+                    latency_scale=float(os.getenv("BUSINESS_IDEA_CASSETTE_LATENCY", "0"))
+                )
+            _CASSETTE_LOADED = True
+        return _CASSETTE
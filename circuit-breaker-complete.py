@@ -0,0 +1,126 @@
+# src/business_idea_creator/utils/circuit_breaker.py
+"""
+Circuit breakers for upstream API calls in Business Idea Creator
+A breaker tracks the outcome and latency of recent calls to one model/endpoint and, when too
+many fail or run slow, rejects calls outright until a probe call succeeds again
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling upstream while a circuit is open"""
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_rate_threshold: float = 0.5, slow_call_seconds: float = 20.0,
+                 slow_rate_threshold: float = 0.8, window: int = 20, min_calls: int = 5,
+                 open_seconds: float = 30.0, half_open_max_calls: int = 1):
+        """Breaker over the last window calls; opens once at least min_calls were made and the
+        failure rate or the rate of calls slower than slow_call_seconds reaches its threshold"""
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_rate_threshold = slow_rate_threshold
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+
+        self.state = CLOSED
+        self._lock = threading.Lock()
+        # (failed, slow) per recent call
+        self._calls: Deque[Tuple[bool, bool]] = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probes = 0
+
+    def allow(self) -> bool:
+        """Whether a call may go upstream now (half-open: only a limited number of probes)"""
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self._opened_at < self.open_seconds:
+                    return False
+                self.state = HALF_OPEN
+                self._probes = 0
+            if self.state == HALF_OPEN:
+                if self._probes >= self.half_open_max_calls:
+                    return False
+                self._probes += 1
+            return True
+
+    def record(self, success: bool, latency: float, slow_call_seconds: Optional[float] = None):
+        """Record the outcome of an allowed call (slow_call_seconds overrides the breaker's for this call)"""
+        slow = latency >= (slow_call_seconds or self.slow_call_seconds)
+        with self._lock:
+            if self.state == HALF_OPEN:
+                if success and not slow:
+                    logger.info(f"Circuit {self.name} closed after a successful probe")
+                    self.state = CLOSED
+                    self._calls.clear()
+                else:
+                    self._open()
+                return
+            self._calls.append((not success, slow))
+            if self.state == CLOSED and len(self._calls) >= self.min_calls:
+                failure_rate = sum(failed for failed, _ in self._calls) / len(self._calls)
+                slow_rate = sum(slow for _, slow in self._calls) / len(self._calls)
+                if failure_rate >= self.failure_rate_threshold or slow_rate >= self.slow_rate_threshold:
+                    self._open()
+
+    def _open(self):
+        logger.warning(f"Circuit {self.name} opened for {self.open_seconds:.0f}s")
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+        self._calls.clear()
+
+    def call(self, fn: Callable[[], Any], is_failure: Optional[Callable[[Exception], bool]] = None,
+             slow_call_seconds: Optional[float] = None) -> Any:
+        """Call fn through the breaker, raising CircuitOpenError when it is open
+
+        is_failure decides which exceptions count against the upstream (default: all);
+        others, such as a caller's bad request, count as a response. slow_call_seconds
+        overrides the breaker's threshold for calls expected to take longer (or shorter).
+        """
+        if not self.allow():
+            raise CircuitOpenError(f"Circuit {self.name} is open")
+        started = time.monotonic()
+        try:
+            result = fn()
+        except Exception as e:
+            self.record(is_failure is not None and not is_failure(e), time.monotonic() - started, slow_call_seconds)
+            raise
+        self.record(True, time.monotonic() - started, slow_call_seconds)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Current state and recent failure/slow rates"""
+        with self._lock:
+            calls = len(self._calls)
+            return {
+                "state": self.state,
+                "calls": calls,
+                "failure_rate": sum(failed for failed, _ in self._calls) / calls if calls else 0.0,
+                "slow_rate": sum(slow for _, slow in self._calls) / calls if calls else 0.0
+            }
+
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+_BREAKERS_LOCK = threading.Lock()
+
+def get_circuit_breaker(name: str, **settings) -> CircuitBreaker:
+    """Process-wide breaker for name (e.g. "model@endpoint"); settings apply on creation only"""
+    with _BREAKERS_LOCK:
+        breaker = _BREAKERS.get(name)
+        if breaker is None:
+            breaker = _BREAKERS[name] = CircuitBreaker(name, **settings)
+        return breaker
+
+def all_circuit_breakers() -> Dict[str, CircuitBreaker]:
+    with _BREAKERS_LOCK:
+        return dict(_BREAKERS)
@@ -6,13 +6,16 @@ AI-powered business idea generation using advanced prompt engineering techniques
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import plotly.graph_objects as go
 import json
 import os
 from datetime import datetime, timedelta
 import time
 from typing import Dict, List, Any, Optional
 import sys
+import importlib
+import threading
+import uuid
+import hashlib
 
 # Page configuration MUST be first Streamlit command
 st.set_page_config(
@@ -68,10 +71,10 @@ def import_custom_modules():
                             setattr(self, key, value)
                 
                 class MockBusinessIdeaGenerator:
-                    def __init__(self, api_key=None):
+                    def __init__(self, api_key=None, **kwargs):
                         self.api_key = api_key
                     
-                    def generate_ideas(self, request, technique="chain_of_thought", model="gpt-3.5-turbo"):
+                    def generate_ideas(self, request, technique="chain_of_thought", model="gpt-3.5-turbo", **kwargs):
                         # Mock response for demo purposes
                         return {
                             "request_id": f"demo_{int(time.time())}",
@@ -113,7 +116,7 @@ def import_custom_modules():
                         }
                 
                 class MockDataProcessor:
-                    def get_industry_insights(self, industry):
+                    def get_industry_insights(self, industry, region=None):
                         return {
                             "market_size": "Growing",
                             "trends": ["Digital transformation", "Sustainability", "AI integration"],
@@ -134,8 +137,227 @@ def import_custom_modules():
                 
                 return MockBusinessIdeaGenerator, MockBusinessIdeaRequest, MockDataProcessor, MockInputValidator
 
+def import_optional_module(module_name: str):
+    """Import a package module by dotted name, returning None when unavailable"""
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    if current_dir not in sys.path:
+        sys.path.insert(0, current_dir)
+    
+    for candidate in (f"business_idea_creator.{module_name}", module_name):
+        try:
+            return importlib.import_module(candidate)
+        except ImportError:
+            continue
+    return None
+
 # Import the modules
 BusinessIdeaGenerator, BusinessIdeaRequest, DataProcessor, InputValidator = import_custom_modules()
+job_queue_module = import_optional_module("utils.job_queue")
+history_store_module = import_optional_module("utils.history_store")
+exporters_module = import_optional_module("utils.exporters")
+reports_module = import_optional_module("utils.reports")
+saved_ideas_module = import_optional_module("utils.saved_ideas")
+idea_scoring_module = import_optional_module("utils.idea_scoring")
+dedup_module = import_optional_module("utils.dedup")
+search_index_module = import_optional_module("utils.search_index")
+request_cache_module = import_optional_module("utils.request_cache")
+cache_warmer_module = import_optional_module("utils.cache_warmer")
+worker_pool_module = import_optional_module("utils.worker_pool")
+models_module = import_optional_module("models")
+session_store_module = import_optional_module("utils.session_store")
+hedging_module = import_optional_module("utils.hedging")
+model_router_module = import_optional_module("utils.model_router")
+key_pool_module = import_optional_module("utils.key_pool")
+cassette_module = import_optional_module("utils.cassette")
+idea_generator_module = import_optional_module("idea_generator")
+
+# Where a session's API access comes from (only read back by queued jobs, which need idea_generator)
+CREDENTIALS_CASSETTE, CREDENTIALS_KEY_POOL, CREDENTIALS_ENVIRONMENT, CREDENTIALS_SESSION = (
+    getattr(idea_generator_module, name, None) for name in
+    ("CREDENTIALS_CASSETTE", "CREDENTIALS_KEY_POOL", "CREDENTIALS_ENVIRONMENT", "CREDENTIALS_SESSION")
+)
+
+# Local storage for persistent app data (job queue, history, ...)
+DATA_DIR = os.getenv("BUSINESS_IDEA_DATA_DIR", os.path.join(os.getcwd(), ".business_idea_creator"))
+JOB_POLL_INTERVAL = 1.0
+IDEAS_PER_PAGE_OPTIONS = [5, 10, 25]
+SAVED_IDEAS_PAGE_SIZE = 20
+SEARCH_RESULT_LIMIT = 25
+IDEA_SECTIONS = ["📋 Overview", "🎯 Market & Revenue", "🏆 Strategy", "📊 Implementation"]
+IDEA_ORDER_OPTIONS = ["Generated order", "Best score"]
+
+# Session state restored after a server restart (the generator, and with it the API key, is never
+# stored; nor are job ids, which would hand a job's results to whoever restores the snapshot)
+SNAPSHOT_KEYS = ("generation_history", "current_results")
+
+# Single-user deployments (e.g. on localhost) may resume sessions by the "sid" URL parameter:
+# anyone with the URL gets the session and its saved ideas, so never set this on a shared server
+SINGLE_USER = os.getenv("BUSINESS_IDEA_SINGLE_USER", "").lower() in ("1", "true", "yes")
+
+def signed_in_user() -> Optional[str]:
+    """Stable id of the user signed in with st.login, or None (also when auth is not configured)"""
+    user = getattr(st, "user", None)
+    if user is None or not user.get("is_logged_in"):
+        return None
+    return user.get("sub") or user.get("email")
+
+@st.cache_resource
+def get_history_store():
+    """Process-wide persistent store of every generation result"""
+    if history_store_module is None:
+        return None
+    return history_store_module.HistoryStore(os.path.join(DATA_DIR, "history.db"))
+
+def compact_result(results: Dict[str, Any]):
+    """Compact read-only copy of a result for the session history (the dict itself if unavailable)"""
+    if models_module is None:
+        return results
+    return models_module.GenerationResult.from_dict(results)
+
+@st.cache_resource
+def get_saved_ideas_store():
+    """Process-wide persistent store of saved (favorite) ideas"""
+    if saved_ideas_module is None:
+        return None
+    store = saved_ideas_module.SavedIdeasStore(os.path.join(DATA_DIR, "saved_ideas.db"))
+    store.purge_ephemeral()
+    return store
+
+@st.cache_resource
+def get_session_store():
+    """Process-wide store of session snapshots"""
+    if session_store_module is None:
+        return None
+    store = session_store_module.SessionStore(os.path.join(DATA_DIR, "sessions.db"))
+    store.purge_expired()
+    return store
+
+@st.cache_resource
+def get_duplicate_index():
+    """Process-wide near-duplicate index, seeded from the stored history"""
+    if dedup_module is None:
+        return None
+    index = dedup_module.NearDuplicateIndex()
+    history_store = get_history_store()
+    if history_store is not None:
+        # Seeding a large history takes a while; the index is usable (and thread-safe) meanwhile
+        threading.Thread(target=index.seed_from_history, args=(history_store,), daemon=True).start()
+    return index
+
+@st.cache_resource
+def get_search_index():
+    """Process-wide full-text index over the stored history (synced incrementally on search)"""
+    if search_index_module is None or get_history_store() is None:
+        return None
+    return search_index_module.SearchIndex()
+
+@st.cache_resource
+def get_request_cache():
+    """Process-wide cache serving results of similar recent requests instead of calling the API"""
+    if request_cache_module is None:
+        return None
+    cache = request_cache_module.SimilarityRequestCache(
+        threshold=float(os.getenv("BUSINESS_IDEA_CACHE_THRESHOLD", request_cache_module.DEFAULT_THRESHOLD))
+    )
+    start_cache_warmer(cache)
+    return cache
+
+def start_cache_warmer(cache):
+    """Pre-load the most requested combinations into the cache in the background
+    
+    Results come from the history where possible; the rest are generated only when an
+    API key (or key pool) is configured in the environment, within BUSINESS_IDEA_WARM_BUDGET dollars.
+    """
+    history_store = get_history_store()
+    if cache_warmer_module is None or history_store is None:
+        return None
+    top_n = int(os.getenv("BUSINESS_IDEA_WARM_TOP_N", cache_warmer_module.DEFAULT_TOP_N))
+    if top_n <= 0:
+        return None
+    warmer = cache_warmer_module.CacheWarmer(
+        history_store, cache, top_n=top_n,
+        requests_per_minute=float(os.getenv("BUSINESS_IDEA_WARM_RPM", cache_warmer_module.DEFAULT_REQUESTS_PER_MINUTE)),
+        budget_usd=float(os.getenv("BUSINESS_IDEA_WARM_BUDGET", cache_warmer_module.DEFAULT_BUDGET_USD))
+    )
+    # No duplicate index: warm-up ideas are not user results and must not flag later ones
+    api_key, key_pool = os.getenv("OPENAI_API_KEY"), get_key_pool()
+    generator = BusinessIdeaGenerator(api_key, response_cache=cache, key_pool=key_pool) \
+        if api_key or key_pool is not None else None
+    warmer.start(generator, BusinessIdeaRequest)
+    return warmer
+
+@st.cache_resource
+def get_job_queue():
+    """Process-wide background job queue shared by all sessions"""
+    if job_queue_module is None or idea_generator_module is None:
+        return None
+    
+    queue = job_queue_module.JobQueue(
+        os.path.join(DATA_DIR, "jobs.db"),
+        num_workers=int(os.getenv("BUSINESS_IDEA_WORKERS", "2"))
+    )
+    # Generators for jobs whose session is gone (after a restart) share the process-wide resources
+    job_queue_module.register_generation_handlers(
+        queue, get_history_store(),
+        export_dir=os.path.join(DATA_DIR, "exports") if exporters_module is not None else None,
+        worker_pool=get_worker_pool(),
+        generator_resources=lambda: {
+            "duplicate_index": get_duplicate_index(), "response_cache": get_request_cache(),
+            "worker_pool": get_worker_pool(),
+            "router": model_router_module.get_model_router() if model_router_module is not None else None
+        }
+    )
+    queue.purge_finished()
+    queue.start()
+    return queue
+
+@st.cache_resource
+def get_key_pool():
+    """Process-wide API key pool from OPENAI_API_KEYS / OPENAI_API_KEYS_FILE (None when not configured)"""
+    if key_pool_module is None:
+        return None
+    return key_pool_module.get_key_pool()
+
+@st.cache_resource
+def get_cassette():
+    """Process-wide record/replay cassette from BUSINESS_IDEA_CASSETTE (None when not configured)"""
+    if cassette_module is None:
+        return None
+    return cassette_module.get_cassette()
+
+@st.cache_resource
+def get_worker_pool():
+    """Process-wide worker process pool for CPU-bound work (BUSINESS_IDEA_POOL_WORKERS processes)"""
+    if worker_pool_module is None:
+        return None
+    return worker_pool_module.get_worker_pool()
+
+@st.cache_resource
+def get_report_builder():
+    """Process-wide report builder (worker pool + report cache)"""
+    if reports_module is None or get_worker_pool() is None:
+        return None
+    return reports_module.ReportBuilder(worker_pool=get_worker_pool())
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def build_results_export(request_id: str, revision: int, fmt: str, _results: Dict[str, Any]) -> str:
+    """Build (once per result revision) the JSON or CSV export of a whole result"""
+    if fmt == "csv":
+        return exporters_module.results_to_csv(_results)
+    return exporters_module.results_to_json(_results)
+
+@st.cache_data(max_entries=1024, show_spinner=False)
+def build_idea_export(request_id: str, revision: int, index: int, _results: Dict[str, Any]) -> str:
+    """Build (once per result revision) the JSON export of a single idea"""
+    return exporters_module.idea_to_json(_results, index)
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def score_ideas(request_id: str, revision: int, _results: Dict[str, Any]) -> List[float]:
+    """Score (once per result revision) every idea of a result"""
+    worker_pool = get_worker_pool()
+    if worker_pool is not None and len(_results.get("generated_ideas", [])) >= idea_scoring_module.SCORE_IN_POOL_MIN_IDEAS:
+        return worker_pool.run(idea_scoring_module.score_result, _results)
+    return idea_scoring_module.score_result(_results)
 
 # Custom CSS for professional styling
 st.markdown("""
@@ -217,6 +439,17 @@ class BusinessIdeaApp:
     def __init__(self):
         self.data_processor = DataProcessor()
         self.validator = InputValidator()
+        self.history_store = get_history_store()
+        self.job_queue = get_job_queue()
+        # Created (and warmed from the history) at startup rather than on the first generation
+        get_request_cache()
+        self.session_store = get_session_store()
+        self.restore_session()
+        saved_ideas_store = get_saved_ideas_store()
+        # Ideas saved by a session that cannot be resumed are purged once it is gone
+        self.saved_ideas = saved_ideas_store.for_owner(
+            self.session_owner(), ephemeral=not st.session_state.get('session_restorable')
+        ) if saved_ideas_store is not None else None
         
         # Initialize session state
         if 'generator' not in st.session_state:
@@ -227,17 +460,119 @@ class BusinessIdeaApp:
             st.session_state.current_results = None
         if 'api_key_valid' not in st.session_state:
             st.session_state.api_key_valid = False
+        if 'credentials' not in st.session_state:
+            # Where the generator's API access comes from, so a worker without the session's
+            # generator can resolve it (one of idea_generator's CREDENTIALS_* values)
+            st.session_state.credentials = None
+        if 'pending_job_id' not in st.session_state:
+            st.session_state.pending_job_id = None
+        if 'pending_export_job_id' not in st.session_state:
+            st.session_state.pending_export_job_id = None
+    
+    def restore_session(self):
+        """Resume the browser session's state from its last snapshot, once per session
+        
+        Signed-in users (st.login) resume their own snapshot. Without sign-in, sessions are
+        only resumable in SINGLE_USER mode, by a random "sid" query parameter that survives
+        the reconnect after a restart (cookies cannot be set from Streamlit); otherwise each
+        browser session starts fresh and its id stays private.
+        """
+        if 'session_id' in st.session_state:
+            return
+        user = signed_in_user()
+        if user is not None:
+            session_id = hashlib.sha256(f"user:{user}".encode("utf-8")).hexdigest()[:32]
+        elif SINGLE_USER and self.session_store is not None:
+            session_id = st.query_params.get("sid")
+            if not session_store_module.is_valid_session_id(session_id):
+                session_id = session_store_module.new_session_id()
+                st.query_params["sid"] = session_id
+        else:
+            st.session_state.session_id = uuid.uuid4().hex
+            return
+        st.session_state.session_id = session_id
+        st.session_state.session_restorable = True
+        
+        snapshot = self.session_store.load(session_id) if self.session_store is not None else None
+        if snapshot:
+            for key in SNAPSHOT_KEYS:
+                if key in snapshot:
+                    st.session_state[key] = snapshot[key]
+            st.session_state.snapshot_token = self.snapshot_token()
+    
+    def session_owner(self) -> str:
+        """Owner of the data this browser session saves (saved ideas, stored results): the signed-in user, else the session"""
+        return st.session_state.session_id
+    
+    def history_owner(self) -> Optional[str]:
+        """Owner whose stored results this session may search; None (all of them) in SINGLE_USER mode"""
+        return None if SINGLE_USER else self.session_owner()
+    
+    def snapshot_token(self):
+        """Cheap fingerprint of the snapshotted state, to skip saving when nothing changed"""
+        current = st.session_state.get('current_results') or {}
+        return (
+            len(st.session_state.get('generation_history', [])),
+            current.get("request_id"), current.get("revision", 0)
+        )
+    
+    def snapshot_session(self):
+        """Save the session's state if it changed since the last snapshot"""
+        if self.session_store is None or not st.session_state.get('session_restorable'):
+            return
+        token = self.snapshot_token()
+        if token == st.session_state.get('snapshot_token'):
+            return
+        try:
+            self.session_store.save(
+                st.session_state.session_id,
+                {key: st.session_state[key] for key in SNAPSHOT_KEYS if key in st.session_state}
+            )
+            st.session_state.snapshot_token = token
+        except Exception:
+            # Snapshots are best effort; the live session is unaffected
+            pass
+    
+    def create_generator(self, api_key: str):
+        """Session generator wired to the shared process-wide resources"""
+        # Hedging (opt-in) trades up to 10% extra API calls for a shorter latency tail
+        hedging = hedging_module is not None and os.getenv("BUSINESS_IDEA_HEDGING", "").lower() in ("1", "true", "yes")
+        return BusinessIdeaGenerator(
+            api_key, duplicate_index=get_duplicate_index(), response_cache=get_request_cache(),
+            worker_pool=get_worker_pool(), hedger=hedging_module.get_hedger() if hedging else None,
+            router=model_router_module.get_model_router() if model_router_module is not None else None,
+            key_pool=get_key_pool(), cassette=get_cassette()
+        )
     
     def setup_api_key(self):
         """Handle OpenAI API key setup with enhanced UI"""
         
         st.sidebar.markdown('<div class="sidebar-logo">🔑 API Setup</div>', unsafe_allow_html=True)
         
+        # Replayed responses need no key
+        cassette = get_cassette()
+        if cassette is not None and cassette.replaying and not st.session_state.api_key_valid:
+            st.session_state.generator = self.create_generator(None)
+            st.session_state.credentials = CREDENTIALS_CASSETTE
+            st.session_state.api_key_valid = True
+            st.sidebar.info(f"▶️ Replaying {len(cassette)} recorded API calls from {cassette.path}")
+            return True
+        
+        # A configured key pool serves every session
+        key_pool = get_key_pool()
+        if key_pool is not None and not st.session_state.api_key_valid:
+            st.session_state.generator = self.create_generator(None)
+            st.session_state.credentials = CREDENTIALS_KEY_POOL
+            st.session_state.api_key_valid = True
+            st.sidebar.success(f"✅ {len(key_pool)} API key(s) loaded from the key pool")
+            return True
+        
         # Check for existing API key from environment
         existing_key = os.getenv("OPENAI_API_KEY")
         if existing_key and not st.session_state.api_key_valid:
             try:
-                st.session_state.generator = BusinessIdeaGenerator(existing_key)
+                st.session_state.generator = self.create_generator(existing_key)
+                st.session_state.credentials = CREDENTIALS_ENVIRONMENT
                 st.session_state.api_key_valid = True
                 st.sidebar.success("✅ API Key loaded from environment")
                 return True
@@ -260,7 +595,8 @@ class BusinessIdeaApp:
             if api_key:
                 if self.validator.validate_api_key(api_key):
                     try:
-                        st.session_state.generator = BusinessIdeaGenerator(api_key)
+                        st.session_state.generator = self.create_generator(api_key)
+                        st.session_state.credentials = CREDENTIALS_SESSION
                         st.session_state.api_key_valid = True
                         st.sidebar.success("✅ API Key validated successfully!")
                         st.rerun()
@@ -273,6 +609,24 @@ class BusinessIdeaApp:
         
         return st.session_state.api_key_valid
     
+    def render_key_pool_status(self):
+        """Sidebar view of each pooled key's usage in the last minute"""
+        
+        key_pool = get_key_pool()
+        if key_pool is None:
+            return
+        
+        with st.sidebar.expander(f"🔑 API Key Pool ({len(key_pool)} keys)"):
+            for row in key_pool.utilization():
+                if row["quarantined_for"]:
+                    st.markdown(f"⛔ `{row['key']}`: {row['reason']} ({row['quarantined_for'] / 60:.0f} min left)")
+                else:
+                    st.progress(
+                        min(row["utilization"], 1.0),
+                        text=f"`{row['key']}`: {row['requests']}/{row['rpm']} req, "
+                             f"{row['tokens']:,}/{row['tpm']:,} tokens per min"
+                    )
+    
     def render_header(self):
         """Render the application header with enhanced styling"""
         
@@ -389,11 +743,28 @@ class BusinessIdeaApp:
                 help="Select the AI prompting approach"
             )
             
-            model = st.selectbox(
-                "AI Model:",
-                ["gpt-3.5-turbo", "gpt-4"],
-                help="GPT-4 provides better results but costs more"
-            )
+            if model_router_module is not None:
+                model = st.selectbox(
+                    "AI Model:",
+                    model_router_module.available_models(),
+                    help="\"auto\" picks the best model meeting the latency target within the cost budget. "
+                         "GPT-4 provides better results but costs more"
+                )
+                slo_seconds = st.slider(
+                    "Latency target (seconds):",
+                    min_value=10,
+                    max_value=120,
+                    value=int(model_router_module.DEFAULT_SLO_SECONDS),
+                    step=5,
+                    help="Used to choose the model when \"auto\" is selected"
+                )
+            else:
+                model = st.selectbox(
+                    "AI Model:",
+                    ["gpt-3.5-turbo", "gpt-4"],
+                    help="GPT-4 provides better results but costs more"
+                )
+                slo_seconds = None
             
             creativity = st.slider(
                 "Creativity Level:",
@@ -403,6 +774,27 @@ class BusinessIdeaApp:
                 step=0.1,
                 help="Higher values = more creative ideas"
             )
+            
+            variants = st.slider(
+                "Variants per request:",
+                min_value=1,
+                max_value=4,
+                value=1,
+                help="Ask for several independent answers in one API call (the prompt is paid once); "
+                     "repeated ideas are merged"
+            )
+            
+            structured = st.checkbox(
+                "Structured (JSON) output",
+                value=False,
+                help="Ask the model for JSON ideas: every field is filled in reliably, and ideas are shown as they arrive"
+            )
+            
+            allow_cached = st.checkbox(
+                "Reuse results of similar requests",
+                value=True,
+                help="Serve a recent result for a near-identical request instead of calling the API"
+            )
         
         return {
             "industry": industry,
@@ -413,7 +805,11 @@ class BusinessIdeaApp:
             "innovation_level": innovation_level.split(" (")[0].lower(),
             "technique": technique,
             "model": model,
-            "creativity": creativity
+            "creativity": creativity,
+            "allow_cached": allow_cached,
+            "slo_seconds": slo_seconds,
+            "variants": variants,
+            "structured": structured
         }
     
     def render_main_content(self, params):
@@ -440,80 +836,221 @@ class BusinessIdeaApp:
                         st.error(f"❌ {error}")
                     return
                 
-                # Show generation progress
-                progress_container = st.container()
-                with progress_container:
-                    progress_bar = st.progress(0)
-                    status_text = st.empty()
-                    
-                    try:
-                        # Step 1: Initialize
-                        status_text.markdown("🔄 **Initializing AI system...**")
-                        progress_bar.progress(10)
-                        time.sleep(0.5)
-                        
-                        # Step 2: Create request
-                        status_text.markdown("📝 **Creating business idea request...**")
-                        progress_bar.progress(25)
-                        
-                        request = BusinessIdeaRequest(
-                            industry=params["industry"],
-                            target_audience=params["target_audience"],
-                            market_trends=params["market_trends"],
-                            budget_range=params["budget_range"],
-                            geographical_focus=params["geographical_focus"],
-                            innovation_level=params["innovation_level"]
-                        )
-                        time.sleep(0.5)
-                        
-                        # Step 3: Generate prompts
-                        status_text.markdown("🧠 **Generating AI prompts...**")
-                        progress_bar.progress(50)
-                        time.sleep(1)
-                        
-                        # Step 4: AI Processing
-                        status_text.markdown("🤖 **AI is analyzing trends and generating ideas...**")
-                        progress_bar.progress(75)
-                        
-                        # Generate ideas
-                        results = st.session_state.generator.generate_ideas(
-                            request,
-                            technique=params["technique"],
-                            model=params["model"]
-                        )
-                        
-                        # Step 5: Finalize
-                        status_text.markdown("✨ **Finalizing results...**")
-                        progress_bar.progress(100)
-                        time.sleep(0.5)
-                        
-                        # Store results
-                        st.session_state.current_results = results
-                        st.session_state.generation_history.append(results)
-                        
-                        # Clear progress
-                        progress_bar.empty()
-                        status_text.empty()
-                        
-                        # Success message
-                        st.markdown(
-                            f'<div class="success-message">'
-                            f'🎉 <strong>Success!</strong> Generated {len(results["generated_ideas"])} '
-                            f'innovative business ideas using {params["technique"]} prompting technique!'
-                            f'</div>',
-                            unsafe_allow_html=True
-                        )
-                        
-                    except Exception as e:
-                        progress_bar.empty()
-                        status_text.empty()
-                        st.error(f"❌ **Error generating ideas:** {str(e)}")
-                        st.info("💡 **Tip:** Make sure your API key is valid and you have sufficient OpenAI credits.")
+                if self.job_queue is not None:
+                    self.enqueue_generation(params)
+                else:
+                    self.generate_inline(params)
+            
+            if st.session_state.pending_job_id:
+                self.render_pending_job()
+            self.render_job_notice()
         
         # Display results if available
         if st.session_state.current_results:
             self.render_results(st.session_state.current_results)
     
+    def enqueue_generation(self, params):
+        """Submit a generation job to the background queue"""
+        
+        payload = {
+            "request": {
+                "industry": params["industry"],
+                "target_audience": params["target_audience"],
+                "market_trends": params["market_trends"],
+                "budget_range": params["budget_range"],
+                "geographical_focus": params["geographical_focus"],
+                "innovation_level": params["innovation_level"]
+            },
+            "technique": params["technique"],
+            "model": params["model"],
+            "allow_cached": params["allow_cached"],
+            "slo_seconds": params["slo_seconds"],
+            "variants": params["variants"],
+            "structured": params["structured"],
+            "credentials": st.session_state.credentials,
+            "owner": self.session_owner()
+        }
+        st.session_state.pending_job_id = self.job_queue.enqueue(
+            "generate_ideas", payload, context=st.session_state.generator, pinned=self.jobs_need_session()
+        )
+    
+    def jobs_need_session(self) -> bool:
+        """Whether this session's generation jobs can only run in this process (the API key
+        typed into the session exists nowhere else)"""
+        return st.session_state.credentials == CREDENTIALS_SESSION
+    
+    @st.fragment(run_every=JOB_POLL_INTERVAL)
+    def render_pending_job(self):
+        """Show the status of the session's pending job (polled in place), collecting it once finished"""
+        
+        if not st.session_state.pending_job_id:
+            return
+        job = self.job_queue.get(st.session_state.pending_job_id)
+        if job is not None and job["status"] not in (job_queue_module.JOB_DONE, job_queue_module.JOB_FAILED):
+            label = "queued" if job["status"] == job_queue_module.JOB_QUEUED else "running"
+            # Structured generations report the ideas streamed in so far
+            streamed_names = (job.get("progress") or {}).get("ideas", [])
+            if streamed_names:
+                st.info("🤖 **AI is generating ideas...**\n\n" + "\n".join(f"- 💡 {name}" for name in streamed_names))
+            else:
+                st.info(f"🤖 **AI is analyzing trends and generating ideas...** (job {label})")
+            return
+        
+        st.session_state.pending_job_id = None
+        if job is not None:
+            self.collect_job(job)
+        # Full rerun: the results below the fragment change too
+        st.rerun()
+    
+    def collect_job(self, job: Dict[str, Any]):
+        """Apply a finished generation or regeneration job to the session, leaving a notice to show"""
+        
+        if job["status"] == job_queue_module.JOB_DONE and job["kind"] == "regenerate_idea":
+            self.apply_regenerated(job["result"])
+            st.session_state.job_notice = ("success", f"🔄 Idea #{job['payload']['index'] + 1} regenerated")
+        elif job["status"] == job_queue_module.JOB_DONE:
+            results = job["result"]
+            st.session_state.current_results = results
+            st.session_state.generation_history.append(compact_result(results))
+            st.session_state.job_notice = ("generated", results)
+        else:
+            st.session_state.job_notice = ("error", job["error"])
+    
+    def render_job_notice(self):
+        """Show (once) the outcome of the session's last finished job"""
+        
+        notice = st.session_state.pop("job_notice", None)
+        if notice is None:
+            return
+        kind, value = notice
+        if kind == "generated":
+            st.markdown(
+                f'<div class="success-message">'
+                f'🎉 <strong>Success!</strong> Generated {len(value["generated_ideas"])} '
+                f'innovative business ideas using {value.get("technique_used", "")} prompting technique!'
+                f'</div>',
+                unsafe_allow_html=True
+            )
+        elif kind == "success":
+            st.success(value)
+        else:
+            st.error(f"❌ **Error generating ideas:** {value}")
+            st.info("💡 **Tip:** Make sure your API key is valid and you have sufficient OpenAI credits.")
+    
+    def request_regeneration(self, results: Dict[str, Any], index: int):
+        """Replace one idea of the current results, as a background job when a queue is available"""
+        
+        if self.job_queue is not None:
+            st.session_state.pending_job_id = self.job_queue.enqueue(
+                "regenerate_idea",
+                {"results": results, "index": index, "credentials": st.session_state.credentials},
+                context=st.session_state.generator, pinned=self.jobs_need_session()
+            )
+            return
+        
+        updated = st.session_state.generator.regenerate_idea(results, index)
+        if self.history_store is not None:
+            self.history_store.replace_idea(updated["request_id"], index + 1, updated["generated_ideas"][index])
+        self.apply_regenerated(updated)
+    
+    def apply_regenerated(self, results: Dict[str, Any]):
+        """Show a result with a regenerated idea and update its entry in the session history"""
+        
+        st.session_state.current_results = results
+        history = st.session_state.generation_history
+        for position in range(len(history) - 1, -1, -1):
+            if history[position]["request_id"] == results["request_id"]:
+                history[position] = compact_result(results)
+                break
+    
+    def generate_inline(self, params):
+        """Generate ideas on the script thread (fallback when no job queue is available)"""
+        
+        # Show generation progress
+        progress_container = st.container()
+        with progress_container:
+            progress_bar = st.progress(0)
+            status_text = st.empty()
+            
+            try:
+                # Step 1: Initialize
+                status_text.markdown("🔄 **Initializing AI system...**")
+                progress_bar.progress(10)
+                time.sleep(0.5)
+                
+                # Step 2: Create request
+                status_text.markdown("📝 **Creating business idea request...**")
+                progress_bar.progress(25)
+                
+                request = BusinessIdeaRequest(
+                    industry=params["industry"],
+                    target_audience=params["target_audience"],
+                    market_trends=params["market_trends"],
+                    budget_range=params["budget_range"],
+                    geographical_focus=params["geographical_focus"],
+                    innovation_level=params["innovation_level"]
+                )
+                time.sleep(0.5)
+                
+                # Step 3: Generate prompts
+                status_text.markdown("🧠 **Generating AI prompts...**")
+                progress_bar.progress(50)
+                time.sleep(1)
+                
+                # Step 4: AI Processing
+                status_text.markdown("🤖 **AI is analyzing trends and generating ideas...**")
+                progress_bar.progress(75)
+                
+                # Generate ideas; structured responses are streamed, so finished ideas show up early
+                streamed_names = []
+                
+                def on_idea(idea):
+                    streamed_names.append(idea["name"])
+                    status_text.markdown(
+                        "🤖 **AI is generating ideas...**\n\n" + "\n".join(f"- 💡 {name}" for name in streamed_names)
+                    )
+                
+                results = st.session_state.generator.generate_ideas(
+                    request,
+                    technique=params["technique"],
+                    model=params["model"],
+                    allow_cached=params["allow_cached"],
+                    slo_seconds=params["slo_seconds"],
+                    variants=params["variants"],
+                    structured=params["structured"],
+                    on_idea=on_idea if params["structured"] else None
+                )
+                
+                # Step 5: Finalize
+                status_text.markdown("✨ **Finalizing results...**")
+                progress_bar.progress(100)
+                time.sleep(0.5)
+                
+                # Store results
+                st.session_state.current_results = results
+                st.session_state.generation_history.append(compact_result(results))
+                if self.history_store is not None and not results.get("cache_hit"):
+                    self.history_store.add_result(results, owner=self.session_owner())
+                
+                # Clear progress
+                progress_bar.empty()
+                status_text.empty()
+                
+                # Success message
+                st.markdown(
+                    f'<div class="success-message">'
+                    f'🎉 <strong>Success!</strong> Generated {len(results["generated_ideas"])} '
+                    f'innovative business ideas using {params["technique"]} prompting technique!'
+                    f'</div>',
+                    unsafe_allow_html=True
+                )
+            
+            except Exception as e:
+                progress_bar.empty()
+                status_text.empty()
+                st.error(f"❌ **Error generating ideas:** {str(e)}")
+                st.info("💡 **Tip:** Make sure your API key is valid and you have sufficient OpenAI credits.")
+    
     def render_results(self, results: Dict[str, Any]):
         """Render generated business ideas with enhanced formatting"""
         
@@ -561,170 +1098,56 @@ class BusinessIdeaApp:
                 unsafe_allow_html=True
             )
         
+        cache_hit = results.get("cache_hit")
+        if cache_hit:
+            # Show the parameters the reused ideas were generated for where they differ from this request's
+            generated_for = results.get("input_parameters", {})
+            differences = [
+                f"{field.replace('_', ' ')}: {', '.join(original) if isinstance(original, list) else original}"
+                for field, value in cache_hit.get("served_for", {}).items()
+                for original in [generated_for.get(field)]
+                if field != "technique_used" and (
+                    sorted(value) != sorted(original or []) if isinstance(value, list) else value != original
+                )
+            ]
+            st.caption(
+                f"♻️ Reused from a similar earlier request ({cache_hit['request_id']}, "
+                f"similarity {cache_hit['similarity']:.2f})"
+                + (f", generated for {'; '.join(differences)}" if differences else "")
+                + "; untick \"Reuse results of similar requests\" in Advanced Settings for a fresh generation"
+            )
+        elif results.get("variants"):
+            st.caption(f"🔀 Merged from {results['variants']} variants generated in one call")
+
         st.markdown("---")
         
-        # Display each business idea
-        for i, idea in enumerate(results["generated_ideas"], 1):
-            with st.container():
-                st.markdown(
-                    f'<div class="idea-card">'
-                    f'<h3 style="color: #1f77b4; margin-top: 0;">💡 Business Idea #{i}: {idea.get("name", f"Innovative Idea {i}")}</h3>',
-                    unsafe_allow_html=True
-                )
-                
-                # Create tabs for different aspects
-                tab1, tab2, tab3, tab4 = st.tabs(["📋 Overview", "🎯 Market & Revenue", "🏆 Strategy", "📊 Implementation"])
-                
-                with tab1:
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        if idea.get('problem'):
-                            st.markdown("**🎯 Problem Statement:**")
-                            st.markdown(idea['problem'])
-                            st.markdown("---")
-                        
-                        if idea.get('solution'):
-                            st.markdown("**💡 Solution Overview:**")
-                            st.markdown(idea['solution'])
-                    
-                    with col2:
-                        if idea.get('target_market'):
-                            st.markdown("**👥 Target Market:**")
-                            st.markdown(idea['target_market'])
-                            st.markdown("---")
-                        
-                        if idea.get('competitive_edge'):
-                            st.markdown("**🏆 Competitive Advantage:**")
-                            st.markdown(idea['competitive_edge'])
-                
-                with tab2:
-                    if idea.get('revenue_model'):
-                        st.markdown("**💰 Revenue Model:**")
-                        st.markdown(idea['revenue_model'])
-                        st.markdown("---")
-                    
-                    # Add market insights
-                    if hasattr(self, 'data_processor'):
-                        insights = self.data_processor.get_industry_insights(results.get("input_parameters", {}).get("industry", ""))
-                        if insights:
-                            st.markdown("**📈 Market Insights:**")
-                            for key, value in insights.items():
-                                if isinstance(value, list):
-                                    st.markdown(f"- **{key.title()}:** {', '.join(value)}")
-                                else:
-                                    st.markdown(f"- **{key.title()}:** {value}")
-                
-                with tab3:
-                    if idea.get('implementation'):
-                        st.markdown("**🚀 Implementation Strategy:**")
-                        st.markdown(idea['implementation'])
-                        st.markdown("---")
-                    
-                    # Add strategic considerations
-                    st.markdown("**💡 Strategic Considerations:**")
-                    considerations = [
-                        "Conduct thorough market research",
-                        "Develop MVP (Minimum Viable Product)",
-                        "Build strategic partnerships",
-                        "Secure appropriate funding",
-                        "Focus on customer feedback and iteration"
-                    ]
-                    for consideration in considerations:
-                        st.markdown(f"- {consideration}")
-                
-                with tab4:
-                    if idea.get('success_metrics'):
-                        st.markdown("**📊 Success Metrics:**")
-                        st.markdown(idea['success_metrics'])
-                        st.markdown("---")
-                    
-                    # Add timeline suggestions
-                    st.markdown("**⏰ Suggested Timeline:**")
-                    timeline = [
-                        "**Months 1-2:** Market research and validation",
-                        "**Months 3-4:** MVP development",
-                        "**Months 5-6:** Beta testing and refinement", 
-                        "**Months 7-8:** Launch and initial marketing",
-                        "**Months 9-12:** Scale and optimize"
-                    ]
-                    for phase in timeline:
-                        st.markdown(f"- {phase}")
-                
-                # Action buttons
-                st.markdown("---")
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    if st.button(f"📋 Save Idea #{i}", key=f"save_{i}"):
-                        # Save to session state or file
-                        if 'saved_ideas' not in st.session_state:
-                            st.session_state.saved_ideas = []
-                        st.session_state.saved_ideas.append(idea)
-                        st.success(f"✅ Idea #{i} saved to favorites!")
-                
-                with col2:
-                    if st.button(f"📤 Export #{i}", key=f"export_{i}"):
-                        # Create exportable format
-                        export_data = {
-                            "idea_name": idea.get("name", f"Business Idea {i}"),
-                            "generated_at": datetime.now().isoformat(),
-                            "details": idea
-                        }
-                        st.download_button(
-                            label=f"⬇️ Download Idea #{i}",
-                            data=json.dumps(export_data, indent=2),
-                            file_name=f"business_idea_{i}_{datetime.now().strftime('%Y%m%d')}.json",
-                            mime="application/json",
-                            key=f"download_{i}"
-                        )
-                
-                with col3:
-                    if st.button(f"🔄 Refine #{i}", key=f"refine_{i}"):
-                        st.info(f"💡 Refinement feature coming soon! Idea #{i} will be enhanced based on additional parameters.")
-                
-                with col4:
-                    if st.button(f"📊 Analyze #{i}", key=f"analyze_{i}"):
-                        st.info(f"📈 Market analysis for Idea #{i} coming soon!")
-                
-                st.markdown('</div>', unsafe_allow_html=True)
-                st.markdown("---")
+        # Display the ideas one page at a time; each card reruns on its own
+        self.render_idea_list(results)
         
         # Export all ideas
+        self.render_export_section(results)
+    
+    @st.fragment
+    def render_export_section(self, results: Dict[str, Any]):
+        """Render whole-result exports and reports (reruns independently of the idea cards)"""
+        
         st.markdown('<h3 class="sub-header">📤 Export All Ideas</h3>', unsafe_allow_html=True)
         
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            all_ideas_json = json.dumps(results, indent=2, default=str)
             st.download_button(
                 "📄 Download as JSON",
-                data=all_ideas_json,
+                data=self.export_payload(results, "json"),
                 file_name=f"business_ideas_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
                 mime="application/json",
                 use_container_width=True
             )
         
         with col2:
-            # Create CSV format
-            csv_data = []
-            for i, idea in enumerate(results["generated_ideas"], 1):
-                csv_data.append({
-                    "Idea #": i,
-                    "Name": idea.get("name", f"Idea {i}"),
-                    "Problem": idea.get("problem", ""),
-                    "Solution": idea.get("solution", ""),
-                    "Target Market": idea.get("target_market", ""),
-                    "Revenue Model": idea.get("revenue_model", ""),
-                    "Competitive Edge": idea.get("competitive_edge", ""),
-                    "Implementation": idea.get("implementation", ""),
-                    "Success Metrics": idea.get("success_metrics", "")
-                })
-            
-            csv_df = pd.DataFrame(csv_data)
             st.download_button(
                 "📊 Download as CSV",
-                data=csv_df.to_csv(index=False),
+                data=self.export_payload(results, "csv"),
                 file_name=f"business_ideas_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                 mime="text/csv",
                 use_container_width=True
@@ -736,7 +1159,304 @@ class BusinessIdeaApp:
                 help="Email functionality coming soon!",
                 use_container_width=True
             )
+        
+        self.render_reports(results)
+    
+    def render_reports(self, results: Dict[str, Any]):
+        """Build Excel / PowerPoint reports in the background process pool"""
+        
+        report_builder = get_report_builder()
+        if report_builder is None or not report_builder.available_kinds():
+            return
+        
+        st.markdown("**📑 Reports**")
+        scope = st.radio(
+            "Report scope:", ["Current result", "Session history"],
+            horizontal=True, key="report_scope"
+        )
+        results_list = [results] if scope == "Current result" else st.session_state.generation_history
+        result_key = reports_module.result_set_key(results_list)
+        
+        labels = {reports_module.REPORT_XLSX: "📗 Excel Report", reports_module.REPORT_PPTX: "📙 PowerPoint Deck"}
+        kinds = report_builder.available_kinds()
+        
+        for kind, col in zip(kinds, st.columns(len(kinds))):
+            key = (kind, result_key)
+            with col:
+                report = report_builder.get(key)
+                if report is not None:
+                    data, extension = report
+                    st.download_button(
+                        f"⬇️ Download {labels[kind]}",
+                        data=lambda data=data: data,
+                        file_name=f"business_ideas_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}",
+                        mime=reports_module.REPORT_MIME_TYPES[extension],
+                        use_container_width=True,
+                        key=f"report_download_{kind}"
+                    )
+                elif report_builder.is_pending(key):
+                    self.render_pending_report(report_builder, key, labels[kind])
+                else:
+                    if report_builder.error(key):
+                        st.error(f"❌ Report failed: {report_builder.error(key)}")
+                    if st.button(f"Build {labels[kind]}", use_container_width=True, key=f"report_build_{kind}"):
+                        report_builder.submit(kind, results_list)
+                        st.rerun()
+    
+    @st.fragment(run_every=JOB_POLL_INTERVAL)
+    def render_pending_report(self, report_builder, key, label: str):
+        """Disabled placeholder for a report being built, polled until it is ready"""
+        
+        if not report_builder.is_pending(key):
+            st.rerun()
+        st.button(f"⏳ Building {label}...", disabled=True,
+                  use_container_width=True, key=f"report_pending_{key[0]}")
+    
+    @st.fragment
+    def render_idea_list(self, results: Dict[str, Any]):
+        """Render one page of idea cards (pagination reruns only this fragment)"""
+        
+        ideas = results["generated_ideas"]
+        request_id = results.get("request_id", "")
+        page, page_size = 1, IDEAS_PER_PAGE_OPTIONS[0]
+        
+        scores = None
+        if idea_scoring_module is not None and ideas:
+            scores = score_ideas(request_id, results.get("revision", 0), results)
+        
+        col1, col2 = st.columns([2, 1])
+        order = IDEA_ORDER_OPTIONS[0]
+        with col1:
+            if scores is not None and len(ideas) > 1:
+                order = st.radio("Order ideas by:", IDEA_ORDER_OPTIONS, horizontal=True, key="ideas_order")
+        
+        visible = list(range(len(ideas)))
+        num_duplicates = sum(1 for idea in ideas if idea.get("duplicate_of"))
+        with col2:
+            if num_duplicates and st.checkbox(f"Hide near-duplicates ({num_duplicates})", key="hide_duplicates"):
+                visible = [index for index in visible if not ideas[index].get("duplicate_of")]
+        
+        if len(visible) > IDEAS_PER_PAGE_OPTIONS[0]:
+            col1, col2, col3 = st.columns([1, 1, 2])
+            
+            with col1:
+                page_size = st.selectbox("Ideas per page:", IDEAS_PER_PAGE_OPTIONS, key="ideas_page_size")
+            
+            with col2:
+                num_pages = (len(visible) + page_size - 1) // page_size
+                page = st.selectbox("Page:", list(range(1, num_pages + 1)), key=f"ideas_page_{request_id}")
+            
+            with col3:
+                st.caption(f"Showing ideas {(page - 1) * page_size + 1}-{min(page * page_size, len(visible))} of {len(visible)}")
+        
+        start = (page - 1) * page_size
+        if order == IDEA_ORDER_OPTIONS[1]:
+            # Only the ideas up to this page need ranking
+            ranked = idea_scoring_module.top_k([scores[index] for index in visible], start + page_size)
+            indices = [visible[position] for position in ranked[start:].tolist()]
+        else:
+            indices = visible[start:start + page_size]
+        
+        for index in indices:
+            self.render_idea_card(results, index + 1, ideas[index], scores[index] if scores is not None else None)
+    
+    @st.fragment
+    def render_idea_card(self, results: Dict[str, Any], i: int, idea: Dict[str, str], score: Optional[float] = None):
+        """Render a single idea card; its buttons rerun only this card"""
+        
+        with st.container():
+            st.markdown(
+                f'<div class="idea-card">'
+                f'<h3 style="color: #1f77b4; margin-top: 0;">💡 Business Idea #{i}: {idea.get("name", f"Innovative Idea {i}")}</h3>',
+                unsafe_allow_html=True
+            )
+            
+            if score is not None:
+                st.caption(f"📈 Score: {score * 100:.0f}/100 (trend coverage, budget fit, completeness)")
+            if idea.get("duplicate_of"):
+                st.caption(
+                    f"♻️ Near-duplicate ({idea.get('duplicate_similarity', 0):.0%} similar) of an earlier idea: "
+                    f"{idea['duplicate_of'].get('name', '')}"
+                )
+            
+            # Only the selected section is built (st.tabs would render all four every time)
+            section = st.radio(
+                f"Idea #{i} section",
+                IDEA_SECTIONS,
+                horizontal=True,
+                key=f"idea_section_{i}",
+                label_visibility="collapsed"
+            )
+            
+            if section == IDEA_SECTIONS[0]:
+                self.render_idea_overview(idea)
+            elif section == IDEA_SECTIONS[1]:
+                self.render_idea_market(results, idea)
+            elif section == IDEA_SECTIONS[2]:
+                self.render_idea_strategy(idea)
+            else:
+                self.render_idea_implementation(idea)
+            
+            # Action buttons
+            st.markdown("---")
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                if self.saved_ideas is not None:
+                    # Saved in a callback so the card's own rerun already shows the new state
+                    saved = idea in self.saved_ideas
+                    st.button(
+                        f"⭐ Saved #{i}" if saved else f"📋 Save Idea #{i}",
+                        key=f"save_{i}",
+                        disabled=saved,
+                        on_click=self.saved_ideas.add,
+                        args=(idea,),
+                        kwargs={
+                            "industry": results.get("input_parameters", {}).get("industry"),
+                            "request_id": results.get("request_id")
+                        }
+                    )
+                elif st.button(f"📋 Save Idea #{i}", key=f"save_{i}"):
+                    # No persistent store available: keep favorites in the session
+                    if 'saved_ideas' not in st.session_state:
+                        st.session_state.saved_ideas = []
+                    if idea not in st.session_state.saved_ideas:
+                        st.session_state.saved_ideas.append(idea)
+                    st.success(f"✅ Idea #{i} saved to favorites!")
+            
+            with col2:
+                # Payload is built lazily on click and cached per result
+                st.download_button(
+                    label=f"📤 Export #{i}",
+                    data=self.export_payload(results, "idea", i),
+                    file_name=f"business_idea_{i}_{datetime.now().strftime('%Y%m%d')}.json",
+                    mime="application/json",
+                    key=f"download_{i}"
+                )
+            
+            with col3:
+                if st.button(
+                    f"🔄 Regenerate #{i}",
+                    key=f"regenerate_{i}",
+                    disabled=bool(st.session_state.pending_job_id),
+                    help="Replace this idea with a new one; the other ideas are kept"
+                ):
+                    self.request_regeneration(results, i - 1)
+                    # The result changed (new revision), so the whole page reruns, not just this card
+                    st.rerun()
+            
+            with col4:
+                if st.button(f"📊 Analyze #{i}", key=f"analyze_{i}"):
+                    st.info(f"📈 Market analysis for Idea #{i} coming soon!")
+            
+            st.markdown('</div>', unsafe_allow_html=True)
+            st.markdown("---")
+    
+    def render_idea_overview(self, idea: Dict[str, str]):
+        """Problem, solution, market and edge of an idea"""
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            if idea.get('problem'):
+                st.markdown("**🎯 Problem Statement:**")
+                st.markdown(idea['problem'])
+                st.markdown("---")
+            
+            if idea.get('solution'):
+                st.markdown("**💡 Solution Overview:**")
+                st.markdown(idea['solution'])
+        
+        with col2:
+            if idea.get('target_market'):
+                st.markdown("**👥 Target Market:**")
+                st.markdown(idea['target_market'])
+                st.markdown("---")
+            
+            if idea.get('competitive_edge'):
+                st.markdown("**🏆 Competitive Advantage:**")
+                st.markdown(idea['competitive_edge'])
+    
+    def render_idea_market(self, results: Dict[str, Any], idea: Dict[str, str]):
+        """Revenue model plus industry insights"""
+        
+        if idea.get('revenue_model'):
+            st.markdown("**💰 Revenue Model:**")
+            st.markdown(idea['revenue_model'])
+            st.markdown("---")
+        
+        # Add market insights
+        if hasattr(self, 'data_processor'):
+            params = results.get("input_parameters", {})
+            insights = self.data_processor.get_industry_insights(params.get("industry", ""), params.get("geographical_focus"))
+            if insights:
+                st.markdown("**📈 Market Insights:**")
+                for key, value in insights.items():
+                    if isinstance(value, (list, tuple)):
+                        st.markdown(f"- **{key.title()}:** {', '.join(value)}")
+                    else:
+                        st.markdown(f"- **{key.title()}:** {value}")
+    
+    def render_idea_strategy(self, idea: Dict[str, str]):
+        """Implementation strategy and strategic considerations"""
+        
+        if idea.get('implementation'):
+            st.markdown("**🚀 Implementation Strategy:**")
+            st.markdown(idea['implementation'])
+            st.markdown("---")
+        
+        # Add strategic considerations
+        st.markdown("**💡 Strategic Considerations:**")
+        considerations = [
+            "Conduct thorough market research",
+            "Develop MVP (Minimum Viable Product)",
+            "Build strategic partnerships",
+            "Secure appropriate funding",
+            "Focus on customer feedback and iteration"
+        ]
+        for consideration in considerations:
+            st.markdown(f"- {consideration}")
+    
+    def render_idea_implementation(self, idea: Dict[str, str]):
+        """Success metrics and suggested timeline"""
+        
+        if idea.get('success_metrics'):
+            st.markdown("**📊 Success Metrics:**")
+            st.markdown(idea['success_metrics'])
+            st.markdown("---")
+        
+        # Add timeline suggestions
+        st.markdown("**⏰ Suggested Timeline:**")
+        timeline = [
+            "**Months 1-2:** Market research and validation",
+            "**Months 3-4:** MVP development",
+            "**Months 5-6:** Beta testing and refinement", 
+            "**Months 7-8:** Launch and initial marketing",
+            "**Months 9-12:** Scale and optimize"
+        ]
+        for phase in timeline:
+            st.markdown(f"- {phase}")
     
+    def export_payload(self, results: Dict[str, Any], fmt: str, index: int = 0):
+        """Return download data for a result: a deferred, cached builder when possible"""
+        
+        request_id = results.get("request_id", "")
+        revision = results.get("revision", 0)
+        
+        if exporters_module is None:
+            # Eager fallback when the export helpers are unavailable
+            if fmt == "idea":
+                idea = results["generated_ideas"][index - 1]
+                return json.dumps({"idea_name": idea.get("name", f"Business Idea {index}"), "details": idea}, indent=2)
+            if fmt == "csv":
+                return pd.DataFrame(results["generated_ideas"]).to_csv(index=False)
+            return json.dumps(results, indent=2, default=str)
+        
+        if fmt == "idea":
+            return lambda: build_idea_export(request_id, revision, index, results)
+        return lambda: build_results_export(request_id, revision, fmt, results)
+    
+    @st.fragment
     def render_analytics_tab(self):
         """Render analytics dashboard"""
         
@@ -776,69 +1496,289 @@ class BusinessIdeaApp:
         
         # Charts
         if total_generations > 0:
+            figures = self.build_analytics_figures(st.session_state.generation_history)
             st.markdown("---")
             
             col1, col2 = st.columns(2)
             
             with col1:
-                # Industry distribution
-                industries = {}
-                for gen in st.session_state.generation_history:
-                    industry = gen.get("input_parameters", {}).get("industry", "Unknown")
-                    industries[industry] = industries.get(industry, 0) + 1
-                
-                if industries:
-                    fig_pie = px.pie(
-                        values=list(industries.values()),
-                        names=list(industries.keys()),
-                        title="Ideas Generated by Industry"
-                    )
-                    fig_pie.update_traces(textposition='inside', textinfo='percent+label')
-                    st.plotly_chart(fig_pie, use_container_width=True)
+                if figures.get("industry"):
+                    st.plotly_chart(figures["industry"], use_container_width=True)
             
             with col2:
-                # Technique usage
-                techniques = {}
-                for gen in st.session_state.generation_history:
-                    technique = gen.get("technique_used", "Unknown")
-                    techniques[technique] = techniques.get(technique, 0) + 1
-                
-                if techniques:
-                    fig_bar = px.bar(
-                        x=list(techniques.keys()),
-                        y=list(techniques.values()),
-                        title="AI Techniques Used",
-                        labels={"x": "Technique", "y": "Usage Count"}
-                    )
-                    st.plotly_chart(fig_bar, use_container_width=True)
+                if figures.get("technique"):
+                    st.plotly_chart(figures["technique"], use_container_width=True)
             
             # Generation timeline
-            if len(st.session_state.generation_history) > 1:
+            if figures.get("timeline"):
                 st.markdown("---")
                 st.markdown("### 📅 Generation Timeline")
+                st.plotly_chart(figures["timeline"], use_container_width=True)
+    
+    def build_analytics_figures(self, history: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the analytics charts, memoized until the history changes"""
+        
+        cache_key = (len(history), history[-1].get("request_id"))
+        cached = st.session_state.get("analytics_figures")
+        if cached and cached[0] == cache_key:
+            return cached[1]
+        
+        figures = {}
+        
+        # Industry distribution
+        industries = {}
+        for gen in history:
+            industry = gen.get("input_parameters", {}).get("industry", "Unknown")
+            industries[industry] = industries.get(industry, 0) + 1
+        
+        if industries:
+            fig_pie = px.pie(
+                values=list(industries.values()),
+                names=list(industries.keys()),
+                title="Ideas Generated by Industry"
+            )
+            fig_pie.update_traces(textposition='inside', textinfo='percent+label')
+            figures["industry"] = fig_pie
+        
+        # Technique usage
+        techniques = {}
+        for gen in history:
+            technique = gen.get("technique_used", "Unknown")
+            techniques[technique] = techniques.get(technique, 0) + 1
+        
+        if techniques:
+            figures["technique"] = px.bar(
+                x=list(techniques.keys()),
+                y=list(techniques.values()),
+                title="AI Techniques Used",
+                labels={"x": "Technique", "y": "Usage Count"}
+            )
+        
+        # Generation timeline
+        if len(history) > 1:
+            timeline_data = []
+            for gen in history:
+                timestamp = gen.get("timestamp", "")
+                if timestamp:
+                    dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+                    timeline_data.append({
+                        "Time": dt,
+                        "Ideas Generated": len(gen["generated_ideas"]),
+                        "Industry": gen.get("input_parameters", {}).get("industry", "Unknown")
+                    })
+            
+            if timeline_data:
+                timeline_df = pd.DataFrame(timeline_data)
+                figures["timeline"] = px.line(
+                    timeline_df,
+                    x="Time",
+                    y="Ideas Generated",
+                    color="Industry",
+                    title="Ideas Generated Over Time",
+                    markers=True
+                )
+        
+        st.session_state.analytics_figures = (cache_key, figures)
+        return figures
+    
+    @st.fragment
+    def render_history_export(self):
+        """Export this user's or session's persisted history in the background, with filters"""
+        
+        if self.history_store is None or self.job_queue is None or exporters_module is None:
+            return
+        owner = self.history_owner()
+        
+        st.markdown("---")
+        with st.expander("📦 Export Full History"):
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                industry = st.selectbox(
+                    "Industry:", ["All"] + self.history_store.distinct_values("industry", owner=owner),
+                    key="history_export_industry"
+                )
+            
+            with col2:
+                technique = st.selectbox(
+                    "Technique:", ["All"] + self.history_store.distinct_values("technique", owner=owner),
+                    key="history_export_technique"
+                )
+            
+            with col3:
+                date_range = st.date_input("Date Range:", value=(), key="history_export_dates")
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                formats = [fmt for fmt in exporters_module.HISTORY_FORMATS
+                           if fmt != "parquet" or exporters_module.PYARROW_AVAILABLE]
+                fmt = st.selectbox("Format:", formats, key="history_export_format")
+            
+            with col2:
+                compressions = ["none", "gzip"] + (["zstd"] if exporters_module.ZSTD_AVAILABLE else [])
+                compression = st.selectbox("Compression:", compressions, key="history_export_compression")
+            
+            with col3:
+                st.write("")
+                start_export = st.button(
+                    "📦 Start Export",
+                    disabled=bool(st.session_state.pending_export_job_id),
+                    use_container_width=True
+                )
+            
+            if start_export:
+                filters = {
+                    "industry": None if industry == "All" else industry,
+                    "technique": None if technique == "All" else technique,
+                    "owner": owner
+                }
+                if date_range:
+                    start_day, end_day = date_range[0], date_range[-1]
+                    filters["start"] = datetime(start_day.year, start_day.month, start_day.day).isoformat()
+                    filters["end"] = (datetime(end_day.year, end_day.month, end_day.day) + timedelta(days=1)).isoformat()
                 
-                timeline_data = []
-                for gen in st.session_state.generation_history:
-                    timestamp = gen.get("timestamp", "")
-                    if timestamp:
-                        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                        timeline_data.append({
-                            "Time": dt,
-                            "Ideas Generated": len(gen["generated_ideas"]),
-                            "Industry": gen.get("input_parameters", {}).get("industry", "Unknown")
-                        })
-                
-                if timeline_data:
-                    timeline_df = pd.DataFrame(timeline_data)
-                    fig_timeline = px.line(
-                        timeline_df,
-                        x="Time",
-                        y="Ideas Generated",
-                        color="Industry",
-                        title="Ideas Generated Over Time",
-                        markers=True
+                st.session_state.pending_export_job_id = self.job_queue.enqueue("export_history", {
+                    "format": fmt,
+                    "compression": None if compression == "none" else compression,
+                    "filters": filters
+                })
+                st.session_state.last_history_export = None
+                # Rerun so the start button is shown disabled
+                st.rerun(scope="fragment")
+            
+            if st.session_state.pending_export_job_id:
+                self.render_pending_export()
+            
+            export_job = st.session_state.get("last_history_export")
+            if export_job and export_job["status"] == job_queue_module.JOB_DONE:
+                path = export_job["result"]["path"]
+                st.success(f"✅ Exported {export_job['result']['rows']:,} ideas to `{path}`")
+                if os.path.exists(path):
+                    def read_export():
+                        with open(path, "rb") as f:
+                            return f.read()
+                    
+                    st.download_button(
+                        "⬇️ Download Export",
+                        data=read_export,
+                        file_name=os.path.basename(path),
+                        use_container_width=True
                     )
-                    st.plotly_chart(fig_timeline, use_container_width=True)
+            elif export_job:
+                st.error(f"❌ Export failed: {export_job['error']}")
+    
+    @st.fragment(run_every=JOB_POLL_INTERVAL)
+    def render_pending_export(self):
+        """Status of the session's history export job, polled until it finishes"""
+        
+        job = self.job_queue.get(st.session_state.pending_export_job_id)
+        if job is None or job["status"] in (job_queue_module.JOB_DONE, job_queue_module.JOB_FAILED):
+            st.session_state.pending_export_job_id = None
+            st.session_state.last_history_export = job
+            st.rerun()
+        st.info("⏳ Exporting history in the background...")
+    
+    @st.fragment
+    def render_search_tab(self):
+        """Full-text search over the stored ideas of this user or session"""
+        
+        st.markdown('<h2 class="sub-header">🔎 Search Past Ideas</h2>', unsafe_allow_html=True)
+        
+        search_index = get_search_index()
+        if search_index is None:
+            st.info("Search needs the persistent idea history, which is not available.")
+            return
+        
+        owner = self.history_owner()
+        query = st.text_input("Search:", placeholder="e.g. subscription meal planning for students", key="search_query")
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            industry = st.selectbox(
+                "Industry:", ["All"] + self.history_store.distinct_values("industry", owner=owner), key="search_industry"
+            )
+        
+        with col2:
+            technique = st.selectbox(
+                "Technique:", ["All"] + self.history_store.distinct_values("technique", owner=owner),
+                key="search_technique"
+            )
+        
+        with col3:
+            date_range = st.date_input("Date Range:", value=(), key="search_dates")
+        
+        if not query.strip():
+            return
+        
+        # Only ideas stored since the last search are read and indexed here
+        with st.spinner("Updating search index..."):
+            search_index.sync(self.history_store)
+        
+        filters = {
+            "industry": None if industry == "All" else industry,
+            "technique": None if technique == "All" else technique,
+            "owner": owner
+        }
+        if date_range:
+            start_day, end_day = date_range[0], date_range[-1]
+            filters["start"] = datetime(start_day.year, start_day.month, start_day.day)
+            filters["end"] = datetime(end_day.year, end_day.month, end_day.day) + timedelta(days=1)
+        
+        started = time.perf_counter()
+        hits = search_index.search(query, limit=SEARCH_RESULT_LIMIT, **filters)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        searched = len(search_index) if owner is None else self.history_store.count_ideas(owner=owner)
+        st.caption(f"{len(hits)} result(s) from {searched:,} ideas in {elapsed_ms:.1f} ms")
+        
+        scores = dict(hits)
+        for row in self.history_store.get_ideas([doc_id for doc_id, _ in hits], owner=owner):
+            created = row["created_at"][:16].replace("T", " ")
+            with st.expander(
+                f"💡 {row.get('name') or 'Untitled idea'} · {row['industry'] or 'Unknown'} · {created} "
+                f"· relevance {scores[row['id']]:.2f}"
+            ):
+                self.render_idea_overview(row)
+    
+    @st.fragment
+    def render_saved_tab(self):
+        """Browse saved ideas, newest first, by industry"""
+        
+        st.markdown('<h2 class="sub-header">⭐ Saved Ideas</h2>', unsafe_allow_html=True)
+        
+        if self.saved_ideas is None or len(self.saved_ideas) == 0:
+            st.markdown(
+                '<div class="info-box">'
+                '⭐ Save ideas from your results to collect them here!'
+                '</div>',
+                unsafe_allow_html=True
+            )
+            return
+        
+        col1, col2, col3 = st.columns([2, 1, 1])
+        
+        with col1:
+            industry = st.selectbox("Industry:", ["All"] + self.saved_ideas.industries(), key="saved_industry")
+            industry = None if industry == "All" else industry
+        
+        total = self.saved_ideas.count(industry)
+        num_pages = max(1, (total + SAVED_IDEAS_PAGE_SIZE - 1) // SAVED_IDEAS_PAGE_SIZE)
+        
+        with col2:
+            page = st.selectbox("Page:", list(range(1, num_pages + 1)), key="saved_page")
+        
+        with col3:
+            st.metric("Saved Ideas", total)
+        
+        for entry in self.saved_ideas.list(page, SAVED_IDEAS_PAGE_SIZE, industry):
+            idea = entry["idea"]
+            saved_at = datetime.fromtimestamp(entry["saved_at"]).strftime("%m/%d %H:%M")
+            with st.expander(f"💡 {idea.get('name') or 'Untitled idea'} · {entry['industry'] or 'Unknown'} · {saved_at}"):
+                self.render_idea_overview(idea)
+                st.button(
+                    "🗑️ Remove", key=f"remove_saved_{entry['hash']}",
+                    on_click=self.saved_ideas.remove, args=(entry["hash"],)
+                )
     
     def render_about_tab(self):
         """Render about page with project information"""
@@ -866,7 +1806,7 @@ class BusinessIdeaApp:
             - **Advanced Prompt Engineering**: Chain-of-Thought, Few-Shot, and Directional Stimulus prompting
             - **Context-Aware Generation**: Incorporates industry trends and market conditions
             - **Interactive Web Interface**: Professional Streamlit-based UI
-            - **Export Capabilities**: Multiple formats (JSON, CSV, email)
+            - **Export Capabilities**: Multiple formats (JSON, CSV, Excel, PowerPoint, email)
             - **Analytics Dashboard**: Generation history and performance metrics
             - **Responsive Design**: Works on desktop and mobile devices
             """)
@@ -923,7 +1863,7 @@ class BusinessIdeaApp:
             st.metric("Industries Supported", "20+", help="Different business sectors")
         
         with col4:
-            st.metric("Export Formats", "3", help="JSON, CSV, Email")
+            st.metric("Export Formats", "5", help="JSON, CSV, Excel, PowerPoint, Email")
         
         # Contact and links
         st.markdown("---")
@@ -985,8 +1925,12 @@ class BusinessIdeaApp:
                 """)
             return
         
+        self.render_key_pool_status()
+        
         # Create main tabs
-        tab1, tab2, tab3 = st.tabs(["🎯 Generate Ideas", "📊 Analytics", "ℹ️ About"])
+        tab1, tab2, tab3, tab4, tab5 = st.tabs(
+            ["🎯 Generate Ideas", "📊 Analytics", "🔎 Search", "⭐ Saved Ideas", "ℹ️ About"]
+        )
         
         with tab1:
             # Get sidebar parameters
@@ -997,8 +1941,15 @@ class BusinessIdeaApp:
         
         with tab2:
             self.render_analytics_tab()
+            self.render_history_export()
         
         with tab3:
+            self.render_search_tab()
+        
+        with tab4:
+            self.render_saved_tab()
+        
+        with tab5:
             self.render_about_tab()
         
         # Footer
@@ -1015,6 +1966,8 @@ class BusinessIdeaApp:
             """, 
             unsafe_allow_html=True
         )
+        
+        self.snapshot_session()
 
 # Application entry point
 def main():
@@ -3,75 +3,62 @@
 Data processing utilities for Business Idea Creator
 """
 
-import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Mapping, Optional, Tuple
+
+try:
+    from .knowledge_base import KnowledgeBase, get_knowledge_base
+    from .trend_matcher import TrendMatcher
+except ImportError:
+    from knowledge_base import KnowledgeBase, get_knowledge_base
+    from trend_matcher import TrendMatcher
 
 class DataProcessor:
-    def __init__(self):
-        self.industry_data = self._create_default_industry_data()
-        self.market_trends = self._load_market_trends()
+    def __init__(self, dataset_path: Optional[str] = None):
+        # Industry and trend data live in the shared knowledge base, not per instance
+        self.dataset_path = dataset_path
     
-    def _create_default_industry_data(self) -> Dict[str, Any]:
-        """Create default industry data"""
-        return {
-            "technology": {
-                "market_size": "5.2T",
-                "growth_rate": 0.08,
-                "key_players": ["Microsoft", "Apple", "Google", "Amazon"],
-                "pain_points": ["Data privacy", "Skills gap", "Digital transformation"],
-                "opportunities": ["AI automation", "Edge computing", "Quantum computing"]
-            },
-            "healthcare": {
-                "market_size": "4.3T", 
-                "growth_rate": 0.06,
-                "key_players": ["Johnson & Johnson", "Pfizer", "UnitedHealth"],
-                "pain_points": ["Access to care", "Rising costs", "Aging population"],
-                "opportunities": ["Telemedicine", "AI diagnostics", "Personalized medicine"]
-            },
-            "finance": {
-                "market_size": "22.5T",
-                "growth_rate": 0.05,
-                "key_players": ["JPMorgan", "Bank of America", "Wells Fargo"],
-                "pain_points": ["Regulation", "Cybersecurity", "Digital transformation"],
-                "opportunities": ["Fintech", "Digital payments", "Robo-advisors"]
-            },
-            "retail": {
-                "market_size": "26T",
-                "growth_rate": 0.04,
-                "key_players": ["Amazon", "Walmart", "Alibaba"],
-                "pain_points": ["E-commerce competition", "Supply chain", "Customer experience"],
-                "opportunities": ["Omnichannel", "Personalization", "Sustainability"]
-            }
-        }
+    @property
+    def knowledge_base(self) -> KnowledgeBase:
+        """Current shared knowledge base snapshot"""
+        return get_knowledge_base(self.dataset_path)
+    
+    @property
+    def industry_data(self) -> Mapping[str, Mapping[str, Any]]:
+        """Insights per industry, keyed by lower-case name (read-only)"""
+        return self.knowledge_base.industry_data
     
-    def _load_market_trends(self) -> List[Dict[str, Any]]:
-        """Load current market trends data"""
-        return [
-            {"trend": "AI Integration", "growth_rate": 0.45, "relevance_score": 0.9},
-            {"trend": "Sustainability", "growth_rate": 0.32, "relevance_score": 0.85},
-            {"trend": "Remote Work", "growth_rate": 0.28, "relevance_score": 0.75},
-            {"trend": "E-commerce", "growth_rate": 0.41, "relevance_score": 0.8},
-            {"trend": "Digital Health", "growth_rate": 0.38, "relevance_score": 0.88}
-        ]
+    @property
+    def market_trends(self) -> Tuple[Mapping[str, Any], ...]:
+        """Trend catalog (read-only)"""
+        return self.knowledge_base.trends
     
-    def get_industry_insights(self, industry: str) -> Dict[str, Any]:
-        """Get insights for specific industry"""
-        return self.industry_data.get(industry.lower(), {})
+    @property
+    def trend_matcher(self) -> TrendMatcher:
+        """Matcher over the trend catalog"""
+        return self.knowledge_base.trend_matcher
+    
+    def get_industry_insights(self, industry: str, region: Optional[str] = None) -> Mapping[str, Any]:
+        """Get insights for specific industry (and region, when the dataset has regional rows)"""
+        return self.knowledge_base.industry(industry, region)
     
     def analyze_market_trends(self, trends: List[str]) -> Dict[str, Any]:
         """Analyze selected market trends"""
         trend_analysis = {}
+        matcher = self.trend_matcher
         
         for trend in trends:
-            # Find matching trend data
-            for trend_data in self.market_trends:
-                if trend.lower() in trend_data["trend"].lower():
-                    trend_analysis[trend] = {
-                        "growth_potential": trend_data["growth_rate"],
-                        "market_relevance": trend_data["relevance_score"],
-                        "recommendation": self._get_trend_recommendation(trend_data)
-                    }
-                    break
+            # Resolve names and aliases ("Artificial Intelligence" -> "AI Integration") via the matcher index
+            match = matcher.best_match(trend)
+            if match is None:
+                continue
+            trend_data, score = match
+            trend_analysis[trend] = {
+                "matched_trend": trend_data["trend"],
+                "match_score": score,
+                "growth_potential": trend_data["growth_rate"],
+                "market_relevance": trend_data["relevance_score"],
+                "recommendation": self._get_trend_recommendation(trend_data)
+            }
         
         return trend_analysis
     
@@ -0,0 +1,207 @@
+# src/business_idea_creator/utils/dedup.py
+"""
+Near-duplicate idea detection for Business Idea Creator
+MinHash signatures with LSH banding: inserts are incremental and lookups only
+compare against ideas that share a band bucket
+"""
+
+import os
+import re
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Fields that define what an idea "is"
+DEDUP_FIELDS = ("name", "problem", "solution")
+DEFAULT_THRESHOLD = 0.6
+
+# Ideas kept by the process-wide index (about 2-3 KB each); the least recently matched go first
+DEFAULT_MAX_IDEAS = int(os.getenv("BUSINESS_IDEA_DEDUP_MAX_IDEAS", "20000"))
+
+# Universal hashing modulo a Mersenne prime keeps every product inside uint64
+_PRIME = np.uint64((1 << 31) - 1)
+
+def idea_text(idea: Dict[str, Any]) -> str:
+    """Text compared for near-duplicates"""
+    return " ".join(str(idea.get(field) or "") for field in DEDUP_FIELDS)
+
+def shingles(text: str) -> List[int]:
+    """Hashed word unigrams and bigrams of normalized text"""
+    words = re.findall(r"[a-z0-9]+", text.lower())
+    grams = words + [f"{first} {second}" for first, second in zip(words, words[1:])]
+    return [zlib.crc32(gram.encode("utf-8")) for gram in set(grams)]
+
+class MinHashLSH:
+    def __init__(self, num_perm: int = 128, bands: int = 32,
+                 threshold: float = DEFAULT_THRESHOLD, seed: int = 1, max_size: Optional[int] = None):
+        """Index with num_perm hash functions split into bands (num_perm must be divisible by bands),
+        holding at most max_size texts (least recently inserted or matched evicted first)"""
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.max_size = max_size
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, int(_PRIME), size=(num_perm, 1)).astype(np.uint64)
+        self._b = rng.randint(0, int(_PRIME), size=(num_perm, 1)).astype(np.uint64)
+
+        self._lock = threading.Lock()
+        # Slot of each key, least recently used first; slots of removed keys are reused
+        self._positions: "OrderedDict[Any, int]" = OrderedDict()
+        self._keys: List[Any] = []
+        self._free: List[int] = []
+        self._signatures = np.empty((1024, num_perm), dtype=np.uint32)
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(bands)]
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._positions
+
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash signature of a text (all permutations computed as one array op)"""
+        hashed = np.array(shingles(text), dtype=np.uint64) % _PRIME
+        if not len(hashed):
+            return np.full(self.num_perm, int(_PRIME), dtype=np.uint32)
+        return ((self._a * hashed[None, :] + self._b) % _PRIME).min(axis=1).astype(np.uint32)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[band * self.rows:(band + 1) * self.rows].tobytes() for band in range(self.bands)]
+
+    def insert(self, key: Any, text: str, signature: Optional[np.ndarray] = None, recent: bool = True):
+        """Add a text under key (replacing the key's previous text); recent=False files it as the
+        least recently used entry, first in line for eviction"""
+        signature = self.signature(text) if signature is None else signature
+        with self._lock:
+            if key in self._positions:
+                self._remove(key)
+            elif self.max_size is not None and len(self._positions) >= self.max_size:
+                self._remove(next(iter(self._positions)))
+            if self._free:
+                position = self._free.pop()
+                self._keys[position] = key
+            else:
+                position = len(self._keys)
+                if position == len(self._signatures):
+                    self._signatures = np.concatenate([self._signatures, np.empty_like(self._signatures)])
+                self._keys.append(key)
+            self._signatures[position] = signature
+            self._positions[key] = position
+            if not recent:
+                self._positions.move_to_end(key, last=False)
+            for band, band_key in enumerate(self._band_keys(signature)):
+                self._buckets[band].setdefault(band_key, []).append(position)
+
+    def remove(self, key: Any) -> bool:
+        """Drop the text indexed under key; returns whether there was one"""
+        with self._lock:
+            if key not in self._positions:
+                return False
+            self._remove(key)
+            return True
+
+    def _remove(self, key: Any):
+        position = self._positions.pop(key)
+        for band, band_key in enumerate(self._band_keys(self._signatures[position])):
+            bucket = self._buckets[band][band_key]
+            bucket.remove(position)
+            if not bucket:
+                del self._buckets[band][band_key]
+        self._keys[position] = None
+        self._free.append(position)
+
+    def query(self, text: str, threshold: Optional[float] = None,
+              signature: Optional[np.ndarray] = None) -> List[Tuple[Any, float]]:
+        """Indexed texts whose estimated Jaccard similarity is at least threshold, most similar first"""
+        threshold = self.threshold if threshold is None else threshold
+        signature = self.signature(text) if signature is None else signature
+        with self._lock:
+            candidates = set()
+            for band, band_key in enumerate(self._band_keys(signature)):
+                candidates.update(self._buckets[band].get(band_key, ()))
+            if not candidates:
+                return []
+            positions = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+            similarity = (self._signatures[positions] == signature).mean(axis=1)
+            matches = [(self._keys[positions[i]], float(similarity[i])) for i in np.flatnonzero(similarity >= threshold)]
+            for key, _ in matches:
+                self._positions.move_to_end(key)
+        matches.sort(key=lambda match: match[1], reverse=True)
+        return matches
+
+def merge_variant_ideas(variants: List[List[Dict[str, Any]]], threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """Ideas of several completions of one prompt, in order, without near-duplicates of earlier ones"""
+    index = MinHashLSH(threshold=threshold)
+    merged = []
+    for ideas in variants:
+        for idea in ideas:
+            text = idea_text(idea)
+            signature = index.signature(text)
+            if not index.query(text, signature=signature):
+                index.insert(len(merged), text, signature=signature)
+                merged.append(idea)
+    return merged
+
+class NearDuplicateIndex(MinHashLSH):
+    """MinHash LSH over idea text, keyed by (request_id, idea name), bounded to max_size ideas"""
+
+    def __init__(self, max_size: Optional[int] = DEFAULT_MAX_IDEAS, **kwargs):
+        super().__init__(max_size=max_size, **kwargs)
+
+    def seed_from_history(self, store, chunk_size: int = 5000) -> int:
+        """Index the newest max_size ideas stored in a HistoryStore; returns the number indexed
+
+        Runs alongside live generation: ideas already indexed are skipped, and history rows go
+        in newest first as least recently used, so they are evicted oldest first and before
+        live ideas. Ideas without text are not indexed (they would all match each other).
+        """
+        seen = 0
+        count = 0
+        for chunk in store.iter_idea_chunks(chunk_size=chunk_size, newest_first=True):
+            for row in chunk:
+                if self.max_size is not None and seen >= self.max_size:
+                    return count
+                seen += 1
+                key = (row["request_id"], row["name"])
+                text = idea_text(row)
+                if text.strip() and key not in self:
+                    self.insert(key, text, recent=False)
+                    count += 1
+        return count
+
+    def flag_duplicates(self, results: Dict[str, Any], drop: bool = False) -> int:
+        """Mark ideas of a result that repeat an indexed (or earlier sibling) idea
+
+        Flagged ideas get "duplicate_of" ({"request_id", "name"} of the earlier idea) and are
+        not indexed themselves; new ones are. Ideas without text are neither flagged nor indexed. With drop=True duplicates are removed, unless
+        that would leave no ideas.
+        Returns the number of duplicates found.
+        """
+        ideas = results.get("generated_ideas", [])
+        request_id = results.get("request_id", "")
+        duplicates = 0
+        for idea in ideas:
+            text = idea_text(idea)
+            if not text.strip():
+                continue
+            signature = self.signature(text)
+            matches = self.query(text, signature=signature)
+            if matches:
+                earlier_request_id, earlier_name = matches[0][0]
+                idea["duplicate_of"] = {"request_id": earlier_request_id, "name": earlier_name}
+                idea["duplicate_similarity"] = round(matches[0][1], 3)
+                duplicates += 1
+            else:
+                self.insert((request_id, idea.get("name", "")), text, signature=signature)
+
+        if drop and 0 < duplicates < len(ideas):
+            results["generated_ideas"] = [idea for idea in ideas if "duplicate_of" not in idea]
+        results["duplicates_found"] = duplicates
+        return duplicates
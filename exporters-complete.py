@@ -0,0 +1,151 @@
+# src/business_idea_creator/utils/exporters.py
+"""
+Export payload builders for Business Idea Creator
+"""
+
+import csv
+import gzip
+import io
+import json
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+try:
+    from .history_store import EXPORT_COLUMNS, HistoryStore
+except ImportError:
+    from history_store import EXPORT_COLUMNS, HistoryStore
+
+# Optional compression / columnar output
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    pq = None
+    PYARROW_AVAILABLE = False
+
+HISTORY_FORMATS = ["csv", "jsonl", "parquet"]
+HISTORY_COMPRESSIONS = [None, "gzip", "zstd"]
+
+# CSV column header -> idea field
+CSV_COLUMNS = [
+    ("Name", "name"),
+    ("Problem", "problem"),
+    ("Solution", "solution"),
+    ("Target Market", "target_market"),
+    ("Revenue Model", "revenue_model"),
+    ("Competitive Edge", "competitive_edge"),
+    ("Implementation", "implementation"),
+    ("Success Metrics", "success_metrics")
+]
+
+def idea_to_row(index: int, idea: Dict[str, Any]) -> List[Any]:
+    """Flatten an idea into a CSV row (index is 1-based)"""
+    row = [index]
+    for _, field in CSV_COLUMNS:
+        default = f"Idea {index}" if field == "name" else ""
+        row.append(idea.get(field, default))
+    return row
+
+def results_to_json(results: Dict[str, Any]) -> str:
+    """Serialize a full generation result as pretty-printed JSON"""
+    return json.dumps(results, indent=2, default=str)
+
+def results_to_csv(results: Dict[str, Any]) -> str:
+    """Serialize the generated ideas of a result as CSV"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(["Idea #"] + [header for header, _ in CSV_COLUMNS])
+    for i, idea in enumerate(results.get("generated_ideas", []), 1):
+        writer.writerow(idea_to_row(i, idea))
+    return buffer.getvalue()
+
+def idea_to_json(results: Dict[str, Any], index: int) -> str:
+    """Serialize a single idea (1-based index) with its generation metadata"""
+    idea = results["generated_ideas"][index - 1]
+    export_data = {
+        "idea_name": idea.get("name", f"Business Idea {index}"),
+        "generated_at": results.get("timestamp"),
+        "details": idea
+    }
+    return json.dumps(export_data, indent=2)
+
+def history_export_filename(fmt: str, compression: Optional[str], stamp: str) -> str:
+    """File name for a history export (Parquet compresses internally)"""
+    name = f"business_ideas_history_{stamp}.{fmt}"
+    if fmt != "parquet" and compression:
+        name += {"gzip": ".gz", "zstd": ".zst"}[compression]
+    return name
+
+@contextmanager
+def _open_text_output(path: str, compression: Optional[str]):
+    """Open a text stream that compresses on the fly"""
+    if compression is None:
+        stream = open(path, "w", encoding="utf-8", newline="")
+    elif compression == "gzip":
+        stream = gzip.open(path, "wt", encoding="utf-8", newline="")
+    elif compression == "zstd":
+        if not ZSTD_AVAILABLE:
+            raise ValueError("zstd compression requires the 'zstandard' package")
+        writer = zstandard.ZstdCompressor(level=3).stream_writer(open(path, "wb"))
+        stream = io.TextIOWrapper(writer, encoding="utf-8", newline="")
+    else:
+        raise ValueError(f"Unsupported compression: {compression}")
+    try:
+        yield stream
+    finally:
+        stream.close()
+
+def export_history(store, path: str, fmt: str = "csv", compression: Optional[str] = None,
+                   chunk_size: int = 5000, **filters) -> int:
+    """Stream ideas from a HistoryStore to path chunk by chunk; returns the row count
+
+    Filters (industry, technique, start, end) are passed to HistoryStore.iter_idea_chunks,
+    so memory use is bounded by chunk_size regardless of history size.
+    """
+    if fmt not in HISTORY_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    if compression not in HISTORY_COMPRESSIONS:
+        raise ValueError(f"Unsupported compression: {compression}")
+
+    chunks = store.iter_idea_chunks(chunk_size=chunk_size, **filters)
+    rows = 0
+
+    if fmt == "parquet":
+        if not PYARROW_AVAILABLE:
+            raise ValueError("Parquet export requires the 'pyarrow' package")
+        schema = pa.schema([
+            (column, pa.int64() if column == "idea_index" else pa.string())
+            for column in EXPORT_COLUMNS
+        ])
+        with pq.ParquetWriter(path, schema, compression=compression or "snappy") as writer:
+            for chunk in chunks:
+                writer.write_table(pa.Table.from_pylist(chunk, schema=schema))
+                rows += len(chunk)
+        return rows
+
+    with _open_text_output(path, compression) as stream:
+        if fmt == "csv":
+            writer = csv.writer(stream, lineterminator="\n")
+            writer.writerow(EXPORT_COLUMNS)
+            for chunk in chunks:
+                writer.writerows([row[column] for column in EXPORT_COLUMNS] for row in chunk)
+                rows += len(chunk)
+        else:
+            for chunk in chunks:
+                stream.write("".join(json.dumps(row) + "\n" for row in chunk))
+                rows += len(chunk)
+    return rows
+
+def export_history_file(db_path: str, path: str, fmt: str = "csv", compression: Optional[str] = None,
+                        filters: Optional[Dict[str, Any]] = None) -> int:
+    """export_history for the history database at db_path (picklable, for worker processes)"""
+    return export_history(HistoryStore(db_path), path, fmt, compression, **(filters or {}))
@@ -0,0 +1,186 @@
+# src/business_idea_creator/utils/hedging.py
+"""
+Hedged requests for Business Idea Creator
+A call still running after the model's recent p90 latency (for streamed calls: still waiting
+for its first token) gets an identical backup call; the first successful response wins.
+Backups are capped to a fraction of all calls.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PERCENTILE = 90.0
+DEFAULT_MAX_HEDGE_RATE = 0.1
+# Below this many observed calls a model's latency percentile is not trusted (no hedging)
+MIN_SAMPLES = 20
+MIN_HEDGE_DELAY = 0.5
+
+class LatencyTracker:
+    def __init__(self, window: int = 200):
+        """Latencies (seconds) of the last window calls"""
+        self._latencies = np.zeros(window)
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return min(self._count, len(self._latencies))
+
+    def observe(self, latency: float):
+        with self._lock:
+            self._latencies[self._count % len(self._latencies)] = latency
+            self._count += 1
+
+    def percentile(self, q: float) -> Optional[float]:
+        """q-th percentile of the window, or None before any call"""
+        with self._lock:
+            size = len(self)
+            return float(np.percentile(self._latencies[:size], q)) if size else None
+
+class Hedger:
+    def __init__(self, percentile: float = DEFAULT_PERCENTILE, max_hedge_rate: float = DEFAULT_MAX_HEDGE_RATE,
+                 max_workers: int = 16, rate_window: float = 300.0):
+        """Hedge calls slower than the given latency percentile, in at most max_hedge_rate of calls,
+        with at most max_workers hedgeable primaries and max_workers backups in flight"""
+        self.percentile = percentile
+        self.max_hedge_rate = max_hedge_rate
+        # Attempts only go to a pool with a free slot, so they never queue behind others
+        self._primaries = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedge-primary")
+        self._backups = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedge-backup")
+        self._primary_slots = threading.BoundedSemaphore(max_workers)
+        self._backup_slots = threading.BoundedSemaphore(max_workers)
+        self._trackers: Dict[str, LatencyTracker] = {}
+        self._lock = threading.Lock()
+        # Start times of calls and hedges in the last rate_window seconds, for the hedge rate cap
+        self.rate_window = rate_window
+        self._call_times: Deque[float] = deque()
+        self._hedge_times: Deque[float] = deque()
+        self.metrics = {"calls": 0, "hedged": 0, "hedge_wins": 0, "primary_wins": 0, "capped": 0}
+
+    def tracker(self, key: str) -> LatencyTracker:
+        with self._lock:
+            tracker = self._trackers.get(key)
+            if tracker is None:
+                tracker = self._trackers[key] = LatencyTracker()
+            return tracker
+
+    def hedge_delay(self, key: str) -> Optional[float]:
+        """Seconds after which a call for key gets a backup, or None while too few calls were seen"""
+        tracker = self.tracker(key)
+        if len(tracker) < MIN_SAMPLES:
+            return None
+        return max(tracker.percentile(self.percentile), MIN_HEDGE_DELAY)
+
+    def _within_rate_cap(self, now: float) -> bool:
+        """Whether one more hedge fits the rate cap (lock held)"""
+        for times in (self._call_times, self._hedge_times):
+            while times and times[0] < now - self.rate_window:
+                times.popleft()
+        return len(self._hedge_times) + 1 <= self.max_hedge_rate * len(self._call_times)
+
+    def _may_hedge(self) -> bool:
+        """Claim a hedge within the rate cap"""
+        now = time.monotonic()
+        with self._lock:
+            if not self._within_rate_cap(now):
+                self.metrics["capped"] += 1
+                return False
+            self._hedge_times.append(now)
+            self.metrics["hedged"] += 1
+            return True
+
+    def _attempt(self, key: str, fn: Callable[..., Any], streamed: bool, first_tokens: List[bool]) -> Any:
+        """One attempt of a call, observing its latency (for streamed calls, to the first token)"""
+        started = time.monotonic()
+        if not streamed:
+            result = fn()
+            self.tracker(key).observe(time.monotonic() - started)
+            return result
+
+        def first_token() -> bool:
+            self.tracker(key).observe(time.monotonic() - started)
+            with self._lock:
+                first_tokens.append(True)
+                return len(first_tokens) == 1
+
+        return fn(first_token)
+
+    def _submit(self, executor: ThreadPoolExecutor, slots: threading.BoundedSemaphore, *args) -> Future:
+        """Run an attempt on executor in one of its slots, already acquired"""
+        try:
+            future = executor.submit(self._attempt, *args)
+        except BaseException:
+            slots.release()
+            raise
+        future.add_done_callback(lambda _: slots.release())
+        return future
+
+    def call(self, key: str, fn: Callable[..., Any], streamed: bool = False) -> Any:
+        """Run fn (an idempotent upstream call for key, e.g. a model name), hedging it if slow
+
+        A streamed call is hedged on its time to first token rather than its whole duration:
+        fn is called with a first_token() callback, to call when its first token arrives, which
+        returns whether this attempt was the first to get one (the one to pass its tokens on).
+        Calls that cannot be hedged (too few latencies seen for key, no room under the rate cap
+        or no free worker) run on the caller's thread. Running attempts cannot be cancelled:
+        both are bounded by the call's own deadline, and the loser's result is discarded.
+        """
+        if streamed:
+            key = f"{key} (first token)"
+        first_tokens: List[bool] = []
+        now = time.monotonic()
+        with self._lock:
+            self.metrics["calls"] += 1
+            self._call_times.append(now)
+            hedgeable = self._within_rate_cap(now)
+        delay = self.hedge_delay(key)
+        if delay is None or not hedgeable or not self._primary_slots.acquire(blocking=False):
+            return self._attempt(key, fn, streamed, first_tokens)
+
+        # The caller must be free to return with the backup's response, so the primary runs elsewhere
+        primary = self._submit(self._primaries, self._primary_slots, key, fn, streamed, first_tokens)
+        done, _ = wait([primary], timeout=delay)
+        if done or first_tokens or not self._backup_slots.acquire(blocking=False):
+            return primary.result()
+        if not self._may_hedge():
+            self._backup_slots.release()
+            return primary.result()
+        backup = self._submit(self._backups, self._backup_slots, key, fn, streamed, first_tokens)
+        logger.info(f"Hedging {key} call after {delay:.1f}s")
+
+        pending = {primary, backup}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            # Successes first; a failed attempt only counts if the other one cannot succeed
+            for future in sorted(done, key=lambda attempt: attempt.exception() is not None):
+                if future.exception() is None or not pending:
+                    with self._lock:
+                        self.metrics["hedge_wins" if future is backup else "primary_wins"] += 1
+                    return future.result()
+
+    def stats(self) -> Dict[str, Any]:
+        """Call and hedge counters plus the current hedge delay per key"""
+        with self._lock:
+            stats = dict(self.metrics)
+            keys = list(self._trackers)
+        stats["hedge_rate"] = stats["hedged"] / stats["calls"] if stats["calls"] else 0.0
+        stats["hedge_delays"] = {key: self.hedge_delay(key) for key in keys}
+        return stats
+
+_HEDGER: Optional[Hedger] = None
+_HEDGER_LOCK = threading.Lock()
+
+def get_hedger() -> Hedger:
+    """Process-wide hedger shared by all generators"""
+    global _HEDGER
+    with _HEDGER_LOCK:
+        if _HEDGER is None:
+            _HEDGER = Hedger()
+        return _HEDGER
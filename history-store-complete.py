@@ -0,0 +1,284 @@
+# src/business_idea_creator/utils/history_store.py
+"""
+Persistent generation history for Business Idea Creator
+SQLite-backed store of every generation result and its ideas
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+IDEA_FIELDS = [
+    "name", "problem", "solution", "target_market",
+    "revenue_model", "competitive_edge", "implementation", "success_metrics"
+]
+
+# Columns of an exported idea row, in order
+EXPORT_COLUMNS = ["request_id", "idea_index", "created_at", "industry", "technique", "model"] + IDEA_FIELDS
+
+DateLike = Union[str, datetime, None]
+
+def _to_timestamp(value: DateLike) -> Optional[float]:
+    """Convert an ISO string or datetime to an epoch timestamp"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return value.timestamp()
+
+class HistoryStore:
+    def __init__(self, db_path: str):
+        """Open (or create) the history database at db_path"""
+        self.db_path = db_path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self):
+        """Create tables and indexes"""
+        conn = self._connect()
+        idea_columns = ", ".join(f"{field} TEXT" for field in IDEA_FIELDS)
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS results (
+                    request_id TEXT PRIMARY KEY,
+                    created_at TEXT NOT NULL,
+                    created_ts REAL NOT NULL,
+                    industry TEXT,
+                    technique TEXT,
+                    model TEXT,
+                    input_parameters TEXT,
+                    raw_response TEXT,
+                    mock_mode INTEGER NOT NULL DEFAULT 0,
+                    owner TEXT
+                )
+            """)
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS ideas (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    request_id TEXT NOT NULL,
+                    idea_index INTEGER NOT NULL,
+                    created_at TEXT NOT NULL,
+                    created_ts REAL NOT NULL,
+                    industry TEXT,
+                    technique TEXT,
+                    model TEXT,
+                    {idea_columns},
+                    owner TEXT
+                )
+            """)
+            # Databases created before results had owners; their rows belong to no one
+            for table in ("results", "ideas"):
+                if "owner" not in {column["name"] for column in conn.execute(f"PRAGMA table_info({table})")}:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN owner TEXT")
+            # Single-column indexes keep rowid order per value, which keyset pagination relies on
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_ideas_created ON ideas (created_ts)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_ideas_industry ON ideas (industry)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_ideas_technique ON ideas (technique)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_ideas_owner ON ideas (owner)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_results_created ON results (created_ts)")
+
+    def add_result(self, results: Dict[str, Any], owner: Optional[str] = None) -> bool:
+        """Store a generation result and its ideas, as owner's (the session or user that generated
+        it); returns False if already stored"""
+        params = results.get("input_parameters", {})
+        created_at = results.get("timestamp") or datetime.now().isoformat()
+        created_ts = _to_timestamp(created_at)
+        industry = params.get("industry")
+        technique = results.get("technique_used") or params.get("technique_used")
+        model = results.get("model_used")
+
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO results (request_id, created_at, created_ts, industry, technique, model, "
+                "input_parameters, raw_response, mock_mode, owner) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (results["request_id"], created_at, created_ts, industry, technique, model,
+                 json.dumps(params, default=str), results.get("raw_response"),
+                 int(bool(results.get("mock_mode"))), owner)
+            )
+            if cursor.rowcount == 0:
+                return False
+            placeholders = ", ".join("?" * (8 + len(IDEA_FIELDS)))
+            conn.executemany(
+                f"INSERT INTO ideas (request_id, idea_index, created_at, created_ts, industry, technique, model, "
+                f"{', '.join(IDEA_FIELDS)}, owner) VALUES ({placeholders})",
+                [
+                    (results["request_id"], i, created_at, created_ts, industry, technique, model,
+                     *(idea.get(field, "") for field in IDEA_FIELDS), owner)
+                    for i, idea in enumerate(results.get("generated_ideas", []), 1)
+                ]
+            )
+        return True
+
+    def replace_idea(self, request_id: str, idea_index: int, idea: Dict[str, Any]) -> bool:
+        """Replace idea idea_index (1-based) of a stored result; returns False if it is not stored
+
+        The idea gets a new row id, so incremental readers (iter_idea_chunks after_id) pick it up.
+        """
+        conn = self._connect()
+        with conn:
+            row = conn.execute(
+                "SELECT created_at, created_ts, industry, technique, model, owner FROM ideas "
+                "WHERE request_id = ? AND idea_index = ?",
+                (request_id, idea_index)
+            ).fetchone()
+            if row is None:
+                return False
+            conn.execute("DELETE FROM ideas WHERE request_id = ? AND idea_index = ?", (request_id, idea_index))
+            placeholders = ", ".join("?" * (8 + len(IDEA_FIELDS)))
+            conn.execute(
+                f"INSERT INTO ideas (request_id, idea_index, created_at, created_ts, industry, technique, model, "
+                f"{', '.join(IDEA_FIELDS)}, owner) VALUES ({placeholders})",
+                (request_id, idea_index, row["created_at"], row["created_ts"], row["industry"], row["technique"],
+                 row["model"], *(idea.get(field, "") for field in IDEA_FIELDS), row["owner"])
+            )
+        return True
+
+    def _filter_clause(self, industry: Optional[str] = None, technique: Optional[str] = None,
+                       start: DateLike = None, end: DateLike = None, owner: Optional[str] = None):
+        """Build a WHERE clause (without keyword) and its parameters"""
+        clauses, args = [], []
+        if owner is not None:
+            clauses.append("owner = ?")
+            args.append(owner)
+        if industry:
+            clauses.append("industry = ?")
+            args.append(industry)
+        if technique:
+            clauses.append("technique = ?")
+            args.append(technique)
+        if start is not None:
+            clauses.append("created_ts >= ?")
+            args.append(_to_timestamp(start))
+        if end is not None:
+            clauses.append("created_ts < ?")
+            args.append(_to_timestamp(end))
+        return clauses, args
+
+    def count_ideas(self, **filters) -> int:
+        """Count stored ideas matching the filters"""
+        clauses, args = self._filter_clause(**filters)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._connect().execute(f"SELECT COUNT(*) FROM ideas {where}", args).fetchone()[0]
+
+    def iter_idea_chunks(self, chunk_size: int = 5000, after_id: int = 0, include_id: bool = False,
+                         include_owner: bool = False, newest_first: bool = False,
+                         **filters) -> Iterator[List[Dict[str, Any]]]:
+        """Yield matching ideas in chunks of at most chunk_size rows (keyset paginated), oldest
+        first unless newest_first
+
+        after_id skips ideas up to that row id, so callers can pick up only new ideas;
+        include_id adds each row's "id", include_owner its "owner".
+        """
+        clauses, args = self._filter_clause(**filters)
+        if newest_first:
+            clauses += ["id > ?", "id < ?"]
+            args.append(after_id)
+        else:
+            clauses.append("id > ?")
+        sql = (f"SELECT id, owner, {', '.join(EXPORT_COLUMNS)} FROM ideas "
+               f"WHERE {' AND '.join(clauses)} ORDER BY id {'DESC' if newest_first else ''} LIMIT ?")
+        columns = (["id"] if include_id else []) + (["owner"] if include_owner else []) + EXPORT_COLUMNS
+
+        conn = self._connect()
+        last_id = 2 ** 63 - 1 if newest_first else after_id
+        while True:
+            rows = conn.execute(sql, args + [last_id, chunk_size]).fetchall()
+            if not rows:
+                return
+            last_id = rows[-1]["id"]
+            yield [{column: row[column] for column in columns} for row in rows]
+
+    def get_ideas(self, ids: List[int], owner: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Ideas by row id, in the order given (unknown ids, and with owner other owners' ideas, are skipped)"""
+        if not ids:
+            return []
+        clauses, args = self._filter_clause(owner=owner)
+        clauses.append(f"id IN ({', '.join('?' * len(ids))})")
+        rows = self._connect().execute(
+            f"SELECT id, {', '.join(EXPORT_COLUMNS)} FROM ideas WHERE {' AND '.join(clauses)}",
+            args + list(ids)
+        ).fetchall()
+        by_id = {row["id"]: dict(row) for row in rows}
+        return [by_id[idea_id] for idea_id in ids if idea_id in by_id]
+
+    def get_result(self, request_id: str) -> Optional[Dict[str, Any]]:
+        """Rebuild a stored generation result (ideas in their original order), or None"""
+        conn = self._connect()
+        row = conn.execute("SELECT * FROM results WHERE request_id = ?", (request_id,)).fetchone()
+        if row is None:
+            return None
+        ideas = conn.execute(
+            f"SELECT {', '.join(IDEA_FIELDS)} FROM ideas WHERE request_id = ? ORDER BY idea_index",
+            (request_id,)
+        ).fetchall()
+        return {
+            "request_id": row["request_id"],
+            "timestamp": row["created_at"],
+            "input_parameters": json.loads(row["input_parameters"] or "{}"),
+            "generated_ideas": [dict(idea) for idea in ideas],
+            "raw_response": row["raw_response"],
+            "model_used": row["model"],
+            "technique_used": row["technique"],
+            "mock_mode": bool(row["mock_mode"])
+        }
+
+    def request_frequencies(self, limit: int = 20, include_mock: bool = False) -> List[Dict[str, Any]]:
+        """Most requested parameter combinations (trend order ignored), most frequent first
+
+        Each entry has "input_parameters" (without technique), "technique", "model",
+        "requests", and "latest_request_id"/"latest_ts" of its most recent result.
+        """
+        where = "" if include_mock else "WHERE mock_mode = 0"
+        # SQLite returns the bare request_id of the row holding MAX(created_ts)
+        rows = self._connect().execute(
+            f"SELECT input_parameters, technique, model, COUNT(*) AS requests, "
+            f"MAX(created_ts) AS latest_ts, request_id FROM results {where} "
+            f"GROUP BY input_parameters, technique, model"
+        ).fetchall()
+
+        combinations: Dict[tuple, Dict[str, Any]] = {}
+        for row in rows:
+            params = json.loads(row["input_parameters"] or "{}")
+            params.pop("technique_used", None)
+            params["market_trends"] = sorted(params.get("market_trends") or [])
+            key = (json.dumps(params, sort_keys=True), row["technique"], row["model"])
+            entry = combinations.get(key)
+            if entry is None:
+                combinations[key] = {
+                    "input_parameters": params, "technique": row["technique"], "model": row["model"],
+                    "requests": row["requests"], "latest_request_id": row["request_id"],
+                    "latest_ts": row["latest_ts"]
+                }
+                continue
+            entry["requests"] += row["requests"]
+            if row["latest_ts"] > entry["latest_ts"]:
+                entry["latest_request_id"], entry["latest_ts"] = row["request_id"], row["latest_ts"]
+        ranked = sorted(combinations.values(), key=lambda entry: (-entry["requests"], -entry["latest_ts"]))
+        return ranked[:limit]
+
+    def distinct_values(self, column: str, owner: Optional[str] = None) -> List[str]:
+        """Distinct non-null values of an indexed idea column (industry or technique), of owner's ideas if given"""
+        if column not in ("industry", "technique"):
+            raise ValueError(f"Unsupported column: {column}")
+        clauses, args = self._filter_clause(owner=owner)
+        clauses.append(f"{column} IS NOT NULL")
+        rows = self._connect().execute(
+            f"SELECT DISTINCT {column} FROM ideas WHERE {' AND '.join(clauses)} ORDER BY {column}", args
+        ).fetchall()
+        return [row[0] for row in rows]
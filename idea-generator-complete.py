@@ -5,13 +5,76 @@ Complete working implementation
 """
 
 import os
-import json
 import time
-from typing import List, Dict, Any, Optional
+import uuid
+from types import SimpleNamespace
+from typing import Callable, List, Dict, Any, Optional
 from datetime import datetime
 import logging
 
 # Import custom modules
+try:
+    from .models import GenerationResult
+except ImportError:
+    try:
+        from models import GenerationResult
+    except ImportError:
+        GenerationResult = None
+
+try:
+    from .utils.circuit_breaker import CircuitOpenError, get_circuit_breaker
+except ImportError:
+    try:
+        from utils.circuit_breaker import CircuitOpenError, get_circuit_breaker
+    except ImportError:
+        get_circuit_breaker = None
+        
+        class CircuitOpenError(RuntimeError):
+            pass
+
+try:
+    from .utils.dedup import merge_variant_ideas
+except ImportError:
+    try:
+        from utils.dedup import merge_variant_ideas
+    except ImportError:
+        merge_variant_ideas = None
+
+try:
+    from .utils.stream_json import ItemStreamDecoder, decode_items
+except ImportError:
+    try:
+        from utils.stream_json import ItemStreamDecoder, decode_items
+    except ImportError:
+        ItemStreamDecoder = None
+        decode_items = None
+
+try:
+    from .utils.model_router import AUTO_MODEL, completion_tokens_for, estimate_tokens
+except ImportError:
+    try:
+        from utils.model_router import AUTO_MODEL, completion_tokens_for, estimate_tokens
+    except ImportError:
+        AUTO_MODEL = "auto"
+        completion_tokens_for = None
+        estimate_tokens = None
+
+try:
+    from .utils.key_pool import get_key_pool
+except ImportError:
+    try:
+        from utils.key_pool import get_key_pool
+    except ImportError:
+        get_key_pool = None
+
+try:
+    from .utils.cassette import get_cassette
+except ImportError:
+    try:
+        from utils.cassette import get_cassette
+    except ImportError:
+        get_cassette = None
+
 try:
     from .prompt_engine import PromptEngineer, BusinessIdeaRequest
 except ImportError:
@@ -27,26 +90,146 @@ except ImportError:
         class PromptEngineer:
             def generate_context_aware_prompt(self, request, technique="chain_of_thought"):
                 return f"Generate business ideas for {request.industry}"
-            def validate_and_refine_prompt(self, prompt):
+            def validate_and_refine_prompt(self, prompt, structured=False):
                 return prompt
+            def generate_replacement_prompt(self, parameters, avoid_names):
+                return f"Generate one business idea for {parameters.get('industry', '')}"
 
 # OpenAI import with fallback
 try:
+    import openai
     from openai import OpenAI
     OPENAI_AVAILABLE = True
 except ImportError:
+    openai = None
     OpenAI = None
     OPENAI_AVAILABLE = False
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Responses shorter than this parse faster in-process than the round trip to a worker costs
+PARSE_IN_POOL_MIN_CHARS = 200_000
+
+DEFAULT_MODEL = "gpt-3.5-turbo"
+
+# The prompts ask for 3-5 ideas; max_tokens is sized for the upper end
+IDEAS_PER_REQUEST = 5
+
+# Deadline in seconds for one completion call, passed through to the client
+DEFAULT_REQUEST_TIMEOUT = float(os.getenv("BUSINESS_IDEA_REQUEST_TIMEOUT", "45"))
+
+# With a router, calls are abandoned after this many times their predicted latency (completion
+# running to max_tokens), but never later than the latency SLO (or the request timeout)
+DEADLINE_LATENCY_FACTOR = 2.0
+
+# Where a queued job's API access comes from (payload "credentials"): the process environment
+# can be resolved by any worker; a key typed into a session lives only in that session's generator
+CREDENTIALS_CASSETTE = "cassette"
+CREDENTIALS_KEY_POOL = "key_pool"
+CREDENTIALS_ENVIRONMENT = "environment"
+CREDENTIALS_SESSION = "session"
+
+class MissingCredentialsError(RuntimeError):
+    """Raised for a queued job whose API access cannot be resolved by the worker running it"""
+
+def _is_upstream_failure(error: Exception) -> bool:
+    """Whether an API error says the service is unhealthy (not that this caller's request or key is bad)"""
+    if isinstance(error, (openai.APIConnectionError, openai.InternalServerError)):
+        return True
+    return isinstance(error, openai.APIStatusError) and error.status_code >= 500
+
+IDEA_FIELDS = ("name", "problem", "solution", "target_market", "revenue_model",
+               "competitive_edge", "implementation", "success_metrics")
+
+def structured_idea(item: Dict[str, Any]) -> Dict[str, str]:
+    """An idea object decoded from a JSON response, with every idea field present as a string"""
+    return {field: str(item.get(field) or "").strip() for field in IDEA_FIELDS}
+
+def collect_stream(stream, on_delta: Optional[Callable[[int, str], None]] = None):
+    """Read a streamed completion into the shape of a non-streamed one (choices[i].message.content, usage),
+    passing each content delta and its choice index to on_delta as it arrives"""
+    contents: Dict[int, List[str]] = {}
+    usage = None
+    for chunk in stream:
+        usage = getattr(chunk, "usage", None) or usage
+        for choice in chunk.choices:
+            delta = choice.delta.content
+            if delta:
+                contents.setdefault(choice.index, []).append(delta)
+                if on_delta is not None:
+                    on_delta(choice.index, delta)
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content="".join(contents[index]))) for index in sorted(contents)],
+        usage=usage
+    )
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds the API asked us to wait before retrying, if it said"""
+    try:
+        return float(error.response.headers.get("retry-after"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+def _new_request_id(prefix: str) -> str:
+    """Unique request id; the timestamp alone collides across concurrent sessions"""
+    return f"{prefix}_{int(time.time())}_{uuid.uuid4().hex[:8]}"
+
+def parse_generated_ideas(content: str) -> List[Dict[str, str]]:
+    """Parse generated content into structured business ideas (module level, so worker processes can run it)"""
+    ideas = []
+    current_idea = {}
+    
+    lines = content.split('\n')
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        
+        if line.startswith('##') and 'Business Idea' in line:
+            if current_idea:
+                ideas.append(current_idea)
+            current_idea = {
+                'name': line.replace('##', '').replace('Business Idea', '').strip(),
+                'problem': '', 'solution': '', 'target_market': '',
+                'revenue_model': '', 'competitive_edge': '', 'implementation': '', 'success_metrics': ''
+            }
+        elif line.startswith('**Problem:**'):
+            current_idea['problem'] = line.replace('**Problem:**', '').strip()
+        elif line.startswith('**Solution:**'):
+            current_idea['solution'] = line.replace('**Solution:**', '').strip()
+        # Add more parsing logic as needed
+    
+    if current_idea:
+        ideas.append(current_idea)
+    
+    return ideas
+
 class BusinessIdeaGenerator:
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize with OpenAI API key"""
+    def __init__(self, api_key: Optional[str] = None, duplicate_index=None, drop_duplicates: bool = False,
+                 response_cache=None, worker_pool=None, request_timeout: Optional[float] = None,
+                 hedger=None, router=None, key_pool=None, cassette=None):
+        """Initialize with OpenAI API key (and optionally shared NearDuplicateIndex, SimilarityRequestCache,
+        WorkerPool, Hedger, ModelRouter, KeyPool and Cassette instances; passing a Hedger opts in to
+        hedged API calls, a KeyPool's keys are used instead of api_key, and a Cassette records API
+        responses or replays them without network access)"""
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self.duplicate_index = duplicate_index
+        self.drop_duplicates = drop_duplicates
+        self.response_cache = response_cache
+        self.worker_pool = worker_pool
+        self.request_timeout = request_timeout or DEFAULT_REQUEST_TIMEOUT
+        self.hedger = hedger
+        self.router = router
+        self.key_pool = key_pool
+        self.cassette = cassette
         
-        if OPENAI_AVAILABLE and self.api_key:
+        if OPENAI_AVAILABLE and key_pool is not None:
+            # One client per key; the first one also names the endpoint for circuit breakers
+            self._clients = {key: OpenAI(api_key=key) for key in key_pool.keys()}
+            self.client = next(iter(self._clients.values()))
+            self.mock_mode = False
+        elif OPENAI_AVAILABLE and self.api_key:
             self.client = OpenAI(api_key=self.api_key)
             self.mock_mode = False
         else:
@@ -54,44 +237,100 @@ class BusinessIdeaGenerator:
             self.mock_mode = True
             if not OPENAI_AVAILABLE:
                 logger.warning("OpenAI not available - running in mock mode")
+        if cassette is not None and cassette.replaying:
+            # Replayed responses need neither a key nor a network
+            self.mock_mode = False
         
         self.prompt_engineer = PromptEngineer()
         self.generation_history = []
     
     def generate_ideas(self, request: BusinessIdeaRequest, 
                       technique: str = "chain_of_thought",
-                      model: str = "gpt-3.5-turbo") -> Dict[str, Any]:
-        """Generate business ideas using OpenAI or mock data"""
+                      model: str = DEFAULT_MODEL,
+                      allow_cached: bool = True,
+                      slo_seconds: Optional[float] = None,
+                      variants: int = 1,
+                      structured: bool = False,
+                      on_idea: Optional[Callable[[Dict[str, str]], None]] = None) -> Dict[str, Any]:
+        """Generate business ideas using OpenAI or mock data
+        
+        With allow_cached, a result of a similar earlier request may be served instead of
+        calling the API; such results carry "cache_hit". With a router, model may be AUTO_MODEL
+        (the router picks one meeting slo_seconds within budget), and a throttled model falls
+        back to the next candidate. variants > 1 asks for that many completions of the prompt
+        in one call (paying for the prompt once) and merges their ideas without near-duplicates.
+        structured asks for JSON ideas (the API's JSON response format) instead of markdown; with
+        on_idea as well, the response is streamed and each idea is passed to on_idea as soon as
+        it is complete.
+        """
+        max_tokens = completion_tokens_for(IDEAS_PER_REQUEST) if completion_tokens_for else 2000
         
         if self.mock_mode:
-            return self._generate_mock_ideas(request, technique, model)
+            model = self._route(model, "", max_tokens, slo_seconds)[0]
+            return self._flag_duplicates(self._generate_mock_ideas(request, technique, model))
+        
+        # A cached result holds the ideas of a single completion
+        use_cache = self.response_cache is not None and variants == 1
+        # Results are cached under the model that generated them (model_used, as in the history the
+        # cache is warmed from); an AUTO_MODEL request looks up the model it is routed to
+        cache_model = model
         
         try:
             # Generate context-aware prompt
             prompt = self.prompt_engineer.generate_context_aware_prompt(request, technique)
-            prompt = self.prompt_engineer.validate_and_refine_prompt(prompt)
+            prompt = self.prompt_engineer.validate_and_refine_prompt(prompt, structured=structured)
+            candidates = self._route(model, prompt, max_tokens, slo_seconds, variants)
+            cache_model = candidates[0]
+            
+            if allow_cached and use_cache:
+                cached = self.response_cache.serve(request, technique, cache_model, _new_request_id("req"))
+                if cached is not None:
+                    # Its ideas were already checked for duplicates when first generated
+                    logger.info(f"Serving {cached['request_id']} from cached {cached['cache_hit']['request_id']}")
+                    self._record(cached)
+                    return cached
+            
+            params = {}
+            on_delta = None
+            if structured:
+                params["response_format"] = {"type": "json_object"}
+                if on_idea is not None and ItemStreamDecoder is not None:
+                    params.update(stream=True, stream_options={"include_usage": True})
+                    decoders: Dict[int, ItemStreamDecoder] = {}
+                    
+                    def on_delta(index: int, delta: str):
+                        for item in decoders.setdefault(index, ItemStreamDecoder()).feed(delta):
+                            on_idea(structured_idea(item))
             
             logger.info(f"Generating ideas using {technique} for {request.industry}")
             
             # Call OpenAI API
-            response = self.client.chat.completions.create(
-                model=model,
+            response, model_used = self._complete_routed(
+                candidates,
                 messages=[
                     {"role": "system", "content": "You are an expert business consultant with 20+ years of experience."},
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=2000,
+                max_tokens=max_tokens,
                 temperature=0.8,
                 top_p=0.9,
                 frequency_penalty=0.3,
-                presence_penalty=0.3
+                presence_penalty=0.3,
+                n=variants,
+                on_delta=on_delta,
+                slo_seconds=slo_seconds,
+                **params
             )
             
-            generated_content = response.choices[0].message.content.strip()
-            structured_ideas = self._parse_generated_ideas(generated_content)
+            contents = [choice.message.content.strip() for choice in response.choices]
+            generated_content = "\n\n".join(contents)
+            structured_ideas = self._parse_generated_ideas(contents[0], structured) if len(contents) == 1 \
+                else self._parse_variants(contents, structured)
+            if not structured_ideas:
+                raise ValueError("No ideas could be parsed from the response")
             
             result = {
-                "request_id": f"req_{int(time.time())}",
+                "request_id": _new_request_id("req"),
                 "timestamp": datetime.now().isoformat(),
                 "input_parameters": {
                     "industry": request.industry,
@@ -104,17 +343,243 @@ class BusinessIdeaGenerator:
                 },
                 "generated_ideas": structured_ideas,
                 "raw_response": generated_content,
-                "model_used": model,
+                "model_used": model_used,
                 "technique_used": technique
             }
+            if len(contents) > 1:
+                result["variants"] = len(contents)
             
-            self.generation_history.append(result)
+            self._flag_duplicates(result)
+            if use_cache:
+                self.response_cache.store(request, technique, model_used, result)
+            self._record(result)
             return result
             
+        except CircuitOpenError as e:
+            # Fail fast: a similar cached result (even if not asked for) beats demo ideas
+            logger.warning(f"{e}; skipping the API call")
+            cached = self.response_cache.serve(request, technique, cache_model, _new_request_id("req")) \
+                if self.response_cache is not None else None
+            if cached is not None:
+                self._record(cached)
+                return cached
+            return self._flag_duplicates(self._generate_mock_ideas(request, technique, model))
+            
         except Exception as e:
             logger.error(f"Error generating ideas: {e}")
             # Fallback to mock mode
-            return self._generate_mock_ideas(request, technique, model)
+            return self._flag_duplicates(self._generate_mock_ideas(request, technique, model))
+    
+    def regenerate_idea(self, results: Dict[str, Any], index: int, model: Optional[str] = None) -> Dict[str, Any]:
+        """Copy of results with idea index (0-based) replaced by a new one, and revision bumped
+        
+        The prompt holds only the request parameters and the names of the result's ideas (to
+        avoid), and asks for exactly one idea, so it costs a fraction of a full generation.
+        """
+        params = results.get("input_parameters", {})
+        ideas = results["generated_ideas"]
+        avoid_names = [idea.get("name", "") for idea in ideas]
+        model = model or results.get("model_used") or DEFAULT_MODEL
+        
+        replacement = None
+        if not self.mock_mode:
+            max_tokens = completion_tokens_for(1) if completion_tokens_for else 500
+            try:
+                prompt = self.prompt_engineer.generate_replacement_prompt(params, avoid_names)
+                response, _ = self._complete_routed(
+                    self._route(model, prompt, max_tokens, None),
+                    messages=[
+                        {"role": "system", "content": "You are an expert business consultant with 20+ years of experience."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=max_tokens,
+                    temperature=0.9,
+                    response_format={"type": "json_object"}
+                )
+                parsed = self._parse_content(response.choices[0].message.content.strip(), structured=True)
+                replacement = parsed[0] if parsed else None
+            except Exception as e:
+                logger.error(f"Error regenerating idea: {e}")
+        if replacement is None:
+            replacement = self._mock_replacement(params, avoid_names, results.get("revision", 0) + 1)
+        
+        updated = dict(results)
+        updated["generated_ideas"] = ideas[:index] + [replacement] + ideas[index + 1:]
+        updated["revision"] = results.get("revision", 0) + 1
+        if self.duplicate_index is not None:
+            # The replaced idea is no longer shown, so later ideas must not be flagged as repeating it
+            self.duplicate_index.remove((results.get("request_id", ""), ideas[index].get("name", "")))
+            # Only the new idea is checked; its siblings are indexed already
+            self.duplicate_index.flag_duplicates({"request_id": results.get("request_id", ""), "generated_ideas": [replacement]})
+            updated["duplicates_found"] = sum(1 for idea in updated["generated_ideas"] if idea.get("duplicate_of"))
+        
+        for position in range(len(self.generation_history) - 1, -1, -1):
+            if self.generation_history[position]["request_id"] == updated.get("request_id"):
+                self.generation_history[position] = GenerationResult.from_dict(updated) if GenerationResult else updated
+                break
+        return updated
+    
+    def _mock_replacement(self, params: Dict[str, Any], avoid_names: List[str], revision: int) -> Dict[str, str]:
+        """Demo idea not named like any in avoid_names"""
+        request = SimpleNamespace(**{
+            key: params.get(key, "") for key in
+            ("industry", "target_audience", "market_trends", "budget_range", "geographical_focus", "innovation_level")
+        })
+        candidates = self._generate_mock_ideas(request, "", "")["generated_ideas"]
+        for idea in candidates:
+            if idea["name"] not in avoid_names:
+                return idea
+        idea = candidates[revision % len(candidates)]
+        return dict(idea, name=f"{idea['name']} (Take {revision + 1})")
+    
+    def _route(self, model: str, prompt: str, max_tokens: int, slo_seconds: Optional[float],
+               completions: int = 1) -> List[str]:
+        """Models to try for a request, in order"""
+        if self.router is None:
+            return [DEFAULT_MODEL if model == AUTO_MODEL else model]
+        return self.router.candidates(
+            estimate_tokens(prompt), max_tokens,
+            preferred=None if model == AUTO_MODEL else model, slo_seconds=slo_seconds, completions=completions
+        )
+    
+    def _complete_routed(self, models: List[str], messages: List[Dict[str, str]],
+                         on_delta: Optional[Callable[[int, str], None]] = None,
+                         slo_seconds: Optional[float] = None, **params):
+        """Completion from the first of models that is not throttled or circuit-open; returns (response, model)"""
+        for position, model in enumerate(models):
+            started = time.monotonic()
+            try:
+                response = self._create_completion(model, messages, on_delta=on_delta, slo_seconds=slo_seconds, **params)
+            except (openai.RateLimitError, CircuitOpenError) as e:
+                if isinstance(e, openai.RateLimitError) and self.router is not None:
+                    self.router.mark_throttled(model, _retry_after(e))
+                if position == len(models) - 1:
+                    raise
+                logger.warning(f"{model} unavailable ({type(e).__name__}); falling back to {models[position + 1]}")
+                continue
+            if self.router is not None:
+                # Completions of one call are generated in parallel; throughput is per completion
+                usage = getattr(response, "usage", None)
+                completion_tokens = (getattr(usage, "completion_tokens", 0) or 0) // params.get("n", 1)
+                self.router.record(model, time.monotonic() - started, completion_tokens)
+            return response, model
+    
+    def _create_completion(self, model: str, messages: List[Dict[str, str]], timeout: Optional[float] = None,
+                           on_delta: Optional[Callable[[int, str], None]] = None,
+                           slo_seconds: Optional[float] = None, **params):
+        """Chat completion through the model's circuit breaker, abandoned after timeout seconds
+        (default: the latency SLO or request timeout, sooner for a model predicted to need less)
+        and counted as slow by the breaker beyond the SLO (default: half the request timeout)
+        
+        A streamed completion is read to the end (see collect_stream) inside the breaker, so its
+        whole duration counts towards the deadline, slow-call and routing statistics.
+        Raises CircuitOpenError without calling the API while the circuit is open.
+        """
+        predicted = self.router.max_latency(model, params.get("max_tokens") or 0) if self.router is not None else None
+        limit = slo_seconds or self.request_timeout
+        timeout = timeout or (min(limit, DEADLINE_LATENCY_FACTOR * predicted) if predicted else limit)
+        slow_call_seconds = min(slo_seconds or self.request_timeout / 2, timeout)
+        # Client retries would multiply the deadline; the breaker and fallbacks handle failures
+        client = self.client.with_options(timeout=timeout, max_retries=0) if self.client is not None else None
+        
+        def send():
+            if self.key_pool is not None:
+                return self._create_with_pool(timeout, model=model, messages=messages, **params)
+            return client.chat.completions.create(model=model, messages=messages, **params)
+        
+        def attempt(first_token: Optional[Callable[[], bool]] = None):
+            # Replay stands in for the network only, so breakers, hedging and routing still run
+            if self.cassette is not None:
+                response = self.cassette.call(dict(params, model=model, messages=messages), send)
+            else:
+                response = send()
+            if not params.get("stream"):
+                return response
+            deltas = on_delta
+            if first_token is not None:
+                # Of hedged attempts, only the first to get a token passes its deltas on
+                passes_on: List[bool] = []
+                
+                def deltas(index: int, delta: str):
+                    if not passes_on:
+                        passes_on.append(first_token())
+                    if passes_on[0] and on_delta is not None:
+                        on_delta(index, delta)
+            return collect_stream(response, deltas)
+        
+        def create():
+            # A slow call gets an identical backup (a streamed one when slow to its first token);
+            # the breaker sees the hedged call as one
+            if self.hedger is None:
+                return attempt()
+            return self.hedger.call(model, attempt, streamed=bool(params.get("stream")))
+        
+        if get_circuit_breaker is None:
+            return create()
+        endpoint = self.client.base_url if self.client is not None else "cassette"
+        breaker = get_circuit_breaker(f"{model}@{endpoint}")
+        return breaker.call(create, is_failure=_is_upstream_failure, slow_call_seconds=slow_call_seconds)
+    
+    def _create_with_pool(self, timeout: float, **request):
+        """Create a completion with the pool key that has the most headroom, moving on to the next
+        key when one is refused, out of quota or rate limited"""
+        prompt = "".join(message["content"] for message in request["messages"])
+        estimated_tokens = (estimate_tokens(prompt) if estimate_tokens is not None else 0) \
+            + request.get("max_tokens", 0) * request.get("n", 1)
+        last_error = None
+        for _ in range(len(self.key_pool)):
+            ticket = self.key_pool.acquire(estimated_tokens)
+            key = ticket.key
+            client = self._clients[key].with_options(timeout=timeout, max_retries=0)
+            try:
+                response = client.chat.completions.create(**request)
+            except (openai.AuthenticationError, openai.PermissionDeniedError, openai.RateLimitError) as e:
+                # A refused call used no tokens
+                self.key_pool.record_tokens(ticket, 0)
+                if isinstance(e, openai.RateLimitError):
+                    if getattr(e, "code", None) == "insufficient_quota":
+                        self.key_pool.exhaust(key)
+                    else:
+                        self.key_pool.cool_down(key, _retry_after(e))
+                else:
+                    self.key_pool.reject(key, f"refused by the API ({e.status_code})")
+                last_error = e
+            except Exception:
+                # Failed calls (timeouts, server errors) are billed nothing either; the breaker handles them
+                self.key_pool.record_tokens(ticket, 0)
+                raise
+            else:
+                if request.get("stream"):
+                    return self._metered_stream(response, ticket)
+                usage = getattr(response, "usage", None)
+                if usage is not None:
+                    self.key_pool.record_tokens(ticket, usage.total_tokens)
+                return response
+        raise last_error
+    
+    def _metered_stream(self, stream, ticket):
+        """Pass a stream through, correcting its key pool ticket's token estimate from its final usage chunk"""
+        usage = None
+        try:
+            for chunk in stream:
+                usage = getattr(chunk, "usage", None) or usage
+                yield chunk
+        finally:
+            # A stream cut short reports no usage; its estimate stands
+            if usage is not None:
+                self.key_pool.record_tokens(ticket, usage.total_tokens)
+    
+    def _record(self, result: Dict[str, Any]):
+        """Keep a result in generation_history (in compact form when available)"""
+        self.generation_history.append(GenerationResult.from_dict(result) if GenerationResult else result)
+    
+    def _flag_duplicates(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Flag (or drop) ideas that repeat earlier ones, before they are stored or rendered"""
+        if self.duplicate_index is not None:
+            duplicates = self.duplicate_index.flag_duplicates(result, drop=self.drop_duplicates)
+            if duplicates:
+                logger.info(f"{duplicates} near-duplicate idea(s) in {result['request_id']}")
+        return result
     
     def _generate_mock_ideas(self, request: BusinessIdeaRequest, technique: str, model: str) -> Dict[str, Any]:
         """Generate mock business ideas for demo/testing"""
@@ -153,7 +618,7 @@ class BusinessIdeaGenerator:
         ]
         
         return {
-            "request_id": f"mock_{int(time.time())}",
+            "request_id": _new_request_id("mock"),
             "timestamp": datetime.now().isoformat(),
             "input_parameters": {
                 "industry": request.industry,
@@ -170,32 +635,66 @@ class BusinessIdeaGenerator:
             "mock_mode": True
         }
     
-    def _parse_generated_ideas(self, content: str) -> List[Dict[str, str]]:
+    def _parse_content(self, content: str, structured: bool = False) -> List[Dict[str, str]]:
+        if structured and decode_items is not None:
+            ideas = [structured_idea(item) for item in decode_items(content)]
+            if ideas:
+                return ideas
+            # Not JSON after all; the markdown parser may still find ideas
+        if self.worker_pool is not None and len(content) >= PARSE_IN_POOL_MIN_CHARS:
+            return self.worker_pool.run(parse_generated_ideas, content)
+        return parse_generated_ideas(content)
+    
+    def _parse_generated_ideas(self, content: str, structured: bool = False) -> List[Dict[str, str]]:
         """Parse generated content into structured business ideas"""
-        ideas = []
-        current_idea = {}
-        
-        lines = content.split('\n')
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            if line.startswith('##') and 'Business Idea' in line:
-                if current_idea:
-                    ideas.append(current_idea)
-                current_idea = {
-                    'name': line.replace('##', '').replace('Business Idea', '').strip(),
-                    'problem': '', 'solution': '', 'target_market': '',
-                    'revenue_model': '', 'competitive_edge': '', 'implementation': '', 'success_metrics': ''
-                }
-            elif line.startswith('**Problem:**'):
-                current_idea['problem'] = line.replace('**Problem:**', '').strip()
-            elif line.startswith('**Solution:**'):
-                current_idea['solution'] = line.replace('**Solution:**', '').strip()
-            # Add more parsing logic as needed
-        
-        if current_idea:
-            ideas.append(current_idea)
-        
-        return ideas if ideas else self._generate_mock_ideas(None, "", "")["generated_ideas"]
\ No newline at end of file
+        return self._parse_content(content, structured)
+    
+    def _parse_variants(self, contents: List[str], structured: bool = False) -> List[Dict[str, str]]:
+        """Parse every completion of a variants call, keeping ideas that do not repeat an earlier one"""
+        parsed = [self._parse_content(content, structured) for content in contents]
+        if merge_variant_ideas is not None:
+            ideas = merge_variant_ideas(parsed)
+        else:
+            ideas = [idea for variant in parsed for idea in variant]
+        return ideas
+
+def generator_for_job(payload: Dict[str, Any], **resources) -> BusinessIdeaGenerator:
+    """Generator for a job queued by a session this process does not have (the job was reclaimed
+    after a restart, or claimed by a standalone worker), from the job's credentials reference
+
+    Raises MissingCredentialsError when the job's key was typed into its session; such jobs fail
+    rather than silently returning mock ideas.
+    """
+    credentials = payload.get("credentials", CREDENTIALS_SESSION)
+    if credentials == CREDENTIALS_CASSETTE and get_cassette is not None and get_cassette() is not None:
+        return BusinessIdeaGenerator(cassette=get_cassette(), **resources)
+    if credentials == CREDENTIALS_KEY_POOL and get_key_pool is not None and get_key_pool() is not None:
+        return BusinessIdeaGenerator(key_pool=get_key_pool(), **resources)
+    if credentials == CREDENTIALS_ENVIRONMENT and os.getenv("OPENAI_API_KEY"):
+        return BusinessIdeaGenerator(os.getenv("OPENAI_API_KEY"), **resources)
+    raise MissingCredentialsError(
+        f"No API access for this job in this worker (credentials: {credentials}); "
+        f"the session that queued it has ended, please generate again"
+    )
+
+def run_generation_job(payload: Dict[str, Any], generator: Optional[BusinessIdeaGenerator] = None,
+                       on_idea: Optional[Callable[[Dict[str, str]], None]] = None) -> Dict[str, Any]:
+    """Job queue handler: rebuild the request from its JSON payload and generate ideas
+    (a structured generation passes each idea to on_idea as it streams in)"""
+    generator = generator or generator_for_job(payload)
+    request = BusinessIdeaRequest(**payload["request"])
+    return generator.generate_ideas(
+        request,
+        technique=payload.get("technique", "chain_of_thought"),
+        model=payload.get("model", DEFAULT_MODEL),
+        allow_cached=payload.get("allow_cached", True),
+        slo_seconds=payload.get("slo_seconds"),
+        variants=payload.get("variants", 1),
+        structured=payload.get("structured", False),
+        on_idea=on_idea
+    )
+
+def run_regeneration_job(payload: Dict[str, Any], generator: Optional[BusinessIdeaGenerator] = None) -> Dict[str, Any]:
+    """Job queue handler: replace one idea of a result (payload: results, index, optional model)"""
+    generator = generator or generator_for_job(payload)
+    return generator.regenerate_idea(payload["results"], payload["index"], model=payload.get("model"))
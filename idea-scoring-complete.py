@@ -0,0 +1,142 @@
+# src/business_idea_creator/utils/idea_scoring.py
+"""
+Idea scoring and ranking for Business Idea Creator
+Ideas are turned into a feature matrix and scored as a batch with NumPy
+"""
+
+import math
+import re
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    from .history_store import IDEA_FIELDS
+    from .knowledge_base import KnowledgeBase, get_knowledge_base
+except ImportError:
+    from history_store import IDEA_FIELDS
+    from knowledge_base import KnowledgeBase, get_knowledge_base
+
+FEATURES = ["trend_coverage", "budget_fit", "completeness"]
+DEFAULT_WEIGHTS = {"trend_coverage": 0.45, "budget_fit": 0.2, "completeness": 0.35}
+
+# Sidebar budget range -> (low, high) in dollars; None means no budget constraint
+BUDGET_BOUNDS = {
+    "Under $10K": (1e3, 1e4),
+    "$10K - $50K": (1e4, 5e4),
+    "$50K - $100K": (5e4, 1e5),
+    "$100K - $500K": (1e5, 5e5),
+    "$500K - $1M": (5e5, 1e6),
+    "$1M - $5M": (1e6, 5e6),
+    "Over $5M": (5e6, 5e7),
+    "Seeking Investment": None
+}
+
+# Fields searched for trend mentions
+TREND_TEXT_FIELDS = ("name", "problem", "solution", "competitive_edge")
+# Characters at which a field counts as fully written (name is short by nature)
+FIELD_TARGET_LENGTHS = np.array([10.0 if field == "name" else 120.0 for field in IDEA_FIELDS])
+# Requested trends count double towards coverage
+REQUESTED_TREND_BOOST = 2.0
+
+# Results with fewer ideas score faster in-process than the round trip to a worker costs
+SCORE_IN_POOL_MIN_IDEAS = 500
+
+# Without explicit amounts, startup cost is estimated from capital-heavy vs lean wording
+HEAVY_TERMS = re.compile(r"\b(hardware|manufactur\w*|factor(?:y|ies)|fleet|robot\w*|infrastructure|"
+                         r"satellite|clinical trials?|warehouse\w*|physical stores?|facility|facilities|devices?)\b")
+LEAN_TERMS = re.compile(r"\b(app|apps|platform|marketplace|saas|subscription|online|software|digital|"
+                        r"newsletter|community|consulting|service)\b")
+AMOUNT_PATTERN = re.compile(r"\$\s?(\d+(?:[.,]\d+)?)\s?(k|m|b|thousand|million|billion)?\b", re.IGNORECASE)
+AMOUNT_MULTIPLIERS = {"k": 1e3, "thousand": 1e3, "m": 1e6, "million": 1e6, "b": 1e9, "billion": 1e9}
+
+def _largest_amount(text: str) -> float:
+    """Largest dollar amount mentioned in text, or NaN"""
+    amounts = [
+        float(number.replace(",", "")) * AMOUNT_MULTIPLIERS.get((unit or "").lower(), 1.0)
+        for number, unit in AMOUNT_PATTERN.findall(text)
+    ]
+    return max(amounts) if amounts else math.nan
+
+class IdeaScorer:
+    def __init__(self, knowledge_base: Optional[KnowledgeBase] = None, weights: Optional[Dict[str, float]] = None):
+        """Score ideas against the trend catalog of a knowledge base snapshot"""
+        self.knowledge_base = knowledge_base or get_knowledge_base()
+        weights = weights or DEFAULT_WEIGHTS
+        self.weights = np.array([weights.get(feature, 0.0) for feature in FEATURES])
+
+        trends = self.knowledge_base.trends
+        self._trend_names = [trend["trend"] for trend in trends]
+        self._trend_columns = {name: column for column, name in enumerate(self._trend_names)}
+        self._trend_weights = np.array([trend["growth_rate"] * trend["relevance_score"] for trend in trends])
+
+    def features(self, ideas: Sequence[Dict[str, Any]], budget_range: Optional[str] = None,
+                 requested_trends: Optional[List[str]] = None) -> np.ndarray:
+        """Feature matrix of shape (len(ideas), len(FEATURES)), each feature in [0, 1]"""
+        n = len(ideas)
+        matcher = self.knowledge_base.trend_matcher
+
+        # Text extraction is per idea; everything after is array arithmetic over the batch
+        mentions = np.zeros((n, len(self._trend_names)), dtype=np.float32)
+        lengths = np.empty((n, len(IDEA_FIELDS)), dtype=np.float32)
+        amounts = np.full(n, np.nan)
+        heavy = np.zeros(n, dtype=np.float32)
+        lean = np.zeros(n, dtype=np.float32)
+        for row, idea in enumerate(ideas):
+            trend_text = " ".join(str(idea.get(field) or "") for field in TREND_TEXT_FIELDS)
+            for name in matcher.find_in_text(trend_text):
+                mentions[row, self._trend_columns[name]] = 1.0
+            lengths[row] = [len(str(idea.get(field) or "").strip()) for field in IDEA_FIELDS]
+            cost_text = f"{idea.get('implementation') or ''} {idea.get('solution') or ''}".lower()
+            amounts[row] = _largest_amount(cost_text)
+            heavy[row] = len(HEAVY_TERMS.findall(cost_text))
+            lean[row] = len(LEAN_TERMS.findall(cost_text))
+
+        # Trend coverage: growth x relevance of mentioned trends, requested ones boosted, saturating to [0, 1)
+        trend_weights = self._trend_weights.copy()
+        for requested in requested_trends or []:
+            match = matcher.best_match(requested)
+            if match is not None:
+                trend_weights[self._trend_columns[match[0]["trend"]]] *= REQUESTED_TREND_BOOST
+        covered = mentions @ trend_weights
+        trend_coverage = covered / (covered + self._trend_weights.mean()) if len(trend_weights) else np.zeros(n)
+
+        # Budget fit: distance (in orders of magnitude) between estimated cost and the budget range
+        bounds = BUDGET_BOUNDS.get(budget_range or "")
+        if bounds is None:
+            budget_fit = np.full(n, 0.5)
+        else:
+            estimated = np.where(np.isnan(amounts), 10 ** np.clip(4.5 + 0.75 * (heavy - lean), 3.0, 8.0), amounts)
+            low, high = np.log10(bounds[0]), np.log10(bounds[1])
+            log_cost = np.log10(np.maximum(estimated, 1.0))
+            distance = np.maximum(low - log_cost, 0) + np.maximum(log_cost - high, 0)
+            budget_fit = np.exp(-distance)
+
+        completeness = np.minimum(lengths / FIELD_TARGET_LENGTHS, 1.0).mean(axis=1)
+
+        return np.column_stack([trend_coverage, budget_fit, completeness])
+
+    def score(self, ideas: Sequence[Dict[str, Any]], budget_range: Optional[str] = None,
+              requested_trends: Optional[List[str]] = None) -> np.ndarray:
+        """Weighted score per idea, in [0, 1]"""
+        if not len(ideas):
+            return np.zeros(0)
+        return self.features(ideas, budget_range, requested_trends) @ self.weights / self.weights.sum()
+
+    def score_results(self, results: Dict[str, Any]) -> np.ndarray:
+        """Scores for the ideas of a generation result, using its request parameters"""
+        params = results.get("input_parameters", {})
+        return self.score(results.get("generated_ideas", []), params.get("budget_range"), params.get("market_trends"))
+
+def score_result(results: Dict[str, Any]) -> List[float]:
+    """Scores for a generation result with the current knowledge base (picklable, for worker processes)"""
+    return IdeaScorer().score_results(results).tolist()
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first (argpartition, then sort only those k)"""
+    scores = np.asarray(scores)
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.zeros(0, dtype=np.int64)
+    candidates = np.argpartition(-scores, k - 1)[:k] if k < len(scores) else np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
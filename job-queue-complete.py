@@ -0,0 +1,370 @@
+# src/business_idea_creator/utils/job_queue.py
+"""
+Persistent background job queue for Business Idea Creator
+SQLite-backed so queued generations survive Streamlit reruns and restarts
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+class JobQueue:
+    def __init__(self, db_path: str, num_workers: int = 2,
+                 lease_seconds: float = 300.0, max_attempts: int = 3,
+                 poll_interval: float = 1.0):
+        """Open (or create) the job database at db_path
+
+        Running jobs keep their lease while their worker's queue heartbeats (every third of
+        lease_seconds); a job whose queue stopped heartbeating is claimed again.
+        """
+        self.db_path = db_path
+        self.num_workers = num_workers
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+
+        self._handlers: Dict[str, Callable[[Dict[str, Any], Any], Any]] = {}
+        # Transient per-job objects (e.g. a session's generator) - never persisted
+        self._contexts: Dict[str, Any] = {}
+        # Identifies this queue to the other processes sharing the database, for pinned jobs
+        self.instance_id = uuid.uuid4().hex
+        self._running: Set[str] = set()
+        self._running_lock = threading.Lock()
+        self._local = threading.local()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._workers: List[threading.Thread] = []
+
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection (sqlite3 connections are per-thread)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self):
+        """Create the jobs table and indexes"""
+        conn = self._connect()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                status TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                result TEXT,
+                error TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                lease_expires REAL,
+                progress TEXT,
+                pinned_to TEXT
+            )
+        """)
+        # Databases created before jobs reported progress or could be pinned
+        columns = {column["name"] for column in conn.execute("PRAGMA table_info(jobs)")}
+        for column in ("progress", "pinned_to"):
+            if column not in columns:
+                conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} TEXT")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at)")
+        conn.execute("CREATE TABLE IF NOT EXISTS queue_instances (id TEXT PRIMARY KEY, seen_at REAL NOT NULL)")
+
+    def register(self, kind: str, handler: Callable[[Dict[str, Any], Any], Any]):
+        """Register handler(payload, context) for a job kind"""
+        self._handlers[kind] = handler
+
+    def start(self):
+        """Start the background worker threads (idempotent)"""
+        if self._workers:
+            return
+        self._stop.clear()
+        self._heartbeat()
+        heartbeat = threading.Thread(target=self._heartbeat_loop, name="job-heartbeat", daemon=True)
+        heartbeat.start()
+        self._workers.append(heartbeat)
+        for i in range(self.num_workers):
+            worker = threading.Thread(target=self._worker_loop, name=f"job-worker-{i}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+        logger.info(f"Job queue started with {self.num_workers} workers on {self.db_path}")
+
+    def stop(self, timeout: float = 5.0):
+        """Signal workers to stop and wait for them"""
+        self._stop.set()
+        self._wakeup.set()
+        for worker in self._workers:
+            worker.join(timeout)
+        self._workers = []
+        # Jobs pinned to this queue can be claimed elsewhere right away
+        self._connect().execute("DELETE FROM queue_instances WHERE id = ?", (self.instance_id,))
+
+    def enqueue(self, kind: str, payload: Dict[str, Any], context: Any = None, pinned: bool = False) -> str:
+        """Persist a new job and return its id
+
+        A pinned job (one that needs its context, which exists only here) is claimed only by
+        this queue while it is running; once it stops, any queue may claim it.
+        """
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        if context is not None:
+            self._contexts[job_id] = context
+        self._connect().execute(
+            "INSERT INTO jobs (id, kind, status, payload, created_at, updated_at, pinned_to) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (job_id, kind, JOB_QUEUED, json.dumps(payload, default=str), now, now,
+             self.instance_id if pinned else None)
+        )
+        self._wakeup.set()
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the job as a dict, or None if unknown"""
+        row = self._connect().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        job["progress"] = json.loads(job["progress"]) if job["progress"] else None
+        return job
+
+    def report_progress(self, progress: Any):
+        """Record the progress of the job running on this thread, for get() to return while it runs"""
+        job_id = getattr(self._local, "job_id", None)
+        if job_id is None:
+            return
+        self._connect().execute(
+            "UPDATE jobs SET progress = ? WHERE id = ?", (json.dumps(progress, default=str), job_id)
+        )
+
+    def purge_finished(self, max_age_seconds: float = 7 * 24 * 3600) -> int:
+        """Delete finished jobs older than max_age_seconds"""
+        cursor = self._connect().execute(
+            "DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+            (JOB_DONE, JOB_FAILED, time.time() - max_age_seconds)
+        )
+        return cursor.rowcount
+
+    def _claim_next(self) -> Optional[Dict[str, Any]]:
+        """Atomically claim the oldest queued job, or one whose lease expired"""
+        kinds = list(self._handlers)
+        if not kinds:
+            return None
+        # Only claim kinds this process can run, so separate worker pools can share the database
+        kind_placeholders = ", ".join("?" * len(kinds))
+        conn = self._connect()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Jobs pinned to another queue wait until that queue stops heartbeating
+            row = conn.execute(
+                "SELECT id, kind, payload, attempts FROM jobs "
+                f"WHERE (status = ? OR (status = ? AND lease_expires < ?)) AND kind IN ({kind_placeholders}) "
+                "AND (pinned_to IS NULL OR pinned_to = ? OR pinned_to NOT IN "
+                "(SELECT id FROM queue_instances WHERE seen_at >= ?)) "
+                "ORDER BY created_at LIMIT 1",
+                (JOB_QUEUED, JOB_RUNNING, now, *kinds, self.instance_id, now - self.lease_seconds)
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            # A retried job starts over, so progress of an earlier attempt no longer applies
+            conn.execute(
+                "UPDATE jobs SET status = ?, attempts = attempts + 1, updated_at = ?, lease_expires = ?, "
+                "progress = NULL WHERE id = ?",
+                (JOB_RUNNING, now, now + self.lease_seconds, row["id"])
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        job["attempts"] += 1
+        return job
+
+    def _finish(self, job_id: str, status: str, result: Any = None, error: Optional[str] = None):
+        """Record the final state of a job"""
+        self._connect().execute(
+            "UPDATE jobs SET status = ?, result = ?, error = ?, updated_at = ?, lease_expires = NULL WHERE id = ?",
+            (status, json.dumps(result, default=str) if result is not None else None,
+             error, time.time(), job_id)
+        )
+        self._contexts.pop(job_id, None)
+
+    def _heartbeat(self):
+        """Mark this queue alive and extend the leases of the jobs it is running"""
+        now = time.time()
+        conn = self._connect()
+        conn.execute("INSERT OR REPLACE INTO queue_instances (id, seen_at) VALUES (?, ?)", (self.instance_id, now))
+        with self._running_lock:
+            running = list(self._running)
+        if running:
+            conn.execute(
+                f"UPDATE jobs SET lease_expires = ? WHERE status = ? AND id IN ({', '.join('?' * len(running))})",
+                (now + self.lease_seconds, JOB_RUNNING, *running)
+            )
+
+    def _heartbeat_loop(self):
+        """Heartbeat every third of the lease until stopped"""
+        while not self._stop.wait(self.lease_seconds / 3):
+            try:
+                self._heartbeat()
+            except sqlite3.OperationalError as e:
+                logger.warning(f"Job queue heartbeat failed, retrying: {e}")
+
+    def _worker_loop(self):
+        """Claim and run jobs until stopped"""
+        while not self._stop.is_set():
+            try:
+                job = self._claim_next()
+            except sqlite3.OperationalError as e:
+                logger.warning(f"Job claim failed, retrying: {e}")
+                job = None
+
+            if job is None:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+                continue
+
+            self._local.job_id = job["id"]
+            with self._running_lock:
+                self._running.add(job["id"])
+            try:
+                result = self._handlers[job["kind"]](job["payload"], self._contexts.get(job["id"]))
+                self._finish(job["id"], JOB_DONE, result=result)
+            except Exception as e:
+                logger.error(f"Job {job['id']} ({job['kind']}) failed: {e}")
+                if job["attempts"] >= self.max_attempts:
+                    self._finish(job["id"], JOB_FAILED, error=str(e))
+                else:
+                    self._connect().execute(
+                        "UPDATE jobs SET status = ?, error = ?, updated_at = ?, lease_expires = NULL WHERE id = ?",
+                        (JOB_QUEUED, str(e), time.time(), job["id"])
+                    )
+            finally:
+                self._local.job_id = None
+                with self._running_lock:
+                    self._running.discard(job["id"])
+
+def export_directory(export_dir: str, owner: Optional[str]) -> str:
+    """Directory for owner's history exports (export_dir itself for exports of the whole history);
+    named by a hash, so it reveals neither the owner nor their session id"""
+    if owner is None:
+        return export_dir
+    return os.path.join(export_dir, hashlib.sha256(owner.encode("utf-8")).hexdigest()[:16])
+
+def register_generation_handlers(queue: JobQueue, history_store=None, export_dir: Optional[str] = None,
+                                 worker_pool=None, generator_resources: Optional[Callable[[], Dict[str, Any]]] = None):
+    """Register the app's job kinds on queue: generate_ideas and regenerate_idea (recorded in
+    history_store when given) and, with a history store and export_dir, export_history
+
+    Jobs run with the generator of the session that queued them; without it (reclaimed after a
+    restart, or in a standalone worker) one is built from the job's credentials reference, with
+    generator_resources() as extra generator arguments. A structured generation reports the
+    names of its ideas as job progress ({"ideas": [...]}) as they stream in.
+    """
+    try:
+        from business_idea_creator.idea_generator import generator_for_job, run_generation_job, run_regeneration_job
+        from business_idea_creator.utils import exporters
+    except ImportError:
+        from idea_generator import generator_for_job, run_generation_job, run_regeneration_job
+        import exporters
+
+    def job_generator(payload, context):
+        if context is not None:
+            return context
+        return generator_for_job(payload, **(generator_resources() if generator_resources else {}))
+
+    def generate_and_record(payload, context):
+        on_idea = None
+        if payload.get("structured"):
+            names = []
+
+            def on_idea(idea):
+                names.append(idea["name"])
+                queue.report_progress({"ideas": names})
+
+        results = run_generation_job(payload, job_generator(payload, context), on_idea=on_idea)
+        # Cache hits repeat ideas that are already in the history
+        if history_store is not None and not results.get("cache_hit"):
+            history_store.add_result(results, owner=payload.get("owner"))
+        return results
+
+    def regenerate_and_record(payload, context):
+        results = run_regeneration_job(payload, job_generator(payload, context))
+        if history_store is not None:
+            index = payload["index"]
+            history_store.replace_idea(results["request_id"], index + 1, results["generated_ideas"][index])
+        return results
+
+    def export_history(payload, context):
+        directory = export_directory(export_dir, payload["filters"].get("owner"))
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, exporters.history_export_filename(
+            payload["format"], payload["compression"], time.strftime("%Y%m%d_%H%M%S")
+        ))
+        if worker_pool is None:
+            rows = exporters.export_history(
+                history_store, path, payload["format"], payload["compression"], **payload["filters"]
+            )
+        else:
+            # Serializing a large history is CPU-bound; keep it off this process's GIL
+            rows = worker_pool.run(
+                exporters.export_history_file, history_store.db_path, path,
+                payload["format"], payload["compression"], payload["filters"]
+            )
+        return {"path": path, "rows": rows}
+
+    queue.register("generate_ideas", generate_and_record)
+    queue.register("regenerate_idea", regenerate_and_record)
+    if history_store is not None and export_dir is not None:
+        queue.register("export_history", export_history)
+
+def main():
+    """Run the app's job workers standalone, separate from the UI process
+
+    Only jobs with credentials this process can resolve (a key pool, a cassette or OPENAI_API_KEY
+    in its environment) can run here. Jobs using a key typed into a session are pinned to the UI
+    process that queued them; only once it is gone are they claimed here, and fail.
+    """
+    try:
+        from business_idea_creator.utils.history_store import HistoryStore
+    except ImportError:
+        from history_store import HistoryStore
+
+    data_dir = os.getenv("BUSINESS_IDEA_DATA_DIR", ".business_idea_creator")
+    history_store = HistoryStore(os.path.join(data_dir, "history.db"))
+
+    queue = JobQueue(os.path.join(data_dir, "jobs.db"), num_workers=int(os.getenv("BUSINESS_IDEA_WORKERS", "4")))
+    register_generation_handlers(queue, history_store, os.path.join(data_dir, "exports"))
+    queue.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        queue.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+# src/business_idea_creator/utils/key_pool.py
+"""
+API key pool for Business Idea Creator
+Spreads calls over several OpenAI keys by their requests/tokens used in the last minute,
+and sets aside keys that are rejected (bad key) or out of quota
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# Per-key limits when not configured (OpenAI's lowest paid tier for gpt-3.5-turbo)
+DEFAULT_RPM = int(os.getenv("BUSINESS_IDEA_KEY_RPM", "3500"))
+DEFAULT_TPM = int(os.getenv("BUSINESS_IDEA_KEY_TPM", "60000"))
+
+# How long keys are set aside: rejected keys need someone to replace them, exhausted quota
+# is usually topped up within the hour, rate-limited keys recover within seconds
+AUTH_QUARANTINE_SECONDS = 24 * 3600.0
+QUOTA_QUARANTINE_SECONDS = 3600.0
+RATE_LIMIT_COOLDOWN_SECONDS = 10.0
+
+WINDOW_SECONDS = 60.0
+
+class KeyPoolExhaustedError(RuntimeError):
+    """Raised when every key of the pool is quarantined"""
+
+def mask_key(key: str) -> str:
+    """Printable label for a key (never log or show whole keys)"""
+    return f"{key[:3]}...{key[-4:]}" if len(key) > 10 else "***"
+
+class KeyTicket(NamedTuple):
+    """A call's key and its [time, tokens, estimated] entry in the key's usage window"""
+    key: str
+    entry: List[Any]
+
+class PooledKey:
+    def __init__(self, key: str, rpm: int, tpm: int):
+        """One key with its limits, and its call times and [time, tokens, estimated] usage in the last minute"""
+        self.key = key
+        self.label = mask_key(key)
+        self.rpm = rpm
+        self.tpm = tpm
+        self.calls: Deque[float] = deque()
+        self.usage: Deque[List[Any]] = deque()
+        self.tokens = 0
+        self.quarantined_until = 0.0
+        self.quarantine_reason = ""
+        self.errors = 0
+
+    def expire(self, now: float):
+        while self.calls and self.calls[0] <= now - WINDOW_SECONDS:
+            self.calls.popleft()
+        while self.usage and self.usage[0][0] <= now - WINDOW_SECONDS:
+            self.tokens -= self.usage.popleft()[1]
+
+    def add_estimate(self, now: float, tokens: int) -> List[Any]:
+        entry = [now, tokens, True]
+        self.usage.append(entry)
+        self.tokens += tokens
+        return entry
+
+    def correct_estimate(self, entry: List[Any], actual_tokens: int, now: float):
+        """Replace a call's estimate by actual_tokens, in place, so the correction leaves the
+        window with it (one that already left, or was corrected before, needs none)"""
+        self.expire(now)
+        if entry[2] and entry[0] > now - WINDOW_SECONDS:
+            self.tokens += actual_tokens - entry[1]
+            entry[1], entry[2] = actual_tokens, False
+
+    def headroom(self) -> float:
+        """Fraction of the tighter of the two limits still free"""
+        return min(1.0 - len(self.calls) / self.rpm, 1.0 - self.tokens / self.tpm)
+
+class KeyPool:
+    def __init__(self, keys: List[str], rpm: int = DEFAULT_RPM, tpm: int = DEFAULT_TPM):
+        """Pool of distinct keys, each limited to rpm requests and tpm tokens per minute"""
+        if not keys:
+            raise ValueError("A key pool needs at least one key")
+        self._keys = {key: PooledKey(key, rpm, tpm) for key in dict.fromkeys(keys)}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> Optional["KeyPool"]:
+        """Pool of the keys in OPENAI_API_KEYS (comma-separated) and OPENAI_API_KEYS_FILE (one key per
+        line, lines starting with # ignored), or None when neither is set"""
+        keys = [key.strip() for key in os.getenv("OPENAI_API_KEYS", "").split(",") if key.strip()]
+        path = os.getenv("OPENAI_API_KEYS_FILE")
+        if path:
+            with open(path, "r", encoding="utf-8") as f:
+                keys += [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+        return cls(keys) if keys else None
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def keys(self) -> List[str]:
+        return list(self._keys)
+
+    def acquire(self, estimated_tokens: int) -> KeyTicket:
+        """Key with the most headroom for a call of about estimated_tokens, counted against it right away;
+        the ticket's key is the one to call with, the ticket itself is what record_tokens corrects
+
+        Raises KeyPoolExhaustedError if every key is quarantined.
+        """
+        now = time.monotonic()
+        with self._lock:
+            available = [pooled for pooled in self._keys.values() if pooled.quarantined_until <= now]
+            if not available:
+                raise KeyPoolExhaustedError("Every API key of the pool is quarantined")
+            for pooled in available:
+                pooled.expire(now)
+            pooled = max(available, key=PooledKey.headroom)
+            pooled.calls.append(now)
+            return KeyTicket(pooled.key, pooled.add_estimate(now, estimated_tokens))
+
+    def record_tokens(self, ticket: KeyTicket, actual_tokens: int):
+        """Correct the estimate of the call ticket was acquired for, once its actual token usage is known"""
+        now = time.monotonic()
+        with self._lock:
+            pooled = self._keys.get(ticket.key)
+            if pooled is not None:
+                pooled.correct_estimate(ticket.entry, actual_tokens, now)
+
+    def quarantine(self, key: str, seconds: float, reason: str):
+        """Take a key out of rotation for seconds"""
+        with self._lock:
+            pooled = self._keys.get(key)
+            if pooled is None:
+                return
+            pooled.errors += 1
+            pooled.quarantined_until = time.monotonic() + seconds
+            pooled.quarantine_reason = reason
+        logger.warning(f"API key {pooled.label} set aside for {seconds:.0f}s: {reason}")
+
+    def reject(self, key: str, reason: str = "rejected"):
+        """Set aside a key the API refused (invalid, revoked or without access)"""
+        self.quarantine(key, AUTH_QUARANTINE_SECONDS, reason)
+
+    def exhaust(self, key: str):
+        """Set aside a key whose quota is used up"""
+        self.quarantine(key, QUOTA_QUARANTINE_SECONDS, "quota exhausted")
+
+    def cool_down(self, key: str, seconds: Optional[float] = None):
+        """Rest a rate-limited key for seconds (default: RATE_LIMIT_COOLDOWN_SECONDS)"""
+        self.quarantine(key, seconds or RATE_LIMIT_COOLDOWN_SECONDS, "rate limited")
+
+    def utilization(self) -> List[Dict[str, Any]]:
+        """Per-key requests/tokens in the last minute against its limits, and quarantine state"""
+        now = time.monotonic()
+        with self._lock:
+            rows = []
+            for pooled in self._keys.values():
+                pooled.expire(now)
+                quarantined_for = max(pooled.quarantined_until - now, 0.0)
+                rows.append({
+                    "key": pooled.label,
+                    "requests": len(pooled.calls),
+                    "rpm": pooled.rpm,
+                    "tokens": max(pooled.tokens, 0),
+                    "tpm": pooled.tpm,
+                    "utilization": max(1.0 - pooled.headroom(), 0.0),
+                    "quarantined_for": quarantined_for,
+                    "reason": pooled.quarantine_reason if quarantined_for else "",
+                    "errors": pooled.errors
+                })
+            return rows
+
+_POOL: Optional[KeyPool] = None
+_POOL_LOADED = False
+_POOL_LOCK = threading.Lock()
+
+def get_key_pool() -> Optional[KeyPool]:
+    """Process-wide pool from the environment (None when no pool is configured)"""
+    global _POOL, _POOL_LOADED
+    with _POOL_LOCK:
+        if not _POOL_LOADED:
+            _POOL = KeyPool.from_env()
+            _POOL_LOADED = True
+        return _POOL
@@ -0,0 +1,132 @@
+# src/business_idea_creator/utils/knowledge_base.py
+"""
+Shared read-only knowledge base for Business Idea Creator
+One frozen snapshot of industry contexts and market trends per process, used by both
+PromptEngineer (prompt context) and DataProcessor (market insights)
+"""
+
+import sys
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+try:
+    from .market_dataset import MarketDataset, get_market_dataset
+    from .trend_matcher import TrendMatcher
+except ImportError:
+    from market_dataset import MarketDataset, get_market_dataset
+    from trend_matcher import TrendMatcher
+
+DEFAULT_REGION = "Global"
+
+def freeze(value: Any) -> Any:
+    """Deep read-only copy: dicts become mapping proxies, lists tuples, strings are interned"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({sys.intern(str(key)): freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+EMPTY_MAPPING = MappingProxyType({})
+
+# Used when no dataset file is available (same figures as the bundled dataset)
+BUILTIN_INDUSTRIES = freeze({
+    "technology": {
+        "market_size": "5.2T",
+        "growth_rate": 0.08,
+        "key_players": ["Microsoft", "Apple", "Google", "Amazon"],
+        "pain_points": ["Data privacy", "Skills gap", "Digital transformation"],
+        "opportunities": ["AI automation", "Edge computing", "Quantum computing"],
+        "key_trends": ["AI/ML", "Cloud Computing", "Cybersecurity", "IoT"]
+    },
+    "healthcare": {
+        "market_size": "4.3T",
+        "growth_rate": 0.06,
+        "key_players": ["Johnson & Johnson", "Pfizer", "UnitedHealth"],
+        "pain_points": ["Access to care", "Rising costs", "Aging population"],
+        "opportunities": ["Telemedicine", "AI diagnostics", "Personalized medicine"],
+        "key_trends": ["Telemedicine", "Wearables", "Personalized medicine"]
+    },
+    "finance": {
+        "market_size": "22.5T",
+        "growth_rate": 0.05,
+        "key_players": ["JPMorgan", "Bank of America", "Wells Fargo"],
+        "pain_points": ["Regulation", "Cybersecurity", "Digital transformation"],
+        "opportunities": ["Fintech", "Digital payments", "Robo-advisors"],
+        "key_trends": ["Fintech", "Digital payments", "Cryptocurrency"]
+    },
+    "retail": {
+        "market_size": "26T",
+        "growth_rate": 0.04,
+        "key_players": ["Amazon", "Walmart", "Alibaba"],
+        "pain_points": ["E-commerce competition", "Supply chain", "Customer experience"],
+        "opportunities": ["Omnichannel", "Personalization", "Sustainability"],
+        "key_trends": ["E-commerce", "Omnichannel", "Sustainability"]
+    },
+    "education": {
+        "market_size": "7.3T",
+        "growth_rate": 0.05,
+        "key_players": ["Pearson", "Coursera", "Duolingo"],
+        "pain_points": ["Engagement", "Accessibility", "Outcome measurement"],
+        "opportunities": ["Micro-learning", "Adaptive learning", "Credentialing"],
+        "key_trends": ["Online learning", "Gamification", "AI tutoring"]
+    }
+})
+
+BUILTIN_TRENDS = freeze([
+    {"trend": "AI Integration", "growth_rate": 0.45, "relevance_score": 0.9},
+    {"trend": "Sustainability", "growth_rate": 0.32, "relevance_score": 0.85},
+    {"trend": "Remote Work", "growth_rate": 0.28, "relevance_score": 0.75},
+    {"trend": "E-commerce", "growth_rate": 0.41, "relevance_score": 0.8},
+    {"trend": "Digital Health", "growth_rate": 0.38, "relevance_score": 0.88}
+])
+
+class KnowledgeBase:
+    def __init__(self, dataset: Optional[MarketDataset] = None):
+        """Freeze a snapshot of the dataset (or the built-in data) at its current version"""
+        self.dataset = dataset
+        self.version = dataset.version if dataset is not None else 0
+        trends = dataset.trends() if dataset is not None else None
+        self.trends: Tuple[Mapping[str, Any], ...] = freeze(trends) if trends else BUILTIN_TRENDS
+        self.trend_matcher = TrendMatcher(list(self.trends))
+        # (industry, region) -> frozen insights, filled on first lookup
+        self._industries: Dict[Tuple[str, str], Mapping[str, Any]] = {}
+        self._industry_data: Optional[Mapping[str, Mapping[str, Any]]] = None
+
+    def industry(self, name: str, region: Optional[str] = None) -> Mapping[str, Any]:
+        """Read-only insights for an industry (and region), empty if unknown"""
+        key = (str(name).strip().lower(), str(region or DEFAULT_REGION).strip().lower())
+        insights = self._industries.get(key)
+        if insights is None:
+            found = self.dataset.get(name, region) if self.dataset is not None else None
+            insights = freeze(found) if found else BUILTIN_INDUSTRIES.get(key[0], EMPTY_MAPPING)
+            self._industries[key] = insights
+        return insights
+
+    @property
+    def industry_data(self) -> Mapping[str, Mapping[str, Any]]:
+        """Read-only insights of every industry (default region), keyed by lower-case name"""
+        if self._industry_data is None:
+            names = self.dataset.industries() if self.dataset is not None else list(BUILTIN_INDUSTRIES)
+            self._industry_data = MappingProxyType({name.strip().lower(): self.industry(name) for name in names})
+        return self._industry_data
+
+_SNAPSHOTS: Dict[Optional[str], KnowledgeBase] = {}
+_SNAPSHOTS_LOCK = threading.Lock()
+
+def get_knowledge_base(dataset_path: Optional[str] = None) -> KnowledgeBase:
+    """Current process-wide snapshot; replaced atomically when the dataset file changes"""
+    dataset = get_market_dataset(dataset_path)
+    key = dataset.path if dataset is not None else None
+    version = dataset.current_version() if dataset is not None else 0
+    snapshot = _SNAPSHOTS.get(key)
+    if snapshot is None or snapshot.version != version:
+        with _SNAPSHOTS_LOCK:
+            snapshot = _SNAPSHOTS.get(key)
+            if snapshot is None or snapshot.version != version:
+                # Readers holding the old snapshot keep a consistent view until they finish
+                snapshot = KnowledgeBase(dataset)
+                _SNAPSHOTS[key] = snapshot
+    return snapshot
@@ -0,0 +1,214 @@
+# src/business_idea_creator/utils/market_dataset.py
+"""
+File-backed market knowledge dataset for Business Idea Creator
+Industry insights and the trend catalog live in a JSON, CSV or Parquet file that is
+loaded once per process, materialized per industry on demand and reloaded when it changes
+(see knowledge_base.py for the frozen, cached view the app reads)
+"""
+
+import csv
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+# Optional columnar backend
+try:
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pq = None
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DATASET_FILENAME = "market-data.json"
+# The bundled file lives in the package's data directory, or beside the modules in a flat checkout
+_BUNDLED_PATHS = (
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", DATASET_FILENAME),
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), DATASET_FILENAME),
+)
+DEFAULT_DATASET_PATH = os.getenv("BUSINESS_IDEA_MARKET_DATA") or next(
+    (path for path in _BUNDLED_PATHS if os.path.exists(path)), _BUNDLED_PATHS[0]
+)
+DEFAULT_REGION = "Global"
+
+# Columns holding lists; CSV files store them ";"-separated
+LIST_FIELDS = ("key_players", "pain_points", "opportunities", "key_trends", "aliases")
+FLOAT_FIELDS = ("growth_rate", "relevance_score")
+KEY_FIELDS = ("industry", "region")
+
+def _normalize_key(value: Any) -> str:
+    return str(value or "").strip().lower()
+
+def _coerce_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert CSV strings to lists/floats and drop empty cells"""
+    coerced = {}
+    for key, value in row.items():
+        if value is None or value == "":
+            continue
+        if key in LIST_FIELDS and isinstance(value, str):
+            value = [item.strip() for item in value.split(";") if item.strip()]
+        elif key in FLOAT_FIELDS and isinstance(value, str):
+            value = float(value)
+        coerced[key] = value
+    return coerced
+
+def _read_trend_rows(path: str) -> List[Dict[str, Any]]:
+    """Rows of a standalone trend catalog file"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, list) else data.get("trends", [])
+    if extension == ".csv":
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            return list(csv.DictReader(f))
+    if extension == ".parquet" and PYARROW_AVAILABLE:
+        return pq.read_table(path).to_pylist()
+    raise ValueError(f"Unsupported trend catalog format: {path}")
+
+class MarketDataset:
+    def __init__(self, path: str, trends_path: Optional[str] = None, reload_interval: float = 2.0):
+        """Open a dataset file; trends come from the same JSON file or from trends_path"""
+        self.path = path
+        self.trends_path = trends_path
+        self.reload_interval = reload_interval
+        # Bumped on every (re)load so derived caches can tell they are stale
+        self.version = 0
+
+        self._lock = threading.RLock()
+        self._mtime: Optional[float] = None
+        self._checked_at = 0.0
+        self._industry_rows: Dict[str, List[Any]] = {}
+        self._industry_names: List[str] = []
+        # Parquet datasets: rows are the industry's names in the file, its rows are read on first use
+        self._columnar = False
+        self._columnar_rows: Dict[str, List[Dict[str, Any]]] = {}
+        self._trends: List[Dict[str, Any]] = []
+        self._load()
+
+    def _source_mtime(self) -> float:
+        paths = [self.path] + ([self.trends_path] if self.trends_path else [])
+        return max(os.path.getmtime(path) for path in paths)
+
+    def _load(self):
+        """(Re)read the dataset files and reset the per-industry caches"""
+        mtime = self._source_mtime()
+        extension = os.path.splitext(self.path)[1].lower()
+        columnar, trends = False, []
+
+        if extension == ".json":
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            rows = data.get("industries", [])
+            if isinstance(rows, dict):
+                # Also accept the {"technology": {...}} mapping used by the built-in defaults
+                rows = [dict(values, industry=name) for name, values in rows.items()]
+            trends = data.get("trends", [])
+        elif extension == ".csv":
+            with open(self.path, "r", encoding="utf-8", newline="") as f:
+                rows = list(csv.DictReader(f))
+        elif extension == ".parquet":
+            if not PYARROW_AVAILABLE:
+                raise ValueError("Parquet datasets require the 'pyarrow' package")
+            # Only the industry column is read now; an industry's rows when it is first looked up
+            rows = pq.read_table(self.path, columns=["industry"], memory_map=True).column("industry").to_pylist()
+            columnar = True
+        else:
+            raise ValueError(f"Unsupported dataset format: {self.path}")
+
+        if self.trends_path:
+            trends = _read_trend_rows(self.trends_path)
+
+        industry_rows: Dict[str, List[Any]] = {}
+        names: Dict[str, str] = {}
+        for row in rows:
+            name = row if columnar else row.get("industry")
+            key = _normalize_key(name)
+            industry_rows.setdefault(key, []).append(row)
+            names.setdefault(key, name)
+
+        with self._lock:
+            self._columnar = columnar
+            self._columnar_rows = {}
+            self._industry_rows = industry_rows
+            self._industry_names = sorted(names.values())
+            self._trends = [_coerce_row(trend) for trend in trends]
+            self._mtime = mtime
+            self._checked_at = time.monotonic()
+            self.version += 1
+        logger.info(f"Loaded market dataset {self.path}: {len(industry_rows)} industries, {len(self._trends)} trends")
+
+    def _maybe_reload(self):
+        """Reload if the file changed (checked at most every reload_interval seconds)"""
+        now = time.monotonic()
+        if now - self._checked_at < self.reload_interval:
+            return
+        self._checked_at = now
+        try:
+            if self._source_mtime() != self._mtime:
+                self._load()
+        except (OSError, ValueError) as e:
+            # Keep serving the last good snapshot
+            logger.error(f"Market dataset reload failed: {e}")
+
+    def _materialize(self, key: str) -> List[Dict[str, Any]]:
+        """Rows of one industry as dicts"""
+        rows = self._industry_rows.get(key, [])
+        if self._columnar:
+            if not rows:
+                return []
+            if key not in self._columnar_rows:
+                # The filter is pushed down, so other industries' rows are skipped, not read
+                table = pq.read_table(self.path, filters=[("industry", "in", sorted(set(rows)))], memory_map=True)
+                self._columnar_rows[key] = table.to_pylist()
+            rows = self._columnar_rows[key]
+        return [_coerce_row(row) for row in rows]
+
+    def industries(self) -> List[str]:
+        """Industry names in the dataset"""
+        self._maybe_reload()
+        return list(self._industry_names)
+
+    def current_version(self) -> int:
+        """Version after picking up any file change"""
+        self._maybe_reload()
+        return self.version
+
+    def get(self, industry: str, region: Optional[str] = None) -> Dict[str, Any]:
+        """Insights for an industry and region, falling back to the global row"""
+        self._maybe_reload()
+        with self._lock:
+            rows = self._materialize(_normalize_key(industry))
+        by_region = {_normalize_key(row.get("region") or DEFAULT_REGION): row for row in rows}
+        row = (by_region.get(_normalize_key(region or DEFAULT_REGION))
+               or by_region.get(_normalize_key(DEFAULT_REGION))
+               or (rows[0] if rows else {}))
+        return {field: value for field, value in row.items() if field not in KEY_FIELDS}
+
+    def trends(self) -> List[Dict[str, Any]]:
+        """Trend catalog rows (trend, growth_rate, relevance_score, optional aliases)"""
+        self._maybe_reload()
+        return self._trends
+
+_DATASETS: Dict[str, MarketDataset] = {}
+_DATASETS_LOCK = threading.Lock()
+
+def get_market_dataset(path: Optional[str] = None) -> Optional[MarketDataset]:
+    """Process-wide shared dataset for path (default: the bundled file), or None if unavailable"""
+    path = os.path.abspath(path or DEFAULT_DATASET_PATH)
+    with _DATASETS_LOCK:
+        dataset = _DATASETS.get(path)
+        if dataset is None:
+            if not os.path.exists(path):
+                return None
+            try:
+                dataset = MarketDataset(path)
+            except (OSError, ValueError) as e:
+                logger.error(f"Could not load market dataset {path}: {e}")
+                return None
+            _DATASETS[path] = dataset
+        return dataset
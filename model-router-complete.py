@@ -0,0 +1,169 @@
+# src/business_idea_creator/utils/model_router.py
+"""
+Model routing for Business Idea Creator
+Picks the model for a request from observed per-model latency and throughput, the request's
+latency target (SLO) and a cost budget, skipping models that are currently throttled
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Model option that lets the router choose
+AUTO_MODEL = "auto"
+
+# Per-model pricing (USD per 1K tokens), a prior completion throughput (tokens/second) used
+# until calls are observed, and a quality rank (higher is preferred when it fits the request)
+MODEL_PROFILES = {
+    "gpt-3.5-turbo": {"prompt_cost": 0.0005, "completion_cost": 0.0015, "tokens_per_second": 60.0, "quality": 1},
+    "gpt-4": {"prompt_cost": 0.03, "completion_cost": 0.06, "tokens_per_second": 20.0, "quality": 2}
+}
+
+# Completion tokens per idea in the response format, plus the analysis/intro around them
+TOKENS_PER_IDEA = 300
+TOKENS_OVERHEAD = 200
+
+DEFAULT_SLO_SECONDS = float(os.getenv("BUSINESS_IDEA_SLO_SECONDS", "30"))
+DEFAULT_MAX_COST_USD = float(os.getenv("BUSINESS_IDEA_MAX_COST_USD", "0.25"))
+# Throttled models are skipped for this long unless the API says when to retry
+DEFAULT_THROTTLE_SECONDS = 30.0
+
+def completion_tokens_for(num_ideas: int) -> int:
+    """max_tokens for a response with num_ideas ideas"""
+    return TOKENS_OVERHEAD + TOKENS_PER_IDEA * max(num_ideas, 1)
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of text (about 4 characters per token for English)"""
+    return len(text) // 4 + 1
+
+class ModelStats:
+    def __init__(self, tokens_per_second: float, alpha: float = 0.2):
+        """EWMAs of a model's latency, completion length and throughput (prior: tokens_per_second)"""
+        self.alpha = alpha
+        self.latency: Optional[float] = None
+        self.completion_tokens: Optional[float] = None
+        self.tokens_per_second = tokens_per_second
+        self.calls = 0
+        self.throttled = 0
+        self.throttled_until = 0.0
+
+    def _ewma(self, current: Optional[float], value: float) -> float:
+        return value if current is None else current + self.alpha * (value - current)
+
+    def observe(self, latency: float, completion_tokens: int):
+        self.calls += 1
+        self.latency = self._ewma(self.latency, latency)
+        if completion_tokens > 0 and latency > 0:
+            self.completion_tokens = self._ewma(self.completion_tokens, completion_tokens)
+            # The prior counts as the first observation
+            self.tokens_per_second = self._ewma(self.tokens_per_second, completion_tokens / latency)
+
+    def predict_latency(self, max_tokens: int) -> float:
+        """Expected seconds for a completion capped at max_tokens"""
+        tokens = min(self.completion_tokens or max_tokens, max_tokens)
+        return tokens / self.tokens_per_second
+
+    def max_latency(self, max_tokens: int) -> float:
+        """Expected seconds for a completion that runs all the way to max_tokens"""
+        return max_tokens / self.tokens_per_second
+
+class ModelRouter:
+    def __init__(self, profiles: Optional[Dict[str, Dict[str, float]]] = None,
+                 slo_seconds: float = DEFAULT_SLO_SECONDS, max_cost_usd: float = DEFAULT_MAX_COST_USD):
+        """Route between the models in profiles (default: MODEL_PROFILES)"""
+        self.profiles = profiles or MODEL_PROFILES
+        self.slo_seconds = slo_seconds
+        self.max_cost_usd = max_cost_usd
+        self._stats = {model: ModelStats(profile["tokens_per_second"]) for model, profile in self.profiles.items()}
+        self._lock = threading.Lock()
+
+    def estimate_cost(self, model: str, prompt_tokens: int, max_tokens: int, completions: int = 1) -> float:
+        """Worst-case cost of a call (each of its completions runs to max_tokens)"""
+        profile = self.profiles[model]
+        return (prompt_tokens * profile["prompt_cost"] + completions * max_tokens * profile["completion_cost"]) / 1000
+
+    def candidates(self, prompt_tokens: int, max_tokens: int, preferred: Optional[str] = None,
+                   slo_seconds: Optional[float] = None, max_cost_usd: Optional[float] = None,
+                   completions: int = 1) -> List[str]:
+        """Models to try in order: preferred first (unless throttled), then the best model meeting the
+        SLO within budget, then the rest within budget by predicted latency
+
+        Throttled models and models over budget are left out, but never all of them: if none
+        is left, the cheapest model is returned.
+        """
+        slo_seconds = slo_seconds or self.slo_seconds
+        max_cost_usd = self.max_cost_usd if max_cost_usd is None else max_cost_usd
+        now = time.monotonic()
+        with self._lock:
+            latencies = {model: stats.predict_latency(max_tokens) for model, stats in self._stats.items()}
+            available = [model for model, stats in self._stats.items() if stats.throttled_until <= now]
+        affordable = [model for model in available
+                      if self.estimate_cost(model, prompt_tokens, max_tokens, completions) <= max_cost_usd]
+
+        within_slo = sorted((model for model in affordable if latencies[model] <= slo_seconds),
+                            key=lambda model: -self.profiles[model]["quality"])
+        over_slo = sorted((model for model in affordable if latencies[model] > slo_seconds),
+                          key=lambda model: latencies[model])
+        ordered = within_slo + over_slo
+        # A model without a profile is only ever tried when asked for
+        if preferred in available or (preferred is not None and preferred not in self.profiles):
+            ordered = [preferred] + [model for model in ordered if model != preferred]
+        if not ordered:
+            ordered = [min(self.profiles, key=lambda model: self.estimate_cost(model, prompt_tokens, max_tokens))]
+        return ordered
+
+    def max_latency(self, model: str, max_tokens: int) -> Optional[float]:
+        """Expected seconds for a completion of model running to max_tokens (None for models without a profile)"""
+        with self._lock:
+            stats = self._stats.get(model)
+            return stats.max_latency(max_tokens) if stats is not None else None
+
+    def record(self, model: str, latency: float, completion_tokens: int):
+        """Record a completed call"""
+        with self._lock:
+            if model in self._stats:
+                self._stats[model].observe(latency, completion_tokens)
+
+    def mark_throttled(self, model: str, retry_after: Optional[float] = None):
+        """Skip model until retry_after seconds from now (default: DEFAULT_THROTTLE_SECONDS)"""
+        seconds = retry_after or DEFAULT_THROTTLE_SECONDS
+        logger.warning(f"{model} is throttled; routing around it for {seconds:.0f}s")
+        with self._lock:
+            if model in self._stats:
+                self._stats[model].throttled += 1
+                self._stats[model].throttled_until = time.monotonic() + seconds
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Observed latency/throughput and throttling per model"""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                model: {
+                    "calls": stats.calls,
+                    "latency": stats.latency,
+                    "completion_tokens": stats.completion_tokens,
+                    "tokens_per_second": stats.tokens_per_second,
+                    "throttled": stats.throttled,
+                    "throttled_for": max(stats.throttled_until - now, 0.0)
+                }
+                for model, stats in self._stats.items()
+            }
+
+def available_models() -> List[str]:
+    """Model options for the UI: AUTO_MODEL, then the routed models"""
+    return [AUTO_MODEL] + list(MODEL_PROFILES)
+
+_ROUTER: Optional[ModelRouter] = None
+_ROUTER_LOCK = threading.Lock()
+
+def get_model_router() -> ModelRouter:
+    """Process-wide router shared by all generators, so every call feeds the same statistics"""
+    global _ROUTER
+    with _ROUTER_LOCK:
+        if _ROUTER is None:
+            _ROUTER = ModelRouter()
+        return _ROUTER
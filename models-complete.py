@@ -0,0 +1,164 @@
+# src/business_idea_creator/models.py
+"""
+Compact result models for Business Idea Creator
+Slot-based Idea and GenerationResult classes for long-lived histories. Both are read-only
+Mapping views with the same keys as the result dicts, and convert losslessly to_dict/from_dict.
+"""
+
+import copy
+import sys
+import zlib
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    from .utils.history_store import IDEA_FIELDS
+except ImportError:
+    from utils.history_store import IDEA_FIELDS
+
+# Top-level keys of a result dict stored as slots; any other key is kept in "extra"
+RESULT_FIELDS = ("request_id", "timestamp", "input_parameters", "generated_ideas", "raw_response",
+                 "model_used", "technique_used", "mock_mode", "revision")
+PARAMETER_FIELDS = ("industry", "target_audience", "market_trends", "budget_range",
+                    "geographical_focus", "innovation_level", "technique_used")
+# Values repeated across many results; interned so every result shares one string object
+CATEGORICAL_FIELDS = frozenset(("industry", "target_audience", "budget_range", "geographical_focus",
+                                "innovation_level", "technique_used", "model_used"))
+
+# Raw responses shorter than this are kept as plain text (compression would not pay off)
+RAW_COMPRESS_MIN_CHARS = 256
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+def _present_bits(mapping: Mapping, fields: Tuple[str, ...]) -> int:
+    """Bitmask of which fields a mapping has, so to_dict can reproduce missing keys"""
+    return sum(1 << bit for bit, field in enumerate(fields) if field in mapping)
+
+class Idea(Mapping):
+    """One business idea; fields are slots instead of dict entries"""
+    __slots__ = tuple(IDEA_FIELDS) + ("extra", "_present")
+
+    def __init__(self, **fields):
+        self._present = _present_bits(fields, IDEA_FIELDS)
+        for field in IDEA_FIELDS:
+            setattr(self, field, fields.pop(field, ""))
+        # Anything else (duplicate_of, ...) is kept as a private copy
+        self.extra: Optional[Dict[str, Any]] = copy.deepcopy(fields) or None
+
+    @classmethod
+    def from_dict(cls, idea: Mapping) -> "Idea":
+        return idea if isinstance(idea, cls) else cls(**idea)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The idea as a new plain dict"""
+        return {key: copy.deepcopy(value) for key, value in self.items()}
+
+    def _keys(self) -> List[str]:
+        keys = [field for bit, field in enumerate(IDEA_FIELDS) if self._present >> bit & 1]
+        return keys + list(self.extra or ())
+
+    def __getitem__(self, key: str) -> Any:
+        if key in IDEA_FIELDS:
+            if self._present >> IDEA_FIELDS.index(key) & 1:
+                return getattr(self, key)
+        elif self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return bin(self._present).count("1") + len(self.extra or ())
+
+    def __repr__(self) -> str:
+        return f"Idea({self.name!r})"
+
+class GenerationResult(Mapping):
+    """One generation result: categorical values interned, raw response compressed"""
+    __slots__ = ("request_id", "timestamp", "model_used", "technique_used", "mock_mode", "revision",
+                 "parameters", "ideas", "extra", "extra_parameters", "_raw", "_present", "_parameters_present")
+
+    def __init__(self, results: Mapping, compress: bool = True):
+        """Compact copy of a result dict (see from_dict)"""
+        self._present = _present_bits(results, RESULT_FIELDS)
+        self.request_id = results.get("request_id")
+        self.timestamp = results.get("timestamp")
+        self.model_used = _intern(results.get("model_used"))
+        self.technique_used = _intern(results.get("technique_used"))
+        self.mock_mode = results.get("mock_mode")
+        self.revision = results.get("revision")
+
+        params = results.get("input_parameters") or {}
+        self._parameters_present = _present_bits(params, PARAMETER_FIELDS)
+        self.parameters = tuple(
+            tuple(_intern(trend) for trend in params.get(field) or ()) if field == "market_trends"
+            else _intern(params.get(field)) if field in CATEGORICAL_FIELDS else params.get(field)
+            for field in PARAMETER_FIELDS
+        )
+        self.extra_parameters = copy.deepcopy({key: value for key, value in params.items()
+                                               if key not in PARAMETER_FIELDS}) or None
+
+        self.ideas = tuple(Idea.from_dict(idea) for idea in results.get("generated_ideas") or ())
+
+        raw = results.get("raw_response")
+        if compress and isinstance(raw, str) and len(raw) >= RAW_COMPRESS_MIN_CHARS:
+            raw = zlib.compress(raw.encode("utf-8"))
+        self._raw = raw
+
+        self.extra = copy.deepcopy({key: value for key, value in results.items()
+                                    if key not in RESULT_FIELDS}) or None
+
+    @classmethod
+    def from_dict(cls, results: Mapping, compress: bool = True) -> "GenerationResult":
+        """Compact form of a result dict; compress zlib-compresses long raw responses"""
+        return results if isinstance(results, cls) else cls(results, compress)
+
+    @property
+    def raw_response(self) -> Optional[str]:
+        if isinstance(self._raw, bytes):
+            return zlib.decompress(self._raw).decode("utf-8")
+        return self._raw
+
+    @property
+    def input_parameters(self) -> Dict[str, Any]:
+        params = {
+            field: list(value) if field == "market_trends" else value
+            for bit, (field, value) in enumerate(zip(PARAMETER_FIELDS, self.parameters))
+            if self._parameters_present >> bit & 1
+        }
+        params.update(copy.deepcopy(self.extra_parameters or {}))
+        return params
+
+    @property
+    def generated_ideas(self) -> List[Idea]:
+        return list(self.ideas)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The result as a new plain dict, equal to the one it was built from"""
+        return {
+            key: [idea.to_dict() for idea in self.ideas] if key == "generated_ideas" else copy.deepcopy(self[key])
+            for key in self._keys()
+        }
+
+    def _keys(self) -> List[str]:
+        keys = [field for bit, field in enumerate(RESULT_FIELDS) if self._present >> bit & 1]
+        return keys + list(self.extra or ())
+
+    def __getitem__(self, key: str) -> Any:
+        if key in RESULT_FIELDS:
+            if self._present >> RESULT_FIELDS.index(key) & 1:
+                return getattr(self, key)
+        elif self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return bin(self._present).count("1") + len(self.extra or ())
+
+    def __repr__(self) -> str:
+        return f"GenerationResult({self.request_id!r}, {len(self.ideas)} ideas)"
@@ -9,10 +9,18 @@ Implements multiple prompt engineering techniques including:
 
 import json
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Mapping
 from dataclasses import dataclass
 from datetime import datetime
 
+try:
+    from .utils.knowledge_base import KnowledgeBase, get_knowledge_base
+except ImportError:
+    try:
+        from utils.knowledge_base import KnowledgeBase, get_knowledge_base
+    except ImportError:
+        from knowledge_base import KnowledgeBase, get_knowledge_base
+
 @dataclass
 class BusinessIdeaRequest:
     industry: str
@@ -22,10 +30,32 @@ class BusinessIdeaRequest:
     geographical_focus: str
     innovation_level: str  # "incremental", "disruptive", "breakthrough"
 
+# Response format for structured (JSON) mode; keys match the fields of a parsed idea
+JSON_FORMAT_INSTRUCTION = """
+        
+        FORMAT YOUR RESPONSE AS A SINGLE JSON OBJECT, with no text outside it:
+        
+        {"ideas": [{"name": "...", "problem": "...", "solution": "...", "target_market": "...",
+                    "revenue_model": "...", "competitive_edge": "...", "implementation": "...",
+                    "success_metrics": "..."}]}
+        
+        Every value is a string. Include 3-5 ideas in "ideas".
+        
+        ADDITIONAL REQUIREMENTS:
+        - Each idea should be distinct and innovative
+        - Include specific numbers where possible (market size, pricing, etc.)
+        - Consider scalability and long-term viability
+        - Address potential challenges and mitigation strategies
+        """
+
 class PromptEngineer:
     def __init__(self):
         self.base_templates = self._load_prompt_templates()
-        self.industry_contexts = self._load_industry_data()
+    
+    @property
+    def knowledge_base(self) -> KnowledgeBase:
+        """Shared industry/trend knowledge base (same data DataProcessor uses)"""
+        return get_knowledge_base()
         
     def _load_prompt_templates(self) -> Dict[str, str]:
         """Load pre-crafted prompt templates for different scenarios"""
@@ -119,53 +149,17 @@ class PromptEngineer:
         }
         return templates
     
-    def _load_industry_data(self) -> Dict[str, Any]:
-        """Load industry-specific context data"""
-        return {
-            "technology": {
-                "key_trends": ["AI/ML", "Cloud Computing", "Cybersecurity", "IoT"],
-                "pain_points": ["Data privacy", "Digital transformation", "Skills gap"],
-                "opportunities": ["Automation", "Personalization", "Efficiency"],
-                "market_size": "$5.2T globally"
-            },
-            "healthcare": {
-                "key_trends": ["Telemedicine", "Wearables", "Personalized medicine"],
-                "pain_points": ["Access to care", "Cost management", "Data integration"],
-                "opportunities": ["Preventive care", "Remote monitoring", "AI diagnostics"],
-                "market_size": "$4.3T globally"
-            },
-            "retail": {
-                "key_trends": ["E-commerce", "Omnichannel", "Sustainability"],
-                "pain_points": ["Customer acquisition", "Inventory management", "Competition"],
-                "opportunities": ["Personalization", "AR/VR shopping", "Social commerce"],
-                "market_size": "$26T globally"
-            },
-            "finance": {
-                "key_trends": ["Fintech", "Digital payments", "Cryptocurrency"],
-                "pain_points": ["Regulation", "Security", "User experience"],
-                "opportunities": ["Financial inclusion", "Automated investing", "DeFi"],
-                "market_size": "$22.5T globally"
-            },
-            "education": {
-                "key_trends": ["Online learning", "Micro-credentials", "VR/AR"],
-                "pain_points": ["Accessibility", "Engagement", "Cost"],
-                "opportunities": ["Personalized learning", "Skills-based training", "Global reach"],
-                "market_size": "$7.3T globally"
-            }
-        }
-    
     def generate_context_aware_prompt(self, request: BusinessIdeaRequest, 
                                       technique: str = "chain_of_thought") -> str:
         """Generate context-aware prompts using specified technique"""
         
         # Get industry-specific context
-        industry_context = self.industry_contexts.get(
-            request.industry.lower(), 
-            self.industry_contexts.get("technology", {})
-        )
+        knowledge_base = self.knowledge_base
+        industry_context = (knowledge_base.industry(request.industry, request.geographical_focus)
+                            or knowledge_base.industry("technology"))
         
         # Enhance trends with industry context
-        enhanced_trends = request.market_trends + industry_context.get("key_trends", [])
+        enhanced_trends = list(request.market_trends) + list(industry_context.get("key_trends", ()))
         trends_text = ", ".join(enhanced_trends[:5])  # Limit to top 5 trends
         
         # Select appropriate template
@@ -184,7 +178,7 @@ class PromptEngineer:
         # Add meta instructions for better AI performance
         meta_instructions = f"""
         CONTEXT ENHANCEMENT:
-        Industry Size: {industry_context.get('market_size', 'Growing market')}
+        Industry Size: {self._format_market_size(industry_context)}
         Key Pain Points: {', '.join(industry_context.get('pain_points', []))}
         Major Opportunities: {', '.join(industry_context.get('opportunities', []))}
         
@@ -202,8 +196,39 @@ class PromptEngineer:
         
         return meta_instructions + formatted_prompt
     
-    def validate_and_refine_prompt(self, prompt: str) -> str:
-        """Apply prompt validation and refinement techniques"""
+    def generate_replacement_prompt(self, parameters: Mapping[str, Any], avoid_names: List[str]) -> str:
+        """Compact prompt for one replacement idea: the request parameters and the names to avoid,
+        without the technique template and context of a full generation"""
+        trends = parameters.get("market_trends") or []
+        avoid = "\n".join(f"- {name}" for name in avoid_names if name)
+        return f"""Suggest exactly one new business idea.
+        
+        Industry: {parameters.get("industry", "")}
+        Target audience: {parameters.get("target_audience", "")}
+        Market trends: {", ".join(trends) if isinstance(trends, list) else trends}
+        Budget: {parameters.get("budget_range", "")}
+        Geographical focus: {parameters.get("geographical_focus", "")}
+        Innovation level: {parameters.get("innovation_level", "")}
+        
+        It must be clearly different from these ideas:
+        {avoid}
+        
+        Respond with a single JSON object, with no text outside it:
+        {{"ideas": [{{"name": "...", "problem": "...", "solution": "...", "target_market": "...",
+                     "revenue_model": "...", "competitive_edge": "...", "implementation": "...",
+                     "success_metrics": "..."}}]}}
+        Every value is a string; "ideas" holds exactly one idea.
+        """
+    
+    def _format_market_size(self, industry_context: Mapping[str, Any]) -> str:
+        """Market size as shown in prompts, e.g. $5.2T globally"""
+        market_size = industry_context.get("market_size")
+        if not market_size:
+            return "Growing market"
+        return f"${str(market_size).lstrip('$')} globally"
+    
+    def validate_and_refine_prompt(self, prompt: str, structured: bool = False) -> str:
+        """Apply prompt validation and refinement techniques (structured: ask for JSON instead of markdown)"""
         
         # Check prompt length (optimal range: 200-1000 words)
         word_count = len(prompt.split())
@@ -214,6 +239,8 @@ class PromptEngineer:
             prompt = prompt[:4000] + "\n\nPlease provide concise but comprehensive responses."
         
         # Add result format specification
+        if structured:
+            return prompt + JSON_FORMAT_INSTRUCTION
         format_instruction = """
         
         FORMAT YOUR RESPONSE AS:
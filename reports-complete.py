@@ -0,0 +1,259 @@
+# src/business_idea_creator/utils/reports.py
+"""
+Excel and PowerPoint idea reports for Business Idea Creator
+Reports are built in the shared worker pool and cached per result set
+"""
+
+import hashlib
+import io
+import logging
+import threading
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:
+    from .history_store import IDEA_FIELDS
+    from .worker_pool import WorkerPool, get_worker_pool
+except ImportError:
+    from history_store import IDEA_FIELDS
+    from worker_pool import WorkerPool, get_worker_pool
+
+# Optional report backends
+try:
+    from openpyxl import Workbook
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    Workbook = None
+    OPENPYXL_AVAILABLE = False
+
+try:
+    from pptx import Presentation
+    from pptx.util import Pt
+    PPTX_AVAILABLE = True
+except ImportError:
+    Presentation = None
+    PPTX_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+REPORT_XLSX = "xlsx"
+REPORT_PPTX = "pptx"
+
+REPORT_MIME_TYPES = {
+    REPORT_XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    REPORT_PPTX: "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+    "zip": "application/zip"
+}
+
+# python-pptx slows down quadratically with deck size, so large decks are
+# split into parts built in parallel and shipped as a zip
+PPTX_SLIDES_PER_DECK = 250
+
+# How long submit() waits for a free worker pool slot before reporting the pool busy
+SUBMIT_TIMEOUT = 5.0
+
+FIELD_LABELS = {
+    "problem": "Problem",
+    "solution": "Solution",
+    "target_market": "Target Market",
+    "revenue_model": "Revenue Model",
+    "competitive_edge": "Competitive Edge",
+    "implementation": "Implementation",
+    "success_metrics": "Success Metrics"
+}
+
+def build_xlsx_report(results_list: List[Dict[str, Any]]) -> bytes:
+    """Build an XLSX report, streaming one row per idea (openpyxl write-only mode)"""
+    workbook = Workbook(write_only=True)
+    ideas_sheet = workbook.create_sheet("Ideas")
+    ideas_sheet.append(["Request ID", "Generated", "Industry", "Technique", "Model", "Idea #", "Name"]
+                       + [FIELD_LABELS[field] for field in IDEA_FIELDS[1:]])
+
+    ideas_per_industry: Dict[str, int] = {}
+    for results in results_list:
+        industry = results.get("input_parameters", {}).get("industry", "Unknown")
+        prefix = [results.get("request_id", ""), results.get("timestamp", ""), industry,
+                  results.get("technique_used", ""), results.get("model_used", "")]
+        for i, idea in enumerate(results.get("generated_ideas", []), 1):
+            ideas_sheet.append(prefix + [i] + [idea.get(field, "") for field in IDEA_FIELDS])
+            ideas_per_industry[industry] = ideas_per_industry.get(industry, 0) + 1
+
+    summary_sheet = workbook.create_sheet("Summary")
+    summary_sheet.append(["Industry", "Ideas"])
+    for industry, count in sorted(ideas_per_industry.items()):
+        summary_sheet.append([industry, count])
+
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+def build_pptx_report(results_list: List[Dict[str, Any]]) -> bytes:
+    """Build a PPTX deck with a title slide and one slide per idea"""
+    presentation = Presentation()
+    title_layout, content_layout = presentation.slide_layouts[0], presentation.slide_layouts[1]
+
+    total_ideas = sum(len(results.get("generated_ideas", [])) for results in results_list)
+    title_slide = presentation.slides.add_slide(title_layout)
+    title_slide.shapes.title.text = "Business Idea Report"
+    title_slide.placeholders[1].text = f"{total_ideas} ideas from {len(results_list)} generation(s)"
+
+    for results in results_list:
+        industry = results.get("input_parameters", {}).get("industry", "")
+        for i, idea in enumerate(results.get("generated_ideas", []), 1):
+            slide = presentation.slides.add_slide(content_layout)
+            slide.shapes.title.text = idea.get("name") or f"Business Idea {i}"
+
+            text_frame = slide.placeholders[1].text_frame
+            text_frame.text = f"Industry: {industry}"
+            for field, label in FIELD_LABELS.items():
+                if idea.get(field):
+                    paragraph = text_frame.add_paragraph()
+                    paragraph.text = f"{label}: {idea[field]}"
+                    paragraph.font.size = Pt(12)
+
+    buffer = io.BytesIO()
+    presentation.save(buffer)
+    return buffer.getvalue()
+
+REPORT_BUILDERS = {
+    REPORT_XLSX: build_xlsx_report,
+    REPORT_PPTX: build_pptx_report
+}
+
+def _split_by_idea_count(results_list: List[Dict[str, Any]], max_ideas: int) -> List[List[Dict[str, Any]]]:
+    """Split results into consecutive groups holding at most max_ideas ideas (never splitting a result)"""
+    groups, current, count = [], [], 0
+    for results in results_list:
+        size = len(results.get("generated_ideas", []))
+        if current and count + size > max_ideas:
+            groups.append(current)
+            current, count = [], 0
+        current.append(results)
+        count += size
+    if current:
+        groups.append(current)
+    return groups
+
+def _zip_decks(decks: List[bytes]) -> bytes:
+    """Bundle deck parts into a zip archive"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+        for i, deck in enumerate(decks, 1):
+            archive.writestr(f"business_ideas_part_{i:03d}.pptx", deck)
+    return buffer.getvalue()
+
+def result_set_key(results_list: List[Dict[str, Any]]) -> str:
+    """Stable cache key for a set of results (request ids plus revisions)"""
+    digest = hashlib.sha1()
+    for results in results_list:
+        digest.update(f"{results.get('request_id')}:{results.get('revision', 0)};".encode("utf-8"))
+    return digest.hexdigest()
+
+class ReportBuilder:
+    def __init__(self, worker_pool: Optional[WorkerPool] = None, cache_size: int = 32):
+        """Report builds on a worker pool (default: the shared one), with an LRU cache of finished reports"""
+        self.worker_pool = worker_pool or get_worker_pool()
+        self.cache_size = cache_size
+        # key -> (report bytes, file extension)
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[bytes, str]]" = OrderedDict()
+        self._pending: Set[Tuple[str, str]] = set()
+        self._errors: Dict[Tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+
+    def _submit_to_pool(self, fn, *args) -> Future:
+        """Submit to the worker pool; a busy pool yields an already failed future"""
+        try:
+            return self.worker_pool.submit(fn, *args, timeout=SUBMIT_TIMEOUT)
+        except Exception as e:
+            failed: Future = Future()
+            failed.set_exception(e)
+            return failed
+
+    def _submit_deck_parts(self, results_list: List[Dict[str, Any]]) -> Future:
+        """Build a large deck as parallel parts, resolving to a zip of the parts"""
+        part_futures = [
+            self._submit_to_pool(build_pptx_report, part)
+            for part in _split_by_idea_count(results_list, PPTX_SLIDES_PER_DECK)
+        ]
+        combined: Future = Future()
+        remaining = [len(part_futures)]
+        remaining_lock = threading.Lock()
+
+        def part_done(_):
+            with remaining_lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            try:
+                combined.set_result(_zip_decks([part.result() for part in part_futures]))
+            except Exception as e:
+                combined.set_exception(e)
+
+        for part in part_futures:
+            part.add_done_callback(part_done)
+        return combined
+
+    @staticmethod
+    def available_kinds() -> List[str]:
+        """Report kinds whose optional dependency is installed"""
+        kinds = []
+        if OPENPYXL_AVAILABLE:
+            kinds.append(REPORT_XLSX)
+        if PPTX_AVAILABLE:
+            kinds.append(REPORT_PPTX)
+        return kinds
+
+    def submit(self, kind: str, results_list: List[Dict[str, Any]]) -> Tuple[str, str]:
+        """Start building a report unless cached or in flight; returns its cache key"""
+        key = (kind, result_set_key(results_list))
+        with self._lock:
+            if key in self._cache or key in self._pending:
+                return key
+            self._errors.pop(key, None)
+            self._pending.add(key)
+        # Submitting waits up to SUBMIT_TIMEOUT for a busy pool: the key is reserved, not the lock held
+        try:
+            total_ideas = sum(len(results.get("generated_ideas", [])) for results in results_list)
+            if kind == REPORT_PPTX and total_ideas > PPTX_SLIDES_PER_DECK:
+                future, extension = self._submit_deck_parts(results_list), "zip"
+            else:
+                future, extension = self._submit_to_pool(REPORT_BUILDERS[kind], results_list), kind
+        except Exception:
+            with self._lock:
+                self._pending.discard(key)
+            raise
+        future.add_done_callback(lambda done: self._store(key, done, extension))
+        return key
+
+    def _store(self, key: Tuple[str, str], future: Future, extension: str):
+        """Move a finished build into the cache"""
+        with self._lock:
+            self._pending.discard(key)
+            if future.exception() is not None:
+                logger.error(f"Report build {key} failed: {future.exception()}")
+                self._errors[key] = str(future.exception())
+                return
+            self._cache[key] = (future.result(), extension)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def get(self, key: Tuple[str, str]) -> Optional[Tuple[bytes, str]]:
+        """Return a finished report as (bytes, file extension), or None"""
+        with self._lock:
+            report = self._cache.get(key)
+            if report is not None:
+                self._cache.move_to_end(key)
+            return report
+
+    def is_pending(self, key: Tuple[str, str]) -> bool:
+        """Whether the report is still being built"""
+        with self._lock:
+            return key in self._pending
+
+    def error(self, key: Tuple[str, str]) -> Optional[str]:
+        """Error message of a failed build, if any"""
+        with self._lock:
+            return self._errors.get(key)
@@ -0,0 +1,195 @@
+# src/business_idea_creator/utils/request_cache.py
+"""
+Similarity cache for generation requests in Business Idea Creator
+Requests are embedded as weighted one-hot vectors; a lookup serves the stored result of the
+nearest earlier request (same technique and model) when it is similar enough
+"""
+
+import copy
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from .knowledge_base import get_knowledge_base
+    from .trend_matcher import normalize_phrase
+except ImportError:
+    from knowledge_base import get_knowledge_base
+    from trend_matcher import normalize_phrase
+
+# Weight of each categorical request field; the trend set as a whole weighs TREND_WEIGHT
+FIELD_WEIGHTS = {
+    "industry": 1.0,
+    "target_audience": 0.6,
+    "innovation_level": 0.6,
+    "budget_range": 0.6,
+    "geographical_focus": 0.6
+}
+TREND_WEIGHT = 0.8
+
+# With these weights 0.9 still matches an added/removed trend (about 0.96), but not another
+# value of any single field: another budget range or region scores about 0.88
+DEFAULT_THRESHOLD = 0.9
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL = 6 * 3600.0
+
+REQUEST_FIELDS = ("industry", "target_audience", "market_trends", "budget_range",
+                  "geographical_focus", "innovation_level")
+
+def request_parameters(request) -> Dict[str, Any]:
+    """The cache-relevant fields of a BusinessIdeaRequest (or an equivalent dict)"""
+    get = request.get if isinstance(request, dict) else lambda field: getattr(request, field, None)
+    params = {field: get(field) for field in REQUEST_FIELDS}
+    params["market_trends"] = list(params["market_trends"] or [])
+    return params
+
+class SimilarityRequestCache:
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ttl: Optional[float] = DEFAULT_TTL):
+        """Empty cache holding at most max_entries results, each for at most ttl seconds"""
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        # Feature token ("industry=retail", "trend=ai integration", ...) -> matrix column
+        self._vocabulary: Dict[str, int] = {}
+        # (technique, model) -> small integer code; only entries with the same code are candidates
+        self._partitions: Dict[Tuple[str, str], int] = {}
+        # Unit-norm request vectors, one row per slot; slots are reused oldest first once full
+        self._vectors = np.zeros((min(max_entries, 64), 64), dtype=np.float32)
+        self._partition_codes = np.full(max_entries, -1, dtype=np.int32)
+        self._stored_at = np.zeros(max_entries, dtype=np.float64)
+        self._results: List[Optional[Dict[str, Any]]] = [None] * max_entries
+        self._size = 0
+        self._next_slot = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _trend_key(trend: str) -> str:
+        """Catalog name for a trend (so aliases coincide), else its normalized text"""
+        match = get_knowledge_base().trend_matcher.best_match(trend)
+        return normalize_phrase(match[0]["trend"] if match is not None else trend)
+
+    def _features(self, request) -> Dict[str, float]:
+        """Sparse weighted features of a request"""
+        params = request_parameters(request)
+        features = {
+            f"{field}={normalize_phrase(params[field] or '')}": weight
+            for field, weight in FIELD_WEIGHTS.items()
+        }
+        trends = {self._trend_key(trend) for trend in params["market_trends"]}
+        trends.discard("")
+        for trend in trends:
+            # Trend block has norm TREND_WEIGHT whatever the number of trends
+            features[f"trend={trend}"] = TREND_WEIGHT / np.sqrt(len(trends))
+        return features
+
+    def _vector(self, features: Dict[str, float], grow: bool) -> np.ndarray:
+        """Dense unit vector over the vocabulary (unknown tokens are added only when grow is set)"""
+        if grow:
+            for token in features:
+                self._vocabulary.setdefault(token, len(self._vocabulary))
+            if len(self._vocabulary) > self._vectors.shape[1]:
+                columns = max(len(self._vocabulary), 2 * self._vectors.shape[1])
+                self._vectors = np.pad(self._vectors, ((0, 0), (0, columns - self._vectors.shape[1])))
+        vector = np.zeros(self._vectors.shape[1], dtype=np.float32)
+        norm = 0.0
+        for token, weight in features.items():
+            norm += weight * weight
+            column = self._vocabulary.get(token)
+            if column is not None:
+                vector[column] = weight
+        # Normalizing by the full norm keeps unseen tokens counting against the similarity
+        return vector / np.sqrt(norm) if norm else vector
+
+    def _nearest(self, features: Dict[str, float], technique: str, model: str) -> Optional[Tuple[int, float]]:
+        """Slot and similarity of the nearest live entry within the threshold (lock held)"""
+        partition = self._partitions.get((technique, model))
+        if partition is None or not self._size:
+            return None
+        vector = self._vector(features, grow=False)
+        candidates = self._partition_codes[:self._size] == partition
+        if self.ttl is not None:
+            candidates &= self._stored_at[:self._size] >= time.time() - self.ttl
+        similarity = np.where(candidates, self._vectors[:self._size] @ vector, -1.0)
+        best = int(np.argmax(similarity))
+        return (best, float(similarity[best])) if similarity[best] >= self.threshold else None
+
+    def lookup(self, request, technique: str, model: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Stored result of the most similar cached request and its cosine similarity, or None"""
+        features = self._features(request)
+        with self._lock:
+            nearest = self._nearest(features, technique, model)
+            if nearest is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return self._results[nearest[0]], nearest[1]
+
+    def contains(self, request, technique: str, model: str) -> bool:
+        """Whether a lookup would hit (without counting towards the hit rate)"""
+        features = self._features(request)
+        with self._lock:
+            return self._nearest(features, technique, model) is not None
+
+    def store(self, request, technique: str, model: str, result: Dict[str, Any],
+              stored_at: Optional[float] = None):
+        """Cache a generation result for a request (a private copy is kept)
+
+        stored_at (epoch seconds, default now) is when the result was generated; it ages
+        out ttl seconds after that.
+        """
+        features = self._features(request)
+        result = copy.deepcopy(result)
+        with self._lock:
+            partition = self._partitions.setdefault((technique, model), len(self._partitions))
+            vector = self._vector(features, grow=True)
+            slot = self._next_slot
+            if slot == len(self._vectors):
+                rows = min(2 * len(self._vectors), self.max_entries)
+                self._vectors = np.pad(self._vectors, ((0, rows - len(self._vectors)), (0, 0)))
+            self._vectors[slot] = vector
+            self._partition_codes[slot] = partition
+            self._stored_at[slot] = time.time() if stored_at is None else stored_at
+            self._results[slot] = result
+            self._size = max(self._size, slot + 1)
+            self._next_slot = (slot + 1) % self.max_entries
+
+    def serve(self, request, technique: str, model: str, request_id: str) -> Optional[Dict[str, Any]]:
+        """A fresh copy of the nearest cached result, re-labelled for this request, or None
+
+        The copy gets request_id, the current timestamp and "cache_hit" ({"request_id",
+        "similarity"} of the result it was served from, and "served_for": this request's
+        parameters); input_parameters stay those the ideas were generated for.
+        """
+        found = self.lookup(request, technique, model)
+        if found is None:
+            return None
+        cached, similarity = found
+        result = copy.deepcopy(cached)
+        result["cache_hit"] = {
+            "request_id": cached["request_id"],
+            "similarity": round(similarity, 3),
+            "served_for": {**request_parameters(request), "technique_used": technique}
+        }
+        result["request_id"] = request_id
+        result["timestamp"] = datetime.now().isoformat()
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, hits, misses and hit rate"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": self._size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
@@ -0,0 +1,190 @@
+# src/business_idea_creator/utils/saved_ideas.py
+"""
+Saved (favorite) ideas store for Business Idea Creator
+Ideas are keyed by owner and content hash, so saving the same idea twice is a no-op
+and each user (or browser session) only sees the ideas they saved
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+try:
+    from .history_store import IDEA_FIELDS
+except ImportError:
+    from history_store import IDEA_FIELDS
+
+# Ideas of owners that cannot come back (anonymous browser sessions) are purged once the owner
+# has saved nothing for this long, as session snapshots are
+EPHEMERAL_MAX_AGE = 7 * 24 * 3600.0
+
+def idea_fingerprint(idea: Dict[str, Any]) -> str:
+    """Stable content hash of an idea's fields (case and whitespace insensitive)"""
+    normalized = [re.sub(r"\s+", " ", str(idea.get(field) or "")).strip().lower() for field in IDEA_FIELDS]
+    return hashlib.blake2b(json.dumps(normalized).encode("utf-8"), digest_size=16).hexdigest()
+
+class SavedIdeasStore:
+    def __init__(self, db_path: str):
+        """Open (or create) the saved ideas database at db_path"""
+        self.db_path = db_path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self):
+        """Create the table and indexes"""
+        conn = self._connect()
+        with conn:
+            columns = [row["name"] for row in conn.execute("PRAGMA table_info(saved_ideas)")]
+            if columns and "owner" not in columns:
+                # Stores from before ideas had owners: keep their rows, unowned (shown to nobody)
+                conn.execute("ALTER TABLE saved_ideas RENAME TO saved_ideas_unowned")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS saved_ideas (
+                    owner TEXT NOT NULL,
+                    hash TEXT NOT NULL,
+                    industry TEXT,
+                    saved_at REAL NOT NULL,
+                    request_id TEXT,
+                    idea TEXT NOT NULL,
+                    ephemeral INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (owner, hash)
+                )
+            """)
+            if columns and "owner" in columns and "ephemeral" not in columns:
+                conn.execute("ALTER TABLE saved_ideas ADD COLUMN ephemeral INTEGER NOT NULL DEFAULT 0")
+            if columns and "owner" not in columns:
+                conn.execute(
+                    "INSERT INTO saved_ideas (owner, hash, industry, saved_at, request_id, idea) "
+                    "SELECT '', hash, industry, saved_at, request_id, idea FROM saved_ideas_unowned"
+                )
+                conn.execute("DROP TABLE saved_ideas_unowned")
+            conn.execute("DROP INDEX IF EXISTS idx_saved_industry")
+            conn.execute("DROP INDEX IF EXISTS idx_saved_at")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_saved_owner_industry ON saved_ideas (owner, industry, saved_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_saved_owner_at ON saved_ideas (owner, saved_at)")
+
+    def for_owner(self, owner: str, ephemeral: bool = False) -> "OwnedSavedIdeas":
+        """View of the ideas saved by one owner (a user or browser session id); an ephemeral
+        owner's ideas are purged by purge_ephemeral once the owner is inactive"""
+        return OwnedSavedIdeas(self, owner, ephemeral)
+
+    def contains(self, idea_or_hash: Union[str, Dict[str, Any]], owner: str) -> bool:
+        """Primary-key lookup of whether owner saved an idea (by idea or fingerprint)"""
+        key = idea_or_hash if isinstance(idea_or_hash, str) else idea_fingerprint(idea_or_hash)
+        return self._connect().execute(
+            "SELECT 1 FROM saved_ideas WHERE owner = ? AND hash = ?", (owner, key)
+        ).fetchone() is not None
+
+    def add(self, idea: Dict[str, Any], owner: str, industry: Optional[str] = None,
+            request_id: Optional[str] = None, ephemeral: bool = False) -> Tuple[str, bool]:
+        """Save an idea for owner; returns (fingerprint, whether it was newly added)"""
+        key = idea_fingerprint(idea)
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO saved_ideas (owner, hash, industry, saved_at, request_id, idea, ephemeral) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (owner, key, industry, time.time(), request_id, json.dumps(idea), int(ephemeral))
+            )
+        return key, cursor.rowcount > 0
+
+    def remove(self, key: str, owner: str) -> bool:
+        """Remove one of owner's saved ideas by fingerprint"""
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute("DELETE FROM saved_ideas WHERE owner = ? AND hash = ?", (owner, key))
+        return cursor.rowcount > 0
+
+    def purge_ephemeral(self, max_age: float = EPHEMERAL_MAX_AGE) -> int:
+        """Delete the ideas of ephemeral owners who saved nothing for max_age seconds; returns how many"""
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute(
+                "DELETE FROM saved_ideas WHERE ephemeral = 1 AND owner IN ("
+                "SELECT owner FROM saved_ideas WHERE ephemeral = 1 GROUP BY owner HAVING MAX(saved_at) < ?)",
+                (time.time() - max_age,)
+            )
+        return cursor.rowcount
+
+    def count(self, owner: str, industry: Optional[str] = None) -> int:
+        """Number of ideas saved by owner, optionally for one industry"""
+        if industry:
+            return self._connect().execute(
+                "SELECT COUNT(*) FROM saved_ideas WHERE owner = ? AND industry = ?", (owner, industry)
+            ).fetchone()[0]
+        return self._connect().execute(
+            "SELECT COUNT(*) FROM saved_ideas WHERE owner = ?", (owner,)
+        ).fetchone()[0]
+
+    def list(self, owner: str, page: int = 1, page_size: int = 20,
+             industry: Optional[str] = None) -> List[Dict[str, Any]]:
+        """One page of owner's saved ideas, newest first"""
+        where, args = ("AND industry = ?", [owner, industry]) if industry else ("", [owner])
+        rows = self._connect().execute(
+            f"SELECT hash, industry, saved_at, request_id, idea FROM saved_ideas WHERE owner = ? {where} "
+            f"ORDER BY saved_at DESC LIMIT ? OFFSET ?",
+            args + [page_size, (max(page, 1) - 1) * page_size]
+        ).fetchall()
+        return [
+            {
+                "hash": row["hash"],
+                "industry": row["industry"],
+                "saved_at": row["saved_at"],
+                "request_id": row["request_id"],
+                "idea": json.loads(row["idea"])
+            }
+            for row in rows
+        ]
+
+    def industries(self, owner: str) -> List[str]:
+        """Industries that owner has saved ideas for"""
+        rows = self._connect().execute(
+            "SELECT DISTINCT industry FROM saved_ideas WHERE owner = ? AND industry IS NOT NULL ORDER BY industry",
+            (owner,)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+class OwnedSavedIdeas:
+    def __init__(self, store: SavedIdeasStore, owner: str, ephemeral: bool = False):
+        """One owner's saved ideas, with the store's interface minus the owner argument"""
+        self.store = store
+        self.owner = owner
+        self.ephemeral = ephemeral
+
+    def __contains__(self, idea_or_hash: Union[str, Dict[str, Any]]) -> bool:
+        return self.store.contains(idea_or_hash, self.owner)
+
+    def __len__(self) -> int:
+        return self.store.count(self.owner)
+
+    def add(self, idea: Dict[str, Any], industry: Optional[str] = None,
+            request_id: Optional[str] = None) -> Tuple[str, bool]:
+        return self.store.add(idea, self.owner, industry=industry, request_id=request_id, ephemeral=self.ephemeral)
+
+    def remove(self, key: str) -> bool:
+        return self.store.remove(key, self.owner)
+
+    def count(self, industry: Optional[str] = None) -> int:
+        return self.store.count(self.owner, industry)
+
+    def list(self, page: int = 1, page_size: int = 20, industry: Optional[str] = None) -> List[Dict[str, Any]]:
+        return self.store.list(self.owner, page, page_size, industry)
+
+    def industries(self) -> List[str]:
+        return self.store.industries(self.owner)
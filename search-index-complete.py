@@ -0,0 +1,182 @@
+# src/business_idea_creator/utils/search_index.py
+"""
+Full-text search over idea history for Business Idea Creator
+In-memory inverted index with BM25 ranking, kept in sync with the HistoryStore incrementally
+A regenerated idea is stored as a new row, which supersedes the document of the row it replaced
+"""
+
+import math
+import re
+import threading
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from .history_store import IDEA_FIELDS, DateLike, _to_timestamp
+except ImportError:
+    from history_store import IDEA_FIELDS, DateLike, _to_timestamp
+
+# Name terms count this many times, so title matches rank first
+NAME_BOOST = 3
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in into is it its of on or that the their this to
+with will we you your our can more than through using via
+""".split())
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric terms without stopwords"""
+    return [token for token in re.findall(r"[a-z0-9]+", str(text).lower())
+            if len(token) > 1 and token not in STOPWORDS]
+
+class SearchIndex:
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        """Empty index; call sync() to load ideas from a HistoryStore"""
+        self.k1 = k1
+        self.b = b
+        # Last HistoryStore row id indexed, so sync() only reads newer rows
+        self.last_id = 0
+
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        # term -> (document positions, term frequencies), compact and append-only
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        self._doc_ids = array("q")
+        # 1 for current documents, 0 for ones superseded by a later row for the same idea
+        self._live = array("B")
+        self._live_count = 0
+        # (request_id, idea_index) -> document position, to find the document a new row supersedes
+        self._slots: Dict[Tuple[Any, Any], int] = {}
+        self._doc_lengths = array("f")
+        self._created_ts = array("d")
+        self._industry_codes = array("i")
+        self._technique_codes = array("i")
+        self._owner_codes = array("i")
+        self._total_length = 0.0
+        # Categorical value -> small integer code, per column
+        self._codes: Dict[str, Dict[Optional[str], int]] = {"industry": {}, "technique": {}, "owner": {}}
+
+    def __len__(self) -> int:
+        return self._live_count
+
+    def _code(self, column: str, value: Optional[str]) -> int:
+        codes = self._codes[column]
+        return codes.setdefault(value, len(codes))
+
+    def add(self, doc_id: int, row: Dict[str, Any]):
+        """Index one idea row (HistoryStore columns) under doc_id, superseding an earlier row
+        with the same request_id and idea_index"""
+        terms: Dict[str, int] = {}
+        for field in IDEA_FIELDS:
+            weight = NAME_BOOST if field == "name" else 1
+            for term in tokenize(row.get(field) or ""):
+                terms[term] = terms.get(term, 0) + weight
+        length = float(sum(terms.values()))
+
+        with self._lock:
+            position = len(self._doc_ids)
+            slot = (row.get("request_id"), row.get("idea_index"))
+            if slot[0] is not None:
+                superseded = self._slots.get(slot)
+                if superseded is not None and self._live[superseded]:
+                    self._live[superseded] = 0
+                    self._live_count -= 1
+                    self._total_length -= self._doc_lengths[superseded]
+                self._slots[slot] = position
+            self._doc_ids.append(doc_id)
+            self._live.append(1)
+            self._live_count += 1
+            self._doc_lengths.append(length)
+            self._created_ts.append(_to_timestamp(row.get("created_at")) or 0.0)
+            self._industry_codes.append(self._code("industry", row.get("industry")))
+            self._technique_codes.append(self._code("technique", row.get("technique")))
+            self._owner_codes.append(self._code("owner", row.get("owner")))
+            self._total_length += length
+            for term, frequency in terms.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    postings = self._postings[term] = (array("i"), array("f"))
+                postings[0].append(position)
+                postings[1].append(frequency)
+            self.last_id = max(self.last_id, doc_id)
+
+    def sync(self, store, chunk_size: int = 5000) -> int:
+        """Index ideas added to the store since the last sync; returns how many were added"""
+        added = 0
+        with self._sync_lock:
+            for chunk in store.iter_idea_chunks(chunk_size=chunk_size, after_id=self.last_id,
+                                                include_id=True, include_owner=True):
+                for row in chunk:
+                    self.add(row["id"], row)
+                added += len(chunk)
+        return added
+
+    def search(self, query: str, limit: int = 20, industry: Optional[str] = None,
+               technique: Optional[str] = None, start: DateLike = None,
+               end: DateLike = None, owner: Optional[str] = None) -> List[Tuple[int, float]]:
+        """Top (doc_id, BM25 score) pairs for a query, best first (only owner's ideas, if given)"""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        with self._lock:
+            # Array views over the index buffers must not outlive the lock (appends resize them)
+            return self._search_locked(terms, limit, industry, technique,
+                                       _to_timestamp(start), _to_timestamp(end), owner)
+
+    def _search_locked(self, terms: List[str], limit: int, industry: Optional[str],
+                       technique: Optional[str], start_ts: Optional[float],
+                       end_ts: Optional[float], owner: Optional[str]) -> List[Tuple[int, float]]:
+        num_docs = len(self._doc_ids)
+        if not self._live_count:
+            return []
+        doc_lengths = np.frombuffer(self._doc_lengths, dtype=np.float32, count=num_docs)
+        live = np.frombuffer(self._live, dtype=np.uint8, count=num_docs).astype(bool)
+        average_length = self._total_length / self._live_count
+        scores = np.zeros(num_docs, dtype=np.float32)
+
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            positions = np.frombuffer(postings[0], dtype=np.int32)
+            frequencies = np.frombuffer(postings[1], dtype=np.float32)
+            if self._live_count < num_docs:
+                current = live[positions]
+                positions, frequencies = positions[current], frequencies[current]
+            document_frequency = len(positions)
+            if not document_frequency:
+                continue
+            idf = math.log(1 + (self._live_count - document_frequency + 0.5) / (document_frequency + 0.5))
+            norm = self.k1 * (1 - self.b + self.b * doc_lengths[positions] / average_length)
+            scores[positions] += idf * frequencies * (self.k1 + 1) / (frequencies + norm)
+
+        mask = scores > 0
+        if industry:
+            code = self._codes["industry"].get(industry)
+            if code is None:
+                return []
+            mask &= np.frombuffer(self._industry_codes, dtype=np.int32, count=num_docs) == code
+        if technique:
+            code = self._codes["technique"].get(technique)
+            if code is None:
+                return []
+            mask &= np.frombuffer(self._technique_codes, dtype=np.int32, count=num_docs) == code
+        if owner is not None:
+            code = self._codes["owner"].get(owner)
+            if code is None:
+                return []
+            mask &= np.frombuffer(self._owner_codes, dtype=np.int32, count=num_docs) == code
+        if start_ts is not None or end_ts is not None:
+            created = np.frombuffer(self._created_ts, dtype=np.float64, count=num_docs)
+            if start_ts is not None:
+                mask &= created >= start_ts
+            if end_ts is not None:
+                mask &= created < end_ts
+
+        candidates = np.flatnonzero(mask)
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(self._doc_ids[position], float(scores[position])) for position in candidates.tolist()]
@@ -0,0 +1,119 @@
+# src/business_idea_creator/utils/session_store.py
+"""
+Session snapshots for Business Idea Creator
+Compressed pickle snapshots of a session's state in SQLite, so a session can be resumed
+after a server restart instead of regenerating its results
+"""
+
+import logging
+import os
+import pickle
+import re
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+from typing import Any, Dict, Optional
+
+# Optional faster compression
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Snapshots not updated for this long are purged
+DEFAULT_MAX_AGE = 7 * 24 * 3600.0
+
+_SESSION_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+def new_session_id() -> str:
+    """Random, unguessable session id"""
+    return uuid.uuid4().hex
+
+def is_valid_session_id(session_id: Optional[str]) -> bool:
+    return bool(session_id and _SESSION_ID_PATTERN.match(session_id))
+
+def _compress(data: bytes) -> bytes:
+    if ZSTD_AVAILABLE:
+        return b"Z" + zstandard.ZstdCompressor(level=3).compress(data)
+    return b"z" + zlib.compress(data, 6)
+
+def _decompress(blob: bytes) -> bytes:
+    if blob[:1] == b"Z":
+        return zstandard.ZstdDecompressor().decompress(blob[1:])
+    return zlib.decompress(blob[1:])
+
+class SessionStore:
+    def __init__(self, db_path: str, max_age: float = DEFAULT_MAX_AGE):
+        """Open (or create) the session snapshot database at db_path"""
+        self.db_path = db_path
+        self.max_age = max_age
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self):
+        """Create the snapshots table"""
+        conn = self._connect()
+        with conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS snapshots (
+                    session_id TEXT PRIMARY KEY,
+                    updated_ts REAL NOT NULL,
+                    data BLOB NOT NULL
+                )
+            """)
+
+    def save(self, session_id: str, state: Dict[str, Any]) -> int:
+        """Store a snapshot of state (picklable values only); returns its size in bytes"""
+        blob = _compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO snapshots (session_id, updated_ts, data) VALUES (?, ?, ?)",
+                (session_id, time.time(), blob)
+            )
+        return len(blob)
+
+    def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """The latest snapshot of a session, or None if there is none (or it cannot be read)"""
+        row = self._connect().execute(
+            "SELECT data FROM snapshots WHERE session_id = ? AND updated_ts >= ?",
+            (session_id, time.time() - self.max_age)
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            return pickle.loads(_decompress(row[0]))
+        except Exception as e:
+            # E.g. written by an incompatible version of the app
+            logger.warning(f"Discarding unreadable session snapshot {session_id}: {e}")
+            self.delete(session_id)
+            return None
+
+    def delete(self, session_id: str):
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM snapshots WHERE session_id = ?", (session_id,))
+
+    def purge_expired(self) -> int:
+        """Delete snapshots older than max_age; returns how many were deleted"""
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute("DELETE FROM snapshots WHERE updated_ts < ?", (time.time() - self.max_age,))
+        return cursor.rowcount
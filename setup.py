@@ -14,7 +14,7 @@ def read_requirements():
             return [line.strip() for line in f if line.strip() and not line.startswith('#')]
     except FileNotFoundError:
         return [
-            'streamlit>=1.28.0',
+            'streamlit>=1.50.0',
             'openai>=1.3.0', 
             'pandas>=1.5.0',
             'plotly>=5.11.0',
@@ -34,6 +34,7 @@ setup(
     # Package configuration
     package_dir={"": "src"},
     packages=find_packages(where="src"),
+    package_data={"business_idea_creator": ["data/*.json"]},
     
     # Dependencies
     install_requires=read_requirements(),
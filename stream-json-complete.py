@@ -0,0 +1,71 @@
+# src/business_idea_creator/utils/stream_json.py
+"""
+Incremental JSON decoding for Business Idea Creator
+Scans a JSON document as it streams in and decodes each element object of the item array
+({"ideas": [{...}, ...]} or a bare [{...}, ...]) as soon as its closing brace arrives
+"""
+
+import json
+import logging
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Container stacks whose next object is an item: inside a top-level array, or an array
+# that is a value of the top-level object
+_ITEM_PARENTS = (["["], ["{", "["])
+
+class ItemStreamDecoder:
+    def __init__(self):
+        """Decoder for one streamed document; feed() it chunks in order"""
+        self.text = ""
+        self._position = 0
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escaped = False
+        self._item_start = -1
+        self.items: List[Dict[str, Any]] = []
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """Add the next chunk; returns the items completed by it"""
+        self.text += chunk
+        text = self.text
+        completed = []
+        for position in range(self._position, len(text)):
+            char = text[position]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                if char == "{" and self._stack in _ITEM_PARENTS:
+                    self._item_start = position
+                self._stack.append(char)
+            elif char in "}]" and self._stack:
+                self._stack.pop()
+                if char == "}" and self._item_start >= 0 and self._stack in _ITEM_PARENTS:
+                    item = self._decode(text[self._item_start:position + 1])
+                    self._item_start = -1
+                    if item is not None:
+                        completed.append(item)
+        self._position = len(text)
+        self.items.extend(completed)
+        return completed
+
+    def _decode(self, text: str) -> Any:
+        try:
+            item = json.loads(text)
+        except json.JSONDecodeError as e:
+            # A malformed item is skipped; later items can still be decoded
+            logger.warning(f"Skipping undecodable streamed item: {e}")
+            return None
+        return item if isinstance(item, dict) else None
+
+def decode_items(text: str) -> List[Dict[str, Any]]:
+    """Item objects of a complete document (tolerates truncation: complete items are kept)"""
+    return ItemStreamDecoder().feed(text)
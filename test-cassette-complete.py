@@ -0,0 +1,35 @@
+# tests/test_cassette.py
+"""
+Recorded response tests for Business Idea Creator
+"""
+
+def test_cassette_replays_recorded_responses():
+    """Test that a recorded completion is replayed (plain and streamed) without calling send"""
+    import os
+    import tempfile
+    from types import SimpleNamespace
+    from business_idea_creator.utils.cassette import RECORD, REPLAY, Cassette, CassetteMissError
+    
+    request = {"model": "gpt-3.5-turbo", "messages": [{"role": "user", "content": "ideas"}], "max_tokens": 1700}
+    response = SimpleNamespace(
+        choices=[SimpleNamespace(index=0, message=SimpleNamespace(content="## Business Idea One"))],
+        usage=SimpleNamespace(prompt_tokens=10, completion_tokens=5, total_tokens=15)
+    )
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "calls.jsonl.gz")
+        assert Cassette(path, mode=RECORD).call(request, lambda: response) is response
+        
+        replay = Cassette(path, mode=REPLAY)
+        replayed = replay.call(request, lambda: None)
+        assert replayed.choices[0].message.content == "## Business Idea One"
+        assert replayed.usage.total_tokens == 15
+        
+        chunks = list(replay.call(dict(request, stream=True), lambda: None))
+        assert "".join(chunk.choices[0].delta.content for chunk in chunks if chunk.choices) == "## Business Idea One"
+        
+        try:
+            replay.call(dict(request, max_tokens=500), lambda: None)
+            assert False, "a different request must not be replayed"
+        except CassetteMissError:
+            pass
@@ -0,0 +1,37 @@
+# tests/test_circuit_breaker.py
+"""
+Circuit breaker tests for Business Idea Creator
+"""
+
+def test_circuit_breaker_opens_and_probes():
+    """Test that a breaker opens on upstream failures and closes after a successful probe"""
+    import time
+    from business_idea_creator.utils.circuit_breaker import CLOSED, OPEN, CircuitBreaker, CircuitOpenError
+    
+    def fail():
+        raise ConnectionError("upstream down")
+    
+    breaker = CircuitBreaker("test", min_calls=3, open_seconds=0.05)
+    for _ in range(3):
+        try:
+            breaker.call(fail)
+        except ConnectionError:
+            pass
+    assert breaker.state == OPEN
+    try:
+        breaker.call(lambda: "called")
+        assert False, "expected CircuitOpenError"
+    except CircuitOpenError:
+        pass
+    
+    time.sleep(0.06)
+    assert breaker.call(lambda: "probe") == "probe"
+    assert breaker.state == CLOSED
+    
+    # Errors that do not implicate the upstream never open it
+    for _ in range(5):
+        try:
+            breaker.call(lambda: int("bad request"), is_failure=lambda e: isinstance(e, ConnectionError))
+        except ValueError:
+            pass
+    assert breaker.state == CLOSED
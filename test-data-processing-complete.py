@@ -0,0 +1,72 @@
+# tests/test_data_processing.py
+"""
+Market data tests: trends, the dataset file and the shared knowledge base for Business Idea Creator
+"""
+
+def test_trend_matching_resolves_aliases():
+    """Test that sidebar trend names resolve to catalog trends"""
+    from business_idea_creator.utils.data_processing import DataProcessor
+    
+    analysis = DataProcessor().analyze_market_trends(["Artificial Intelligence", "E-commerce", "Space Tourism"])
+    assert analysis["Artificial Intelligence"]["matched_trend"] == "AI Integration"
+    assert analysis["E-commerce"]["match_score"] == 1.0
+    assert "Space Tourism" not in analysis
+    assert DataProcessor().trend_matcher.find_in_text("An AI-powered telehealth app") == {
+        "AI Integration": 1, "Digital Health": 1
+    }
+
+def test_market_dataset_loads_and_reloads(tmp_path):
+    """Test file-backed industry insights with regional fallback and hot reload"""
+    from business_idea_creator.utils.market_dataset import MarketDataset
+    import os
+    
+    path = tmp_path / "market.csv"
+    path.write_text(
+        "industry,region,market_size,growth_rate,key_players\n"
+        "Energy,Global,7.0T,0.05,NextEra;Orsted\n"
+        "Energy,Europe,1.9T,0.07,Orsted\n"
+    )
+    dataset = MarketDataset(str(path), reload_interval=0)
+    assert dataset.get("energy", "Europe")["growth_rate"] == 0.07
+    assert dataset.get("Energy", "Asia Pacific")["key_players"] == ["NextEra", "Orsted"]
+    assert dataset.get("Gaming") == {}
+    
+    path.write_text("industry,region,market_size\nGaming,Global,0.2T\n")
+    os.utime(path, (os.path.getmtime(path) + 10,) * 2)
+    assert dataset.industries() == ["Gaming"]
+    assert dataset.get("Gaming")["market_size"] == "0.2T"
+    
+    # The bundled dataset is found by default
+    from business_idea_creator.utils.market_dataset import PYARROW_AVAILABLE, get_market_dataset
+    assert "Technology" in get_market_dataset().industries()
+    
+    if PYARROW_AVAILABLE:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        path = tmp_path / "market.parquet"
+        pq.write_table(pa.table({"industry": ["Energy", "Gaming"], "region": ["Global", "Global"],
+                                 "market_size": ["7.0T", "0.2T"]}), str(path))
+        dataset = MarketDataset(str(path))
+        assert dataset.get("gaming")["market_size"] == "0.2T"
+        assert list(dataset._columnar_rows) == ["gaming"]
+
+def test_knowledge_base_is_shared_and_read_only():
+    """Test that prompts and insights read one frozen knowledge base"""
+    from business_idea_creator.prompt_engine import PromptEngineer
+    from business_idea_creator.utils.data_processing import DataProcessor
+    
+    insights = DataProcessor().get_industry_insights("Healthcare")
+    assert PromptEngineer().knowledge_base is DataProcessor().knowledge_base
+    assert insights is DataProcessor().get_industry_insights("healthcare")
+    assert DataProcessor().industry_data["healthcare"] is insights
+    try:
+        DataProcessor().industry_data["gaming"] = {}
+        assert False, "industry data should be read-only"
+    except TypeError:
+        pass
+    try:
+        insights["market_size"] = "0"
+        assert False, "insights should be read-only"
+    except TypeError:
+        pass
@@ -0,0 +1,55 @@
+# tests/test_dedup.py
+"""
+Duplicate detection tests for Business Idea Creator
+"""
+
+def test_near_duplicate_ideas_are_flagged(tmp_path):
+    """Test MinHash LSH flagging of repeated ideas across results"""
+    from business_idea_creator.utils.dedup import NearDuplicateIndex
+    from business_idea_creator.utils.history_store import HistoryStore
+    
+    index = NearDuplicateIndex()
+    first = {"request_id": "req_1", "generated_ideas": [
+        {"name": "AI-Powered Retail Platform", "problem": "Retailers struggle with inventory forecasting",
+         "solution": "An AI platform that predicts demand and automates reordering"}
+    ]}
+    second = {"request_id": "req_2", "generated_ideas": [
+        {"name": "AI Powered Retail Platform", "problem": "Retailers struggle with inventory forecasting",
+         "solution": "An AI platform that predicts demand and automates reordering for stores"},
+        {"name": "Pet Care Subscription", "problem": "Busy owners forget supplies",
+         "solution": "Monthly boxes of food and toys"}
+    ]}
+    assert index.flag_duplicates(first) == 0
+    assert index.flag_duplicates(second, drop=True) == 1
+    assert [idea["name"] for idea in second["generated_ideas"]] == ["Pet Care Subscription"]
+    assert len(index) == 2
+    
+    bounded = NearDuplicateIndex(max_size=1)
+    bounded.flag_duplicates(first)
+    bounded.flag_duplicates({"request_id": "req_3", "generated_ideas": [second["generated_ideas"][0]]})
+    assert len(bounded) == 1 and ("req_1", "AI-Powered Retail Platform") not in bounded
+    assert bounded.flag_duplicates({"request_id": "req_4", "generated_ideas": [dict(first["generated_ideas"][0])]}) == 0
+    
+    # Seeded history is evicted oldest first, and ideas without text never match each other
+    store = HistoryStore(str(tmp_path / "history.db"))
+    for i, topic in enumerate(["Bakery delivery", "Tutoring marketplace", "Solar installers"]):
+        store.add_result({"request_id": f"old_{i}", "generated_ideas": [{"name": topic}]})
+    seeded = NearDuplicateIndex(max_size=2)
+    assert seeded.seed_from_history(store) == 2 and ("old_0", "Bakery delivery") not in seeded
+    seeded.insert(("live", "Pet sitting"), "Pet sitting")
+    assert ("old_1", "Tutoring marketplace") not in seeded and ("old_2", "Solar installers") in seeded
+    assert index.flag_duplicates({"request_id": "req_5", "generated_ideas": [{}, {"name": " "}]}) == 0
+
+def test_merge_variant_ideas_drops_repeats():
+    """Test that ideas repeated across variants are merged"""
+    from business_idea_creator.utils.dedup import merge_variant_ideas
+    
+    first = {"name": "Meal Planner", "problem": "Busy parents skip healthy dinners", "solution": "AI weekly meal plans"}
+    repeat = dict(first, name="Meal Planner App")
+    other = {"name": "Bike Repair Van", "problem": "Commuters lose days to repairs", "solution": "Mobile repair service"}
+    
+    merged = merge_variant_ideas([[first], [repeat, other]])
+    assert [idea["name"] for idea in merged] == ["Meal Planner", "Bike Repair Van"]
+    
+    from business_idea_creator.idea_generator import BusinessIdeaGenerator
+    assert BusinessIdeaGenerator(api_key=None)._parse_variants(["no ideas here", ""]) == []
@@ -0,0 +1,41 @@
+# tests/test_exporters.py
+"""
+Exporter tests for Business Idea Creator
+"""
+
+def test_results_to_csv():
+    """Test CSV export of a generation result"""
+    from business_idea_creator.utils.exporters import results_to_csv
+    
+    results = {"generated_ideas": [{"name": "Idea A", "problem": "Slow, costly"}, {}]}
+    lines = results_to_csv(results).splitlines()
+    assert lines[0].startswith("Idea #,Name,Problem")
+    assert lines[1].startswith('1,Idea A,"Slow, costly"')
+    assert lines[2].startswith("2,Idea 2,")
+
+def test_history_export_streams_filtered_rows(tmp_path):
+    """Test streaming export of persisted history with filters and compression"""
+    from business_idea_creator.utils.history_store import HistoryStore
+    from business_idea_creator.utils.exporters import export_history
+    import gzip
+    import json
+    
+    store = HistoryStore(str(tmp_path / "history.db"))
+    for i, industry in enumerate(["Technology", "Healthcare", "Technology"]):
+        store.add_result({
+            "request_id": f"req_{i}",
+            "timestamp": f"2024-01-0{i + 1}T12:00:00",
+            "input_parameters": {"industry": industry},
+            "technique_used": "chain_of_thought",
+            "generated_ideas": [{"name": f"Idea {i}-{j}"} for j in range(3)]
+        }, owner="alice" if i == 2 else None)
+    
+    path = str(tmp_path / "ideas.jsonl.gz")
+    rows = export_history(store, path, "jsonl", "gzip", chunk_size=2, industry="Technology")
+    with gzip.open(path, "rt") as f:
+        exported = [json.loads(line) for line in f]
+    
+    assert rows == 6
+    assert [row["name"] for row in exported][:3] == ["Idea 0-0", "Idea 0-1", "Idea 0-2"]
+    assert store.count_ideas(start="2024-01-02", end="2024-01-03") == 3
+    assert export_history(store, str(tmp_path / "alice.jsonl"), "jsonl", owner="alice") == 3
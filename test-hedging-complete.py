@@ -0,0 +1,40 @@
+# tests/test_hedging.py
+"""
+Hedged request tests for Business Idea Creator
+"""
+
+def test_hedger_backs_up_slow_calls():
+    """Test that a call slower than the tracked percentile is hedged and the backup wins"""
+    import threading
+    import time
+    from business_idea_creator.utils.hedging import MIN_SAMPLES, Hedger
+    
+    hedger = Hedger(max_hedge_rate=0.5)
+    # Calls that cannot be hedged yet run on the caller's thread
+    assert hedger.call("model", threading.get_ident) == threading.get_ident()
+    for _ in range(MIN_SAMPLES):
+        hedger.call("model", lambda: "fast")
+    
+    attempts = []
+    
+    def first_slow():
+        attempts.append(1)
+        time.sleep(1.0 if len(attempts) == 1 else 0.0)
+        return len(attempts)
+    
+    started = time.monotonic()
+    assert hedger.call("model", first_slow) == 2
+    assert time.monotonic() - started < 0.9
+    assert hedger.stats()["hedge_wins"] == 1
+    
+    # Streamed calls are hedged on their time to first token, so a long stream is not backed up
+    for _ in range(MIN_SAMPLES):
+        hedger.call("model", lambda first_token: first_token(), streamed=True)
+    
+    def long_stream(first_token):
+        assert first_token()
+        time.sleep(1.0)
+        return "streamed"
+    
+    assert hedger.call("model", long_stream, streamed=True) == "streamed"
+    assert hedger.stats()["hedged"] == 1
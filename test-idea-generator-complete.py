@@ -0,0 +1,46 @@
+# tests/test_idea_generator.py
+"""
+Idea generator tests for Business Idea Creator
+"""
+
+def test_call_deadlines_stay_within_the_slo():
+    """Test that a call's deadline follows the model's predicted latency without exceeding the SLO"""
+    from types import SimpleNamespace
+    from business_idea_creator.idea_generator import BusinessIdeaGenerator
+    from business_idea_creator.utils.model_router import ModelRouter, completion_tokens_for
+    
+    timeouts = []
+    response = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="ok"))], usage=None)
+    client = SimpleNamespace(base_url="deadline-stub",
+                             chat=SimpleNamespace(completions=SimpleNamespace(create=lambda **params: response)))
+    client.with_options = lambda timeout, max_retries: timeouts.append(timeout) or client
+    generator = BusinessIdeaGenerator(api_key=None, router=ModelRouter(), request_timeout=45)
+    generator.client = client
+    
+    messages = [{"role": "user", "content": "ideas"}]
+    generator._create_completion("gpt-4", messages, max_tokens=completion_tokens_for(5))
+    generator._create_completion("gpt-4", messages, max_tokens=completion_tokens_for(5), slo_seconds=30)
+    generator._create_completion("gpt-3.5-turbo", messages, max_tokens=100)
+    assert timeouts[:2] == [45, 30] and timeouts[2] < 45
+
+def test_regenerate_idea_replaces_only_one_idea():
+    """Test that regenerating an idea keeps its siblings and bumps the result revision"""
+    from business_idea_creator.idea_generator import BusinessIdeaGenerator
+    from business_idea_creator.prompt_engine import BusinessIdeaRequest
+    from business_idea_creator.utils.dedup import NearDuplicateIndex
+    
+    generator = BusinessIdeaGenerator(api_key=None, duplicate_index=NearDuplicateIndex())
+    request = BusinessIdeaRequest(
+        industry="Technology", target_audience="Small Businesses", market_trends=["AI Integration"],
+        budget_range="$10K - $50K", geographical_focus="Global", innovation_level="disruptive"
+    )
+    generator.mock_mode = True
+    results = generator.generate_ideas(request)
+    ideas = results["generated_ideas"]
+    assert (results["request_id"], ideas[1]["name"]) in generator.duplicate_index
+    
+    updated = generator.regenerate_idea(results, 1)
+    assert updated["revision"] == 1 and "revision" not in results
+    assert updated["generated_ideas"][0] == ideas[0] and updated["generated_ideas"][2] == ideas[2]
+    assert updated["generated_ideas"][1]["name"] not in [idea["name"] for idea in ideas]
+    assert (results["request_id"], ideas[1]["name"]) not in generator.duplicate_index
@@ -0,0 +1,22 @@
+# tests/test_idea_scoring.py
+"""
+Idea scoring tests for Business Idea Creator
+"""
+
+def test_idea_scoring_ranks_top_k():
+    """Test batch scoring and top-k ranking of ideas"""
+    from business_idea_creator.utils.idea_scoring import IdeaScorer, top_k
+    
+    ideas = [
+        {"name": "Blank"},
+        {
+            "name": "GreenRoute AI",
+            "problem": "Delivery fleets waste fuel on inefficient routes and idle time every day.",
+            "solution": "An AI-powered routing platform that cuts emissions for sustainable logistics.",
+            "implementation": "Launch a SaaS pilot with a $40K budget.",
+        },
+        {"name": "Corner Shop", "problem": "Local shops lack visibility.", "solution": "A directory."},
+    ]
+    scores = IdeaScorer().score(ideas, "$10K - $50K", ["Artificial Intelligence"])
+    assert scores.shape == (3,) and ((0 <= scores) & (scores <= 1)).all()
+    assert top_k(scores, 2).tolist() == [1, 2]
@@ -0,0 +1,133 @@
+# tests/test_job_queue.py
+"""
+Job queue tests for Business Idea Creator
+"""
+
+def test_job_queue_runs_and_persists_jobs(tmp_path):
+    """Test that queued jobs run in the background and survive a new queue instance"""
+    from business_idea_creator.utils.job_queue import JobQueue, JOB_DONE
+    import time
+    
+    db_path = str(tmp_path / "jobs.db")
+    queue = JobQueue(db_path, num_workers=1, poll_interval=0.05)
+    queue.register("double", lambda payload, context: {"value": payload["value"] * 2})
+    job_id = queue.enqueue("double", {"value": 21})
+    queue.start()
+    
+    for _ in range(100):
+        if queue.get(job_id)["status"] == JOB_DONE:
+            break
+        time.sleep(0.05)
+    queue.stop()
+    
+    reopened = JobQueue(db_path)
+    assert reopened.get(job_id)["result"] == {"value": 42}
+
+def test_job_leases_are_renewed_and_pinned_jobs_wait_for_their_queue(tmp_path):
+    """Test that a job outliving its lease is not run twice, and that a pinned job is left to its queue"""
+    from business_idea_creator.utils.job_queue import JobQueue, JOB_DONE, JOB_QUEUED, JOB_RUNNING
+    import time
+    
+    def wait_for(queue, job_id, status):
+        for _ in range(100):
+            if queue.get(job_id)["status"] == status:
+                return
+            time.sleep(0.05)
+    
+    runs = []
+    
+    def slow(payload, context):
+        runs.append(context)
+        time.sleep(1.0)
+    
+    db_path = str(tmp_path / "jobs.db")
+    owner = JobQueue(db_path, num_workers=1, lease_seconds=0.3, poll_interval=0.05)
+    other = JobQueue(db_path, num_workers=1, lease_seconds=0.3, poll_interval=0.05)
+    owner.register("slow", slow)
+    other.register("slow", slow)
+    other.register("pinned", lambda payload, context: runs.append("pinned"))
+    
+    owner.start()
+    job_id = owner.enqueue("slow", {}, context="owner")
+    wait_for(owner, job_id, JOB_RUNNING)
+    other.start()
+    pinned_id = owner.enqueue("pinned", {}, pinned=True)
+    wait_for(owner, job_id, JOB_DONE)
+    assert runs == ["owner"] and other.get(pinned_id)["status"] == JOB_QUEUED
+    
+    owner.stop()
+    wait_for(other, pinned_id, JOB_DONE)
+    other.stop()
+    assert runs == ["owner", "pinned"]
+
+def test_jobs_without_session_context_fail_explicitly(tmp_path):
+    """Test that a job whose session generator is gone fails instead of returning mock ideas"""
+    from business_idea_creator.utils.job_queue import JobQueue, JOB_FAILED, register_generation_handlers
+    import time
+    
+    queue = JobQueue(str(tmp_path / "jobs.db"), num_workers=1, poll_interval=0.05, max_attempts=1)
+    register_generation_handlers(queue)
+    job_id = queue.enqueue("generate_ideas", {
+        "request": {"industry": "Energy", "target_audience": "Homeowners"}, "credentials": "session"
+    })
+    queue.start()
+    for _ in range(100):
+        if queue.get(job_id)["status"] == JOB_FAILED:
+            break
+        time.sleep(0.05)
+    queue.stop()
+    
+    job = queue.get(job_id)
+    assert job["status"] == JOB_FAILED and "generate again" in job["error"]
+
+def test_structured_jobs_report_streamed_ideas(tmp_path):
+    """Test that a queued structured generation reports its ideas as job progress while they stream in"""
+    import threading
+    import time
+    from types import SimpleNamespace
+    import pytest
+    pytest.importorskip("openai")
+    from business_idea_creator.idea_generator import BusinessIdeaGenerator
+    from business_idea_creator.utils.job_queue import JobQueue, JOB_DONE, register_generation_handlers
+    
+    first_idea_seen = threading.Event()
+    
+    def chunk(content):
+        return SimpleNamespace(choices=[SimpleNamespace(index=0, delta=SimpleNamespace(content=content))], usage=None)
+    
+    def stream(**params):
+        yield chunk('{"ideas": [{"name": "Solar Co-op"}')
+        # Hold the second idea back until the first one has been reported
+        first_idea_seen.wait(5)
+        yield chunk(', {"name": "Heat Pump Club"}]}')
+        yield SimpleNamespace(choices=[], usage=SimpleNamespace(prompt_tokens=10, completion_tokens=20, total_tokens=30))
+    
+    client = SimpleNamespace(base_url="stub", chat=SimpleNamespace(completions=SimpleNamespace(create=stream)))
+    client.with_options = lambda **options: client
+    generator = BusinessIdeaGenerator(api_key=None)
+    generator.client, generator.mock_mode = client, False
+    
+    queue = JobQueue(str(tmp_path / "jobs.db"), num_workers=1, poll_interval=0.05)
+    register_generation_handlers(queue)
+    job_id = queue.enqueue("generate_ideas", {
+        "request": {
+            "industry": "Energy", "target_audience": "Homeowners", "market_trends": ["Sustainability"],
+            "budget_range": "$10K - $50K", "geographical_focus": "Local", "innovation_level": "incremental"
+        },
+        "model": "gpt-3.5-turbo", "structured": True
+    }, context=generator)
+    queue.start()
+    for _ in range(100):
+        if (queue.get(job_id)["progress"] or {}).get("ideas"):
+            break
+        time.sleep(0.05)
+    assert queue.get(job_id)["progress"] == {"ideas": ["Solar Co-op"]}
+    first_idea_seen.set()
+    for _ in range(100):
+        if queue.get(job_id)["status"] == JOB_DONE:
+            break
+        time.sleep(0.05)
+    queue.stop()
+    
+    names = [idea["name"] for idea in queue.get(job_id)["result"]["generated_ideas"]]
+    assert names == ["Solar Co-op", "Heat Pump Club"]
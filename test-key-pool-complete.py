@@ -0,0 +1,32 @@
+# tests/test_key_pool.py
+"""
+API key pool tests for Business Idea Creator
+"""
+
+def test_key_pool_balances_and_quarantines_keys():
+    """Test that calls go to the key with the most headroom and quarantined keys are skipped"""
+    from business_idea_creator.utils.key_pool import KeyPool, KeyPoolExhaustedError
+    
+    pool = KeyPool(["sk-first-0000000001", "sk-second-000000002"], rpm=10, tpm=10_000)
+    picked = [pool.acquire(1000) for _ in range(4)]
+    keys = [ticket.key for ticket in picked]
+    assert keys.count("sk-first-0000000001") == 2 and keys.count("sk-second-000000002") == 2
+    
+    # Corrections replace the estimates they correct, rather than offsetting them for a minute
+    pool.record_tokens(picked[3], 400)
+    assert [entry[1] for entry in pool._keys[keys[3]].usage] == [1000, 400]
+    for ticket in picked + picked:
+        pool.record_tokens(ticket, 0)
+    assert [row["tokens"] for row in pool.utilization()] == [0, 400]
+    assert [pooled.tokens for pooled in pool._keys.values()] == [0, 400]
+    
+    pool.reject("sk-first-0000000001")
+    assert {pool.acquire(100).key for _ in range(3)} == {"sk-second-000000002"}
+    assert [row["reason"] for row in pool.utilization()] == ["rejected", ""]
+    
+    pool.exhaust("sk-second-000000002")
+    try:
+        pool.acquire(100)
+        assert False, "every key is quarantined"
+    except KeyPoolExhaustedError:
+        pass
@@ -0,0 +1,25 @@
+# tests/test_model_router.py
+"""
+Model routing tests for Business Idea Creator
+"""
+
+def test_model_router_meets_slo_and_skips_throttled_models():
+    """Test that the router prefers the best model meeting the SLO and routes around throttling"""
+    from business_idea_creator.utils.model_router import ModelRouter, completion_tokens_for
+    
+    router = ModelRouter(max_cost_usd=1.0)
+    max_tokens = completion_tokens_for(5)
+    # gpt-4 only meets a loose SLO; the cheaper, faster model is next in line
+    assert router.candidates(500, max_tokens, slo_seconds=120) == ["gpt-4", "gpt-3.5-turbo"]
+    assert router.candidates(500, max_tokens, slo_seconds=30)[0] == "gpt-3.5-turbo"
+    # Deadlines are derived from a full-length completion at the model's throughput
+    assert router.max_latency("gpt-4", max_tokens) > 60 and router.max_latency("unknown", max_tokens) is None
+    
+    # Observed calls update the prediction: a fast gpt-4 now meets the tight SLO
+    for _ in range(20):
+        router.record("gpt-4", 4.0, 400)
+    assert router.candidates(500, max_tokens, slo_seconds=30)[0] == "gpt-4"
+    
+    router.mark_throttled("gpt-4", retry_after=60)
+    assert router.candidates(500, max_tokens, preferred="gpt-4") == ["gpt-3.5-turbo"]
+    assert router.candidates(500, max_tokens, max_cost_usd=0.01) == ["gpt-3.5-turbo"]
@@ -0,0 +1,24 @@
+# tests/test_models.py
+"""
+Result model tests for Business Idea Creator
+"""
+
+def test_generation_result_model_round_trip():
+    """Test that compact result models convert losslessly and read like result dicts"""
+    import pickle
+    from business_idea_creator.models import GenerationResult
+    
+    results = {
+        "request_id": "req_1", "timestamp": "2024-01-01T12:00:00",
+        "input_parameters": {"industry": "Retail", "market_trends": ["AI Integration"], "technique_used": "few_shot_examples"},
+        "generated_ideas": [{"name": "Shelf Scanner", "problem": "Stock-outs",
+                             "duplicate_of": {"request_id": "req_0", "name": "Shelf Bot"}}],
+        "raw_response": "## Business Idea Shelf Scanner\n" * 50,
+        "model_used": "gpt-4", "technique_used": "few_shot_examples", "duplicates_found": 1
+    }
+    compact = GenerationResult.from_dict(results)
+    assert compact.to_dict() == results
+    assert pickle.loads(pickle.dumps(compact)).to_dict() == results
+    assert compact["generated_ideas"][0].get("problem") == "Stock-outs"
+    assert compact.get("input_parameters", {}).get("industry") == "Retail"
+    assert "revision" not in compact and isinstance(compact._raw, bytes)
@@ -0,0 +1,75 @@
+# tests/test_request_cache.py
+"""
+Request cache and cache warmer tests for Business Idea Creator
+"""
+
+def test_request_cache_serves_similar_requests():
+    """Test that near-identical requests are served from the similarity cache"""
+    from business_idea_creator.utils.request_cache import SimilarityRequestCache
+    
+    base = {"industry": "Retail", "target_audience": "Gen Z (18-24)", "budget_range": "$10K - $50K",
+            "geographical_focus": "Europe", "innovation_level": "disruptive",
+            "market_trends": ["AI Integration", "Sustainability", "E-commerce"]}
+    cache = SimilarityRequestCache()
+    cache.store(base, "chain_of_thought", "gpt-4", {"request_id": "req_1", "input_parameters": dict(base),
+                                                    "generated_ideas": [{"name": "Idea"}]})
+    
+    reordered = dict(base, market_trends=["E-commerce", "Sustainability", "AI Integration"])
+    served = cache.serve(reordered, "chain_of_thought", "gpt-4", "req_2")
+    assert served["request_id"] == "req_2"
+    assert served["cache_hit"]["request_id"] == "req_1" and served["cache_hit"]["similarity"] == 1.0
+    assert served["input_parameters"]["market_trends"] == base["market_trends"]
+    assert served["cache_hit"]["served_for"]["market_trends"] == reordered["market_trends"]
+    
+    assert cache.lookup(dict(base, market_trends=base["market_trends"] + ["Remote Work"]), "chain_of_thought", "gpt-4")
+    assert cache.lookup(dict(base, industry="Healthcare"), "chain_of_thought", "gpt-4") is None
+    assert cache.lookup(dict(base, budget_range="$1M+"), "chain_of_thought", "gpt-4") is None
+    assert cache.lookup(dict(base, geographical_focus="Asia"), "chain_of_thought", "gpt-4") is None
+    assert cache.lookup(base, "few_shot_examples", "gpt-4") is None
+
+def test_cache_warmer_loads_popular_requests(tmp_path):
+    """Test that the most requested combinations are loaded from history into the cache"""
+    from business_idea_creator.utils.history_store import HistoryStore
+    from business_idea_creator.utils.request_cache import SimilarityRequestCache
+    from business_idea_creator.utils.cache_warmer import CacheWarmer
+    
+    store = HistoryStore(str(tmp_path / "history.db"))
+    popular = {"industry": "Retail", "target_audience": "Students", "budget_range": "Under $10K",
+               "geographical_focus": "Global", "innovation_level": "incremental"}
+    for i, trends in enumerate([["AI Integration", "E-commerce"], ["E-commerce", "AI Integration"]]):
+        store.add_result({"request_id": f"req_{i}", "input_parameters": dict(popular, market_trends=trends),
+                          "technique_used": "chain_of_thought", "model_used": "gpt-4",
+                          "generated_ideas": [{"name": f"Idea {i}"}]})
+    store.add_result({"request_id": "req_other", "input_parameters": dict(popular, industry="Travel"),
+                      "technique_used": "chain_of_thought", "model_used": "gpt-4",
+                      "generated_ideas": [{"name": "Other"}]})
+    
+    top = store.request_frequencies(limit=1)
+    assert top[0]["requests"] == 2 and top[0]["latest_request_id"] in ("req_0", "req_1")
+    
+    cache = SimilarityRequestCache()
+    stats = CacheWarmer(store, cache, top_n=1).run()
+    assert stats["loaded"] == 1 and len(cache) == 1
+    assert cache.contains(dict(popular, market_trends=["AI Integration", "E-commerce"]), "chain_of_thought", "gpt-4")
+
+def test_auto_model_requests_are_served_from_warmed_cache(tmp_path):
+    """Test that an "auto" request hits results cached under the model it is routed to"""
+    from business_idea_creator.idea_generator import BusinessIdeaGenerator
+    from business_idea_creator.prompt_engine import BusinessIdeaRequest
+    from business_idea_creator.utils.history_store import HistoryStore
+    from business_idea_creator.utils.request_cache import SimilarityRequestCache
+    from business_idea_creator.utils.cache_warmer import CacheWarmer
+    from business_idea_creator.utils.model_router import AUTO_MODEL, ModelRouter
+    
+    params = {"industry": "Retail", "target_audience": "Students", "market_trends": ["E-commerce"],
+              "budget_range": "Under $10K", "geographical_focus": "Global", "innovation_level": "incremental"}
+    store = HistoryStore(str(tmp_path / "history.db"))
+    store.add_result({"request_id": "req_1", "input_parameters": params, "technique_used": "chain_of_thought",
+                      "model_used": "gpt-3.5-turbo", "generated_ideas": [{"name": "Campus Swap"}]})
+    cache = SimilarityRequestCache()
+    assert CacheWarmer(store, cache, top_n=1).run()["loaded"] == 1
+    
+    generator = BusinessIdeaGenerator("sk-test-not-a-real-key-0000", response_cache=cache, router=ModelRouter())
+    results = generator.generate_ideas(BusinessIdeaRequest(**params), "chain_of_thought", model=AUTO_MODEL)
+    assert results["cache_hit"]["request_id"] == "req_1"
+    assert results["generated_ideas"][0]["name"] == "Campus Swap"
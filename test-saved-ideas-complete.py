@@ -0,0 +1,30 @@
+# tests/test_saved_ideas.py
+"""
+Saved ideas tests for Business Idea Creator
+"""
+
+def test_saved_ideas_dedup(tmp_path):
+    """Test that saving the same idea twice keeps one copy, per owner"""
+    from business_idea_creator.utils.saved_ideas import SavedIdeasStore
+    
+    store = SavedIdeasStore(str(tmp_path / "saved.db"))
+    alice, bob = store.for_owner("alice"), store.for_owner("bob")
+    idea = {"name": "Green Grid", "problem": "Energy waste"}
+    key, created = alice.add(idea, industry="Energy")
+    assert created
+    assert alice.add({"name": "green  grid ", "problem": "Energy Waste"}, industry="Energy") == (key, False)
+    assert idea in alice and len(alice) == 1
+    assert [entry["idea"]["name"] for entry in alice.list(industry="Energy")] == ["Green Grid"]
+    assert idea not in bob and bob.list() == [] and bob.industries() == []
+    assert not bob.remove(key)
+    
+    assert alice.remove(key)
+    assert idea not in SavedIdeasStore(str(tmp_path / "saved.db")).for_owner("alice")
+    
+    # A removal by another process is seen, and anonymous sessions' ideas are purged once idle
+    assert alice.add(idea) == (key, True)
+    assert SavedIdeasStore(str(tmp_path / "saved.db")).remove(key, "alice")
+    assert alice.add(idea) == (key, True)
+    store.for_owner("session", ephemeral=True).add(idea)
+    assert store.purge_ephemeral(max_age=3600) == 0
+    assert store.purge_ephemeral(max_age=-1) == 1 and len(alice) == 1
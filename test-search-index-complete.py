@@ -0,0 +1,41 @@
+# tests/test_search_index.py
+"""
+History search tests for Business Idea Creator
+"""
+
+def test_search_index_ranks_and_filters(tmp_path):
+    """Test incremental BM25 search over stored ideas"""
+    from business_idea_creator.utils.history_store import HistoryStore
+    from business_idea_creator.utils.search_index import SearchIndex
+    
+    store = HistoryStore(str(tmp_path / "history.db"))
+    store.add_result({"request_id": "req_1", "timestamp": "2024-01-01T12:00:00",
+                      "input_parameters": {"industry": "Food & Beverage"}, "technique_used": "few_shot_examples",
+                      "generated_ideas": [{"name": "Meal Kit Club", "solution": "Weekly vegan meal kits"},
+                                          {"name": "Drone Delivery", "solution": "Deliver meal orders by drone"}]})
+    index = SearchIndex()
+    assert index.sync(store) == 2
+    
+    hits = index.search("meal kits")
+    assert [row["name"] for row in store.get_ideas([doc_id for doc_id, _ in hits])] == ["Meal Kit Club", "Drone Delivery"]
+    
+    store.add_result({"request_id": "req_2", "timestamp": "2024-02-01T12:00:00",
+                      "input_parameters": {"industry": "Travel"}, "generated_ideas": [{"name": "Meal Tours"}]})
+    assert index.sync(store) == 1
+    assert len(index.search("meal", industry="Travel")) == 1
+    assert len(index.search("meal", start="2024-01-15")) == 1
+    
+    # A regenerated idea replaces the document of the idea it replaced
+    store.replace_idea("req_1", 2, {"name": "Rooftop Gardens", "solution": "Grow herbs for restaurants"})
+    assert index.sync(store) == 1 and len(index) == 3
+    assert [row["name"] for row in store.get_ideas([doc_id for doc_id, _ in index.search("drone")])] == []
+    assert len(index.search("rooftop herbs")) == 1
+    
+    # Other owners' ideas are neither found nor returned
+    store.add_result({"request_id": "req_3", "input_parameters": {"industry": "Travel"},
+                      "generated_ideas": [{"name": "Meal Trains"}]}, owner="alice")
+    assert index.sync(store) == 1
+    alice_hits = [doc_id for doc_id, _ in index.search("meal", owner="alice")]
+    assert [row["name"] for row in store.get_ideas(alice_hits, owner="alice")] == ["Meal Trains"]
+    assert index.search("meal", owner="bob") == [] and store.get_ideas(alice_hits, owner="bob") == []
+    assert store.distinct_values("industry", owner="alice") == ["Travel"]
@@ -0,0 +1,22 @@
+# tests/test_session_store.py
+"""
+Session store tests for Business Idea Creator
+"""
+
+def test_session_store_round_trip(tmp_path):
+    """Test saving, restoring and expiring session snapshots"""
+    from business_idea_creator.utils.session_store import SessionStore, is_valid_session_id, new_session_id
+    
+    store = SessionStore(str(tmp_path / "sessions.db"))
+    session_id = new_session_id()
+    assert is_valid_session_id(session_id) and not is_valid_session_id("../etc")
+    
+    state = {"current_results": {"request_id": "req_1", "generated_ideas": [{"name": "Idea"}]},
+             "generation_history": [{"request_id": "req_1"}]}
+    store.save(session_id, state)
+    assert store.load(session_id) == state
+    assert store.load(new_session_id()) is None
+    
+    store.max_age = -1
+    assert store.load(session_id) is None
+    assert store.purge_expired() == 1
@@ -0,0 +1,17 @@
+# tests/test_stream_json.py
+"""
+Streamed JSON decoding tests for Business Idea Creator
+"""
+
+def test_item_stream_decoder_yields_ideas_as_they_close():
+    """Test that streamed JSON ideas are decoded as soon as each object is complete"""
+    from business_idea_creator.utils.stream_json import ItemStreamDecoder
+    
+    document = '{"ideas": [{"name": "Curly {brace} \\"Co\\"", "tags": [{"a": 1}]}, {"name": "Second"}]}'
+    decoder = ItemStreamDecoder()
+    names = []
+    for start in range(0, len(document), 7):
+        names.extend(item["name"] for item in decoder.feed(document[start:start + 7]))
+        if start < document.index("Second"):
+            assert len(names) <= 1
+    assert names == ['Curly {brace} "Co"', "Second"]
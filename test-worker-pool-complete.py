@@ -0,0 +1,24 @@
+# tests/test_worker_pool.py
+"""
+Worker pool tests for Business Idea Creator
+"""
+
+def test_worker_pool_runs_tasks_in_processes():
+    """Test the shared worker pool: results and the in-flight bound"""
+    import time
+    from business_idea_creator.utils.worker_pool import PoolBusyError, WorkerPool
+    
+    pool = WorkerPool(max_workers=1, max_pending=1)
+    try:
+        assert pool.run(sum, [1, 2, 3]) == 6
+        assert pool.run(bytes, 1 << 20) == bytes(1 << 20)
+        
+        pending = pool.submit(time.sleep, 0.5)
+        try:
+            pool.submit(sum, [1], timeout=0)
+            assert False, "expected PoolBusyError"
+        except PoolBusyError:
+            pass
+        pending.result()
+    finally:
+        pool.shutdown()
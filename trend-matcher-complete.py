@@ -0,0 +1,159 @@
+# src/business_idea_creator/utils/trend_matcher.py
+"""
+Trend catalog matcher for Business Idea Creator
+Maps free-form trend names (sidebar options, user text, idea text) onto catalog trends
+"""
+
+import re
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Canonical catalog trend -> alternative names users and the sidebar use for it
+DEFAULT_TREND_ALIASES = {
+    "AI Integration": ["Artificial Intelligence", "AI", "Machine Learning", "ML", "Generative AI", "AI Powered"],
+    "Sustainability": ["Sustainable", "Green", "ESG", "Climate Tech", "Eco Friendly", "Clean Energy", "Circular Economy"],
+    "Remote Work": ["Work From Home", "WFH", "Hybrid Work", "Distributed Teams", "Remote Teams"],
+    "E-commerce": ["Ecommerce", "Online Retail", "Online Shopping", "Online Store", "Social Commerce"],
+    "Digital Health": ["Telemedicine", "Telehealth", "Health Tech", "Healthtech", "mHealth"]
+}
+
+# Scores by how a query matched a catalog phrase
+EXACT_NAME_SCORE = 1.0
+EXACT_ALIAS_SCORE = 0.95
+CONTAINED_PHRASE_SCORE = 0.85
+TOKEN_OVERLAP_WEIGHT = 0.8
+MIN_MATCH_SCORE = 0.5
+
+STOPWORDS = frozenset(["a", "an", "and", "the", "of", "for", "in", "on", "to", "with", "based", "driven"])
+
+def normalize_phrase(text: str) -> str:
+    """Lowercase and collapse punctuation/whitespace to single spaces"""
+    return " ".join(re.findall(r"[a-z0-9]+", str(text).lower()))
+
+class _AhoCorasick:
+    """Multi-pattern automaton over token sequences: finds every pattern in a text in one pass"""
+
+    def __init__(self, patterns: Dict[Tuple[str, ...], Any]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Any]] = [[]]
+
+        for pattern, payload in patterns.items():
+            state = 0
+            for token in pattern:
+                next_state = self._goto[state].get(token)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][token] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = next_state
+            self._out[state].append(payload)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(token, 0)
+                self._out[next_state].extend(self._out[self._fail[next_state]])
+
+    def iter_matches(self, tokens: List[str]) -> Iterator[Tuple[int, Any]]:
+        """Yield (index of last token, payload) for every pattern occurrence"""
+        state = 0
+        for position, token in enumerate(tokens):
+            while state and token not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(token, 0)
+            for payload in self._out[state]:
+                yield position, payload
+
+class TrendMatcher:
+    def __init__(self, catalog: List[Dict[str, Any]], aliases: Optional[Dict[str, List[str]]] = None):
+        """Index a trend catalog (dicts with a "trend" name and optional "aliases")"""
+        self.catalog = catalog
+        aliases = DEFAULT_TREND_ALIASES if aliases is None else aliases
+
+        # normalized phrase -> (catalog index, exact-match score)
+        self._phrases: Dict[str, Tuple[int, float]] = {}
+        # token -> phrases containing it
+        self._token_index: Dict[str, List[str]] = {}
+
+        # Names first, so a trend's own name always beats another trend's alias for it
+        for index, trend_data in enumerate(catalog):
+            self._add_phrase(trend_data["trend"], index, EXACT_NAME_SCORE)
+        for index, trend_data in enumerate(catalog):
+            for alias in list(trend_data.get("aliases", [])) + list(aliases.get(trend_data["trend"], [])):
+                self._add_phrase(alias, index, EXACT_ALIAS_SCORE)
+
+        # Word-level automaton: matches fall on word boundaries and each step consumes a whole token
+        self._automaton = _AhoCorasick({tuple(phrase.split()): phrase for phrase in self._phrases})
+
+    def _add_phrase(self, phrase: str, index: int, score: float):
+        """Register a name or alias for a catalog trend (first registration wins)"""
+        normalized = normalize_phrase(phrase)
+        if not normalized or normalized in self._phrases:
+            return
+        self._phrases[normalized] = (index, score)
+        for token in set(normalized.split()) - STOPWORDS:
+            self._token_index.setdefault(token, []).append(normalized)
+
+    def match(self, query: str, min_score: float = MIN_MATCH_SCORE) -> List[Tuple[Dict[str, Any], float]]:
+        """Scored catalog matches for a query, best first"""
+        normalized = normalize_phrase(query)
+        if not normalized:
+            return []
+        scores: Dict[int, float] = {}
+
+        def consider(index: int, score: float):
+            if score > scores.get(index, 0.0):
+                scores[index] = score
+
+        exact = self._phrases.get(normalized)
+        if exact is not None:
+            consider(*exact)
+
+        # Catalog phrases contained in a longer query ("AI powered logistics")
+        for phrase in {phrase for _, phrase in self._automaton.iter_matches(normalized.split())}:
+            if phrase != normalized:
+                consider(self._phrases[phrase][0], CONTAINED_PHRASE_SCORE * self._phrases[phrase][1])
+
+        # Partial token overlap (Dice coefficient)
+        query_tokens = set(normalized.split()) - STOPWORDS
+        candidates = {phrase for token in query_tokens for phrase in self._token_index.get(token, ())}
+        for phrase in candidates:
+            phrase_tokens = set(phrase.split()) - STOPWORDS
+            overlap = len(query_tokens & phrase_tokens)
+            dice = 2.0 * overlap / (len(query_tokens) + len(phrase_tokens))
+            consider(self._phrases[phrase][0], TOKEN_OVERLAP_WEIGHT * dice * self._phrases[phrase][1])
+
+        matches = [(self.catalog[index], round(score, 3)) for index, score in scores.items() if score >= min_score]
+        matches.sort(key=lambda match: match[1], reverse=True)
+        return matches
+
+    def best_match(self, query: str, min_score: float = MIN_MATCH_SCORE) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Highest scoring catalog match, or None"""
+        matches = self.match(query, min_score)
+        return matches[0] if matches else None
+
+    def find_in_text(self, text: str) -> Dict[str, int]:
+        """Count mentions of each catalog trend (by name or alias) in free text"""
+        # Keep leftmost-longest matches so "AI powered" is not also counted as "AI"
+        spans = sorted(
+            ((last - phrase.count(" "), last + 1, phrase)
+             for last, phrase in self._automaton.iter_matches(normalize_phrase(text).split())),
+            key=lambda span: (span[0], span[0] - span[1])
+        )
+        counts: Dict[str, int] = {}
+        last_end = -1
+        for start, end, phrase in spans:
+            if start < last_end:
+                continue
+            last_end = end
+            name = self.catalog[self._phrases[phrase][0]]["trend"]
+            counts[name] = counts.get(name, 0) + 1
+        return counts
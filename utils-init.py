@@ -6,8 +6,13 @@ Utility modules for Business Idea Creator
 try:
     from .validators import InputValidator
     from .data_processing import DataProcessor
+    from .job_queue import JobQueue
+    from .history_store import HistoryStore
+    from .saved_ideas import SavedIdeasStore
+    from .request_cache import SimilarityRequestCache
     
-    __all__ = ['InputValidator', 'DataProcessor']
+    __all__ = ['InputValidator', 'DataProcessor', 'JobQueue', 'HistoryStore', 'SavedIdeasStore',
+               'SimilarityRequestCache']
 except ImportError:
     # Allow imports to fail during development
     pass
\ No newline at end of file
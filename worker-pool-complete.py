@@ -0,0 +1,91 @@
+# src/business_idea_creator/utils/worker_pool.py
+"""
+Shared worker process pool for Business Idea Creator
+One process pool per app process for CPU-bound work (reports, exports, parsing, scoring),
+with a bound on in-flight tasks
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+class PoolBusyError(RuntimeError):
+    """Raised when no task slot frees up within the submit timeout"""
+
+class WorkerPool:
+    def __init__(self, max_workers: Optional[int] = None, max_pending: Optional[int] = None):
+        """Process pool with max_workers processes (default: one per core) and at most
+        max_pending submitted, unfinished tasks (default: four per worker)"""
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 4 * self.max_workers
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._lock = threading.Lock()
+        self.executor = self._create_executor()
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        """New process pool (spawn: forking a multi-threaded Streamlit server is unsafe)"""
+        return ProcessPoolExecutor(max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def _submit_to_executor(self, fn: Callable, args: tuple) -> Future:
+        """Submit to the executor, replacing it once if a worker died and broke it"""
+        executor = self.executor
+        try:
+            return executor.submit(fn, *args)
+        except BrokenProcessPool:
+            with self._lock:
+                if self.executor is executor:
+                    logger.warning("Worker process pool was broken; restarting it")
+                    self.executor = self._create_executor()
+            return self.executor.submit(fn, *args)
+
+    def submit(self, fn: Callable, *args, timeout: Optional[float] = None) -> Future:
+        """Run fn(*args) in a worker process; fn and args must be picklable
+
+        Waits up to timeout seconds (forever if None) for a free task slot, then raises
+        PoolBusyError.
+        """
+        if not self._slots.acquire(timeout=timeout):
+            raise PoolBusyError(f"Worker pool busy ({self.max_pending} tasks in flight)")
+        try:
+            inner = self._submit_to_executor(fn, args)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        outer: Future = Future()
+
+        def done(finished: Future):
+            self._slots.release()
+            try:
+                outer.set_result(finished.result())
+            except BaseException as e:
+                outer.set_exception(e)
+
+        inner.add_done_callback(done)
+        return outer
+
+    def run(self, fn: Callable, *args, timeout: Optional[float] = None) -> Any:
+        """Run fn(*args) in a worker process and wait for the result"""
+        return self.submit(fn, *args, timeout=timeout).result()
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker processes"""
+        self.executor.shutdown(wait=wait, cancel_futures=True)
+
+_POOL: Optional[WorkerPool] = None
+_POOL_LOCK = threading.Lock()
+
+def get_worker_pool(max_workers: Optional[int] = None) -> WorkerPool:
+    """Process-wide worker pool (max_workers defaults to BUSINESS_IDEA_POOL_WORKERS, else the core count)"""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            max_workers = max_workers or int(os.getenv("BUSINESS_IDEA_POOL_WORKERS", "0")) or None
+            _POOL = WorkerPool(max_workers=max_workers)
+        return _POOL